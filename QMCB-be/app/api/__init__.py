@@ -1,5 +1,7 @@
 from flask_restx import Api
 from app.api.simulate import simulate_ns
+from app.api.metrics import metrics_ns
+from app.api.health import health_ns
 
 api = Api(
     title="Quantum Circuit Builder API",
@@ -11,3 +13,9 @@ api = Api(
 
 # Add the simulate namespace
 api.add_namespace(simulate_ns, path="/simulate")
+
+# Add the metrics namespace
+api.add_namespace(metrics_ns, path="/metrics")
+
+# Add the health namespace
+api.add_namespace(health_ns, path="/health")
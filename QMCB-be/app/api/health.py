@@ -0,0 +1,20 @@
+import sys
+from flask_restx import Namespace, Resource
+from app.dto.response_dto import ResponseDTO
+from app.utils.response_builder import ResponseBuilder
+
+
+health_ns = Namespace("health", description="Liveness checks for load balancers.")
+
+
+@health_ns.route("")
+class Health(Resource):
+    def get(self):  # type: ignore
+        """
+        Reports that the service is up. Never imports or runs the simulator, so
+        it answers immediately on a cold worker.
+        """
+        return ResponseBuilder.success(
+            "Service is healthy",
+            data=ResponseDTO(simulator_loaded="cirq" in sys.modules),
+        )
@@ -0,0 +1,19 @@
+from flask_restx import Namespace, Resource
+from flask import Response
+from app.utils.metrics import REGISTRY
+
+
+metrics_ns = Namespace(
+    "metrics", description="Operational metrics in Prometheus text format."
+)
+
+
+@metrics_ns.route("")
+class Metrics(Resource):
+    def get(self):  # type: ignore
+        """
+        Returns stage latency histograms and request counters.
+        """
+        return Response(
+            REGISTRY.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+        )
@@ -1,17 +1,62 @@
 from flask_restx import Namespace, Resource
-from flask import request
+from flask import Response, request, jsonify, make_response, stream_with_context
 from app.settings import Config
-from app.controllers.simulate import simulate_unitaries
+from app.controllers.simulate import (
+    check_unitaries,
+    estimate_cost,
+    selection_error,
+    simulate_batch,
+    simulate_states,
+    simulate_unitaries,
+    stream_unitaries,
+)
+from app.utils.constants import (
+    HttpStatus,
+    JobStatus,
+    MimeType,
+    PipelineStage,
+    SimulationEngine,
+    SimulationMode,
+)
+from app.utils.metrics import (
+    ADMISSION_TOTAL,
+    ESTIMATED_COST,
+    PROFILES_TOTAL,
+    REQUEST_SECONDS,
+    REQUESTS_TOTAL,
+    RESULT_CACHE_TOTAL,
+    bind_request_labels,
+    request_labels,
+    time_stage,
+)
+from app.utils.profiling import profile_request, profile_trigger
 from app.utils.response_builder import ResponseBuilder
+from app.utils.state_encoding import encode_states
+from app.utils.validation import validate_unitary_info
 from app.dto.response_dto import ResponseDTO
 from app.dto.unitary import UnitaryDTO
+from app.services.circuit_optimizer import CircuitOptimizer
+from app.services.cost_model import CostEstimate
+from app.services.job_queue import JobQueue
+from app.services.profile_store import ProfileStore
+from app.services.result_cache import ResultCache
+from typing import Any, Callable, Iterator, Optional
+import json
 import logging
+import time
 
 
 simulate_ns = Namespace(
     "simulate", description="Quantum circuit simulation related operations."
 )
 logger = logging.getLogger(__name__)
+result_cache = ResultCache(Config.RESULT_CACHE_MAXSIZE, Config.RESULT_CACHE_TTL)
+job_queue = JobQueue(
+    Config.ASYNC_JOB_WORKERS, Config.ASYNC_JOB_MAX_STORED, Config.ASYNC_JOB_TTL
+)
+profile_store = ProfileStore(
+    Config.PROFILE_MAX_STORED, Config.PROFILE_TTL, Config.PROFILE_DIR
+)
 
 
 @simulate_ns.route("")
@@ -20,26 +65,173 @@ class Simulate(Resource):
         """
         Simulates trial unitary and returns truth table.
         """
+        start = time.perf_counter()
+        bind_request_labels()
+
+        trigger = profile_trigger(
+            request.headers.get(Config.PROFILE_HEADER),
+            enabled=Config.PROFILING_ENABLED,
+            sample_rate=Config.PROFILE_SAMPLE_RATE,
+        )
+        if trigger is None:
+            response = self._simulate()
+        else:
+            response = _profiled(self._simulate, trigger, "simulate")
+
+        REQUEST_SECONDS.observe(
+            time.perf_counter() - start, endpoint="simulate", **request_labels()
+        )
+        REQUESTS_TOTAL.inc(
+            endpoint="simulate", status=response.status_code, **request_labels()
+        )
+
+        return response
+
+    def _simulate(self):  # type: ignore
+        unitary_info = None
+
         try:
-            unitary_info = request.get_json()
-            logger.info(f"Trying to simulate trial unitary: {unitary_info}")
+            with time_stage(PipelineStage.PARSE.value):
+                unitary_info = request.get_json(silent=True)
+                if unitary_info is None:
+                    return ResponseBuilder.fail("Request body must be valid JSON")
 
-            if not unitary_info:
-                return ResponseBuilder.error("No JSON body provided", 400)
+                logger.info(f"Trying to simulate trial unitary: {unitary_info}")
+
+                if not unitary_info:
+                    return ResponseBuilder.fail("No JSON body provided")
+
+                errors = _validate(unitary_info)
+                if errors:
+                    return ResponseBuilder.fail(
+                        "Invalid simulate request", data=ResponseDTO(errors=errors)
+                    )
+
+                logger.info("Processing unitary info into trial and target DTOs")
+                trial_dto, target_name = _parse_unitary_info(unitary_info)
+
+            bind_request_labels(trial_dto.number_of_qubits, target_name)
+            trial_dto = _optimize(trial_dto)
+
+            # Check, streaming and binary modes always evaluate full state vectors
+            dense = (
+                _wants_stream()
+                or _wants_states()
+                or _requested_mode(unitary_info) == SimulationMode.CHECK.value
+            )
+            inputs = outputs = None
+            if not dense:
+                try:
+                    inputs = _parse_basis_states(unitary_info, "inputs", trial_dto)
+                    outputs = _parse_basis_states(unitary_info, "outputs", trial_dto)
+                except ValueError as e:
+                    return ResponseBuilder.fail(str(e))
+
+                error = selection_error(trial_dto, inputs, outputs, **_engine_options())
+                if error is not None:
+                    return ResponseBuilder.fail(error)
+
+            estimate, rejection = _admit(
+                trial_dto,
+                "simulate",
+                Config.MAX_SIMULATION_COST,
+                dense=dense,
+                inputs=inputs,
+                outputs=outputs,
+                **_engine_options(),
+            )
+            if rejection is not None:
+                return ResponseBuilder.fail(
+                    rejection,
+                    data=ResponseDTO(cost=estimate.to_dict()),
+                    status_code=HttpStatus.UNPROCESSABLE_ENTITY.value,
+                )
+
+            # Streaming mode: Accept: application/x-ndjson or ?stream=true
+            if _wants_stream():
+                rows = stream_unitaries(
+                    trial_dto,
+                    target_name,
+                    Config.VALIDATE_TARGET_CIRCUITS,
+                    decimals=Config.TRUTH_TABLE_DECIMALS,
+                    backend=Config.SIMULATION_BACKEND,
+                    chunk_size=Config.STREAM_CHUNK_SIZE,
+                )
+                return Response(
+                    stream_with_context(_ndjson(rows)), mimetype=MimeType.NDJSON.value
+                )
 
-            logger.info("Processing unitary info into trial and target DTOs")
-            trial_dto = UnitaryDTO(
-                unitary_info["number_of_qubits"],
-                unitary_info["gates"],
-                unitary_info["qubit_order"],
+            # Binary mode: Accept: application/vnd.qmcb.states
+            if _wants_states():
+                cache_key, payload = _cache_lookup(
+                    trial_dto, target_name, encoding=MimeType.STATES.value
+                )
+
+                if payload is None:
+                    trial_states, target_states = simulate_states(
+                        trial_dto,
+                        target_name,
+                        backend=Config.SIMULATION_BACKEND,
+                        use_target_cache=Config.CACHE_TARGET_UNITARIES,
+                    )
+                    with time_stage(PipelineStage.SERIALIZE.value):
+                        payload = encode_states(
+                            trial_states, target_states, dtype=Config.STATE_BUFFER_DTYPE
+                        )
+                    if cache_key is not None:
+                        result_cache.set(cache_key, payload)
+
+                return Response(payload, mimetype=MimeType.STATES.value)
+
+            # Check mode: ?mode=check or "mode": "check" in the body
+            if _requested_mode(unitary_info) == SimulationMode.CHECK.value:
+                cache_key, cached_response = _cache_lookup(
+                    trial_dto, target_name, mode=SimulationMode.CHECK.value
+                )
+
+                if cached_response is None:
+                    cached_response = check_unitaries(
+                        trial_dto,
+                        target_name,
+                        tolerance=Config.CHECK_TOLERANCE,
+                        chunk_size=Config.CHECK_CHUNK_SIZE,
+                        backend=Config.SIMULATION_BACKEND,
+                        use_target_cache=Config.CACHE_TARGET_UNITARIES,
+                    )
+                    if cache_key is not None:
+                        result_cache.set(cache_key, cached_response)
+
+                return _serialize(
+                    *_with_gate_count(cached_response, unitary_info, trial_dto)
+                )
+
+            cache_key, cached_response = _cache_lookup(
+                trial_dto, target_name, inputs=inputs, outputs=outputs
             )
-            target_name = unitary_info["target_unitary"]
+
+            if cached_response is not None:
+                logger.info("Serving simulation from result cache")
+                return _serialize(
+                    *_with_gate_count(cached_response, unitary_info, trial_dto)
+                )
 
             response = simulate_unitaries(
-                trial_dto, target_name, Config.VALIDATE_TARGET_CIRCUITS
+                trial_dto,
+                target_name,
+                Config.VALIDATE_TARGET_CIRCUITS,
+                Config.SINGLE_PASS_UNITARY,
+                decimals=Config.TRUTH_TABLE_DECIMALS,
+                backend=Config.SIMULATION_BACKEND,
+                use_target_cache=Config.CACHE_TARGET_UNITARIES,
+                inputs=inputs,
+                outputs=outputs,
+                **_engine_options(),
             )
 
-            return response
+            if cache_key is not None:
+                result_cache.set(cache_key, response)
+
+            return _serialize(*_with_gate_count(response, unitary_info, trial_dto))
 
         except Exception as e:
             return ResponseBuilder.error(
@@ -49,3 +241,606 @@ class Simulate(Resource):
                 ),
                 data=ResponseDTO(error=str(e)),
             )
+
+
+@simulate_ns.route("/batch")
+class BatchSimulate(Resource):
+    def post(self):  # type: ignore
+        """
+        Simulates a list of trial unitaries and returns per-item truth tables.
+        """
+        start = time.perf_counter()
+        bind_request_labels()
+        response = self._simulate_batch()
+
+        REQUEST_SECONDS.observe(time.perf_counter() - start, endpoint="batch")
+        REQUESTS_TOTAL.inc(endpoint="batch", status=response.status_code)
+
+        return response
+
+    def _simulate_batch(self):  # type: ignore
+        try:
+            with time_stage(PipelineStage.PARSE.value):
+                batch_info = request.get_json(silent=True)
+                if batch_info is None:
+                    return ResponseBuilder.fail("Request body must be valid JSON")
+
+                items = (
+                    batch_info.get("items")
+                    if isinstance(batch_info, dict)
+                    else batch_info
+                )
+
+                if not isinstance(items, list) or not items:
+                    return ResponseBuilder.fail(
+                        "Batch body must be a non-empty list of circuits"
+                    )
+
+                if len(items) > Config.BATCH_MAX_ITEMS:
+                    return ResponseBuilder.fail(
+                        f"Batch exceeds the limit of {Config.BATCH_MAX_ITEMS} circuits"
+                    )
+
+                logger.info(f"Trying to simulate batch of {len(items)} circuits")
+
+                results: list = [None] * len(items)
+                pending: list = []
+
+                for index, item in enumerate(items):
+                    errors = _validate(item)
+                    if errors:
+                        results[index] = _batch_result(
+                            {"message": "Invalid circuit definition", "errors": errors},
+                            400,
+                        )
+                        continue
+
+                    try:
+                        trial_dto, target_name = _parse_unitary_info(item)
+                    except (KeyError, TypeError, AttributeError) as e:
+                        results[index] = _batch_result(
+                            {"message": "Invalid circuit definition", "error": str(e)},
+                            400,
+                        )
+                        continue
+
+                    trial_dto = _optimize(trial_dto)
+                    try:
+                        inputs = _parse_basis_states(item, "inputs", trial_dto)
+                        outputs = _parse_basis_states(item, "outputs", trial_dto)
+                    except ValueError as e:
+                        results[index] = _batch_result(
+                            {"message": "Invalid circuit definition", "error": str(e)},
+                            400,
+                        )
+                        continue
+
+                    error = selection_error(
+                        trial_dto, inputs, outputs, **_engine_options()
+                    )
+                    if error is not None:
+                        results[index] = _batch_result(
+                            {"message": "Invalid circuit definition", "error": error},
+                            400,
+                        )
+                        continue
+
+                    # Priced on the engine simulate_batch will run the item on
+                    estimate, rejection = _admit(
+                        trial_dto,
+                        "batch",
+                        Config.MAX_SIMULATION_COST,
+                        inputs=inputs,
+                        outputs=outputs,
+                        **_engine_options(),
+                    )
+                    if rejection is not None:
+                        results[index] = _batch_result(
+                            {"message": rejection, "cost": estimate.to_dict()},
+                            HttpStatus.UNPROCESSABLE_ENTITY.value,
+                        )
+                        continue
+
+                    cache_key, cached_response = _cache_lookup(
+                        trial_dto, target_name, inputs=inputs, outputs=outputs
+                    )
+
+                    if cached_response is not None:
+                        results[index] = _batch_result(
+                            *_with_gate_count(cached_response, item, trial_dto)
+                        )
+                    else:
+                        pending.append(
+                            (index, cache_key, trial_dto, target_name, inputs, outputs)
+                        )
+
+            simulated = simulate_batch(
+                [
+                    (trial_dto, target_name)
+                    for _, _, trial_dto, target_name, *_ in pending
+                ],
+                Config.VALIDATE_TARGET_CIRCUITS,
+                Config.SINGLE_PASS_UNITARY,
+                decimals=Config.TRUTH_TABLE_DECIMALS,
+                backend=Config.SIMULATION_BACKEND,
+                use_target_cache=Config.CACHE_TARGET_UNITARIES,
+                selections=[(inputs, outputs) for *_, inputs, outputs in pending],
+                **_engine_options(),
+            )
+
+            for (index, cache_key, trial_dto, *_), response in zip(pending, simulated):
+                if cache_key is not None and response[1] == 200:
+                    result_cache.set(cache_key, response)
+                results[index] = _batch_result(
+                    *_with_gate_count(response, items[index], trial_dto)
+                )
+
+            return _serialize(
+                {
+                    "message": f"Simulated batch of {len(items)} circuits.",
+                    "results": results,
+                },
+                200,
+            )
+
+        except Exception as e:
+            return ResponseBuilder.error(
+                message="Unexpected error occured when simulating batch",
+                data=ResponseDTO(error=str(e)),
+            )
+
+
+@simulate_ns.route("/jobs")
+class SimulationJobs(Resource):
+    def post(self):  # type: ignore
+        """
+        Submits a circuit for simulation. Large circuits run on a worker pool and
+        return a job id to poll; small ones are simulated right away.
+        """
+        unitary_info = None
+
+        try:
+            unitary_info = request.get_json(silent=True)
+            if unitary_info is None:
+                return ResponseBuilder.fail("Request body must be valid JSON")
+
+            if not unitary_info:
+                return ResponseBuilder.fail("No JSON body provided")
+
+            errors = _validate(unitary_info)
+            if errors:
+                return ResponseBuilder.fail(
+                    "Invalid simulate request", data=ResponseDTO(errors=errors)
+                )
+
+            trial_dto, target_name = _parse_unitary_info(unitary_info)
+            bind_request_labels(trial_dto.number_of_qubits, target_name)
+            trial_dto = _optimize(trial_dto)
+            try:
+                inputs = _parse_basis_states(unitary_info, "inputs", trial_dto)
+                outputs = _parse_basis_states(unitary_info, "outputs", trial_dto)
+            except ValueError as e:
+                return ResponseBuilder.fail(str(e))
+
+            error = selection_error(trial_dto, inputs, outputs, **_engine_options())
+            if error is not None:
+                return ResponseBuilder.fail(error)
+
+            estimate, rejection = _admit(
+                trial_dto,
+                "jobs",
+                Config.ASYNC_JOB_MAX_COST,
+                inputs=inputs,
+                outputs=outputs,
+                **_engine_options(),
+            )
+            if rejection is not None:
+                return ResponseBuilder.fail(
+                    rejection,
+                    data=ResponseDTO(cost=estimate.to_dict()),
+                    status_code=HttpStatus.UNPROCESSABLE_ENTITY.value,
+                )
+
+            cache_key, cached_response = _cache_lookup(
+                trial_dto, target_name, inputs=inputs, outputs=outputs
+            )
+            simulate_args = (
+                trial_dto,
+                target_name,
+                Config.VALIDATE_TARGET_CIRCUITS,
+                Config.SINGLE_PASS_UNITARY,
+            )
+            simulate_kwargs = {
+                "decimals": Config.TRUTH_TABLE_DECIMALS,
+                "backend": Config.SIMULATION_BACKEND,
+                "use_target_cache": Config.CACHE_TARGET_UNITARIES,
+                "inputs": inputs,
+                "outputs": outputs,
+                **_engine_options(),
+            }
+
+            # Synchronous fast path: cached or small circuits
+            if cached_response is not None or not _is_expensive(trial_dto, estimate):
+                response = cached_response or simulate_unitaries(
+                    *simulate_args, **simulate_kwargs
+                )
+                if cache_key is not None and cached_response is None:
+                    result_cache.set(cache_key, response)
+
+                job_id = job_queue.complete(response)
+                return _serialize(
+                    {
+                        "job_id": job_id,
+                        "status": JobStatus.DONE.value,
+                        "result": response[0],
+                    },
+                    HttpStatus.SUCCESS.value,
+                )
+
+            job_id = job_queue.submit(
+                simulate_unitaries,
+                *simulate_args,
+                on_done=_cache_setter(cache_key),
+                **simulate_kwargs,
+            )
+            logger.info(f"Queued simulation job {job_id}")
+
+            response = _serialize(
+                {"job_id": job_id, "status": JobStatus.PENDING.value},
+                HttpStatus.ACCEPTED.value,
+            )
+            response.headers["Location"] = f"{request.path.rstrip('/')}/{job_id}"
+            return response
+
+        except Exception as e:
+            return ResponseBuilder.error(
+                message=(
+                    f"Unexpected error occured when submitting circuit,"
+                    f" Unitary Info: {unitary_info}"
+                ),
+                data=ResponseDTO(error=str(e)),
+            )
+
+
+@simulate_ns.route("/jobs/<string:job_id>")
+class SimulationJob(Resource):
+    def get(self, job_id: str):  # type: ignore
+        """
+        Returns the status of a simulation job and its result once done.
+        """
+        job = job_queue.status(job_id)
+
+        if job is None:
+            return ResponseBuilder.fail(
+                f"Unknown or expired job: {job_id}",
+                status_code=HttpStatus.NOT_FOUND.value,
+            )
+
+        # Finished jobs hold the controller's (body, status) pair
+        if "result" in job:
+            job["result"] = job["result"][0]
+
+        return _serialize({"job_id": job_id, **job}, HttpStatus.SUCCESS.value)
+
+
+@simulate_ns.route("/profiles")
+class SimulationProfiles(Resource):
+    def get(self):  # type: ignore
+        """
+        Lists the most recent request profiles, newest first.
+        """
+        if not Config.PROFILING_ENABLED:
+            return ResponseBuilder.fail(
+                "Profiling is disabled", status_code=HttpStatus.NOT_FOUND.value
+            )
+
+        limit = request.args.get("limit", 50, type=int)
+        return _serialize(
+            {"profiles": profile_store.recent(limit)}, HttpStatus.SUCCESS.value
+        )
+
+
+@simulate_ns.route("/profiles/<string:profile_id>")
+class SimulationProfile(Resource):
+    def get(self, profile_id: str):  # type: ignore
+        """
+        Returns one request profile: its top frames by cumulative time and the
+        frames matching PROFILE_FOCUS.
+        """
+        profile = profile_store.get(profile_id) if Config.PROFILING_ENABLED else None
+
+        if profile is None:
+            return ResponseBuilder.fail(
+                f"Unknown or expired profile: {profile_id}",
+                status_code=HttpStatus.NOT_FOUND.value,
+            )
+
+        return _serialize(profile, HttpStatus.SUCCESS.value)
+
+
+def _profiled(simulate: Callable[[], Any], trigger: str, endpoint: str):  # type: ignore
+    """
+    Serve a request under the profiler and store its summary, returning the
+    profile id in the <PROFILE_HEADER>-Id response header. Streamed bodies are
+    produced after this returns, so only their setup is profiled.
+    """
+    with profile_request(
+        top_n=Config.PROFILE_TOP_N, focus=Config.PROFILE_FOCUS
+    ) as profile:
+        response = simulate()
+
+    if profile.summary is None:
+        logger.info("Skipping profile: another request is being profiled")
+        PROFILES_TOTAL.inc(trigger=trigger, outcome="busy")
+        return response
+
+    profile_id = profile_store.add(
+        profile.summary,
+        profile.profiler,
+        endpoint=endpoint,
+        trigger=trigger,
+        status=response.status_code,
+        **request_labels(),
+    )
+    PROFILES_TOTAL.inc(trigger=trigger, outcome="recorded")
+    logger.info(f"Stored {trigger} profile {profile_id}")
+
+    response.headers[f"{Config.PROFILE_HEADER}-Id"] = profile_id
+    return response
+
+
+def _is_expensive(trial_dto: UnitaryDTO, estimate: CostEstimate) -> bool:
+    """
+    Decide whether a circuit is large enough to leave the synchronous path.
+    Anything over the synchronous cost budget always runs as a job.
+    """
+    return (
+        trial_dto.number_of_qubits >= Config.ASYNC_JOB_MIN_QUBITS
+        or len(trial_dto.gates) >= Config.ASYNC_JOB_MIN_GATES
+        or estimate.operations > Config.MAX_SIMULATION_COST
+    )
+
+
+def _cache_setter(cache_key: Optional[str]):  # type: ignore
+    """
+    Build a job completion callback that stores successful results in the
+    result cache.
+    """
+
+    def store(response: tuple) -> None:
+        if cache_key is not None and response[1] == HttpStatus.SUCCESS.value:
+            result_cache.set(cache_key, response)
+
+    return store
+
+
+def _wants_stream() -> bool:
+    """
+    Whether the client asked for newline-delimited JSON rows.
+    """
+    if request.args.get("stream", "").lower() in ("1", "true"):
+        return True
+
+    best = request.accept_mimetypes.best_match(
+        [MimeType.JSON.value, MimeType.NDJSON.value]
+    )
+    return best == MimeType.NDJSON.value
+
+
+def _wants_states() -> bool:
+    """
+    Whether the client prefers the binary output-state encoding over JSON.
+    """
+    best = request.accept_mimetypes.best_match(
+        [MimeType.JSON.value, MimeType.STATES.value]
+    )
+    return best == MimeType.STATES.value
+
+
+def _ndjson(rows: Iterator[dict[str, Any]]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(row) + "\n"
+
+
+def _requested_mode(unitary_info: dict) -> str:
+    """
+    Return the simulation mode from the query string or the request body.
+    """
+    mode = request.args.get("mode") or unitary_info.get("mode")
+    return str(mode or SimulationMode.TABLE.value).lower()
+
+
+def _parse_unitary_info(unitary_info: dict) -> tuple[UnitaryDTO, str]:
+    """
+    Build the trial DTO and target name from a request body.
+    """
+    trial_dto = UnitaryDTO(
+        unitary_info["number_of_qubits"],
+        unitary_info["gates"],
+        unitary_info["qubit_order"],
+    )
+    return trial_dto, unitary_info["target_unitary"]
+
+
+def _parse_basis_states(
+    unitary_info: dict, field: str, trial_dto: UnitaryDTO
+) -> Optional[list[int]]:
+    """
+    Return the basis-state indices given by an optional list of bit strings
+    (qubit 0 first, e.g. "0101") under a request field, or None if absent.
+    Used for "inputs" (truth-table rows) and "outputs" (MPS amplitudes).
+    """
+    selected = unitary_info.get(field)
+    if selected is None:
+        return None
+
+    number_of_qubits = trial_dto.number_of_qubits
+    indices = []
+    for bits in selected:
+        bits = str(bits)
+        if len(bits) != number_of_qubits or set(bits) - {"0", "1"}:
+            raise ValueError(
+                f"Invalid {field} entry {bits!r}: expected {number_of_qubits} "
+                f"bits of 0/1"
+            )
+        indices.append(int(bits, 2))
+
+    return indices
+
+
+def _engine_options() -> dict[str, Any]:
+    """
+    Simulation-engine settings (permutation, stabilizer and MPS paths) passed
+    through to simulate_unitaries.
+    """
+    return {
+        "permutation_fast_path": Config.PERMUTATION_FAST_PATH,
+        "stabilizer_min_qubits": Config.STABILIZER_MIN_QUBITS or None,
+        "max_rows": Config.TRUTH_TABLE_MAX_ROWS,
+        "stabilizer_max_terms": Config.STABILIZER_MAX_TERMS,
+        "mps_min_qubits": Config.MPS_MIN_QUBITS or None,
+        "mps_max_bond": Config.MPS_MAX_BOND,
+    }
+
+
+def _validate(unitary_info: Any) -> list[str]:
+    """
+    Schema-check a circuit definition against the configured size limits.
+    """
+    return validate_unitary_info(
+        unitary_info, max_qubits=Config.MAX_QUBITS, max_gates=Config.MAX_GATES
+    )
+
+
+def _admit(
+    trial_dto: UnitaryDTO,
+    endpoint: str,
+    max_cost: float,
+    *,
+    dense: bool = False,
+    inputs: Optional[list[int]] = None,
+    outputs: Optional[list[int]] = None,
+    **engine_options: Any,
+) -> tuple[CostEstimate, Optional[str]]:
+    """
+    Estimate what simulating a circuit would cost and record the estimate.
+    Returns the estimate and, when it is over the cost or memory budget, the
+    reason the request is rejected (None when admitted).
+    """
+    estimate = estimate_cost(
+        trial_dto,
+        Config.SINGLE_PASS_UNITARY,
+        inputs,
+        outputs,
+        dense,
+        **engine_options,
+    )
+    max_memory = Config.MAX_SIMULATION_MEMORY_MB * 2**20
+
+    rejection = None
+    if estimate.operations > max_cost:
+        rejection = (
+            f"Circuit is too expensive to simulate: an estimated "
+            f"{estimate.operations:.3g} amplitude updates on the {estimate.engine} "
+            f"engine exceeds the budget of {max_cost:.3g}"
+        )
+    elif estimate.memory_bytes > max_memory:
+        rejection = (
+            f"Circuit needs too much memory to simulate: an estimated "
+            f"{estimate.memory_bytes / 2**20:.0f} MB on the {estimate.engine} "
+            f"engine exceeds the limit of {Config.MAX_SIMULATION_MEMORY_MB} MB"
+        )
+
+    if rejection is not None:
+        if (
+            endpoint != "jobs"
+            and estimate.operations <= Config.ASYNC_JOB_MAX_COST
+            and estimate.memory_bytes <= max_memory
+        ):
+            rejection += "; submit it to /api/simulate/jobs instead"
+        elif estimate.engine != SimulationEngine.DENSE.value:
+            rejection += "; select fewer truth-table rows with 'inputs'"
+        else:
+            rejection += "; use fewer qubits or gates"
+
+    ESTIMATED_COST.observe(
+        estimate.operations,
+        endpoint=endpoint,
+        engine=estimate.engine,
+        **request_labels(),
+    )
+    ADMISSION_TOTAL.inc(
+        endpoint=endpoint,
+        decision="admitted" if rejection is None else "rejected",
+        engine=estimate.engine,
+    )
+
+    return estimate, rejection
+
+
+def _optimize(trial_dto: UnitaryDTO) -> UnitaryDTO:
+    """
+    Run the circuit optimization pass when it is enabled.
+    """
+    if not Config.OPTIMIZE_CIRCUITS:
+        return trial_dto
+
+    return CircuitOptimizer.optimize(trial_dto)
+
+
+def _with_gate_count(
+    response: tuple, unitary_info: dict, trial_dto: UnitaryDTO
+) -> tuple:
+    """
+    Report the submitted and optimized gate counts alongside a simulate result.
+    Counts are added after the result cache, which is keyed on the optimized
+    circuit and so may serve circuits that were submitted differently.
+    """
+    body, status_code = response
+
+    if not Config.OPTIMIZE_CIRCUITS or status_code != 200:
+        return response
+
+    gate_count = {
+        "original": len(unitary_info["gates"]),
+        "optimized": len(trial_dto.gates),
+    }
+    return {**body, "gate_count": gate_count}, status_code
+
+
+def _cache_lookup(trial_dto: UnitaryDTO, target_name: str, **options: Any) -> tuple:
+    """
+    Return the result-cache key for a circuit and its cached response, if any.
+    The key is None when the cache is disabled.
+    """
+    if not Config.RESULT_CACHE_ENABLED:
+        return None, None
+
+    cache_key = ResultCache.make_key(
+        trial_dto.number_of_qubits,
+        trial_dto.gates,
+        trial_dto.qubit_order,
+        target_name,
+        Config.TRUTH_TABLE_DECIMALS,
+        validate_target=Config.VALIDATE_TARGET_CIRCUITS,
+        **options,
+    )
+    cached_response = result_cache.get(cache_key)
+    RESULT_CACHE_TOTAL.inc(result="miss" if cached_response is None else "hit")
+
+    return cache_key, cached_response
+
+
+def _batch_result(body: dict, status_code: int) -> dict:
+    """
+    Tag a single-circuit response with its outcome for the batch results list.
+    """
+    return {"status": "success" if status_code == 200 else "error", **body}
+
+
+def _serialize(body: dict, status_code: int):  # type: ignore
+    """
+    Serialize a simulate response body to JSON, timing the serialization stage.
+    """
+    with time_stage(PipelineStage.SERIALIZE.value):
+        return make_response(jsonify(body), status_code)
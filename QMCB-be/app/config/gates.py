@@ -1,8 +1,98 @@
-import cirq
+import functools
 import math
+import numpy as np
 from app.utils.types import Operation, Qubit
 from app.utils.constants import Gate
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import cirq
+
+
+# Number of qubits each gate acts on
+GATE_ARITY: dict[str, int] = {
+    Gate.X.value: 1,
+    Gate.H.value: 1,
+    Gate.S.value: 1,
+    Gate.T.value: 1,
+    Gate.RX.value: 1,
+    Gate.RY.value: 1,
+    Gate.U.value: 1,
+    Gate.CNOT.value: 2,
+    Gate.CONTROLLED_Z.value: 2,
+    Gate.SWAP.value: 2,
+}
+
+# Gates with a stabilizer effect (Clifford), simulable on a stabilizer state
+CLIFFORD_GATES = frozenset(
+    {
+        Gate.X.value,
+        Gate.H.value,
+        Gate.S.value,
+        Gate.RX.value,
+        Gate.RY.value,
+        Gate.U.value,
+        Gate.CNOT.value,
+        Gate.CONTROLLED_Z.value,
+        Gate.SWAP.value,
+    }
+)
+
+# Read-only unitary matrices of each gate acting on its own qubit(s), written
+# out so the gate table needs no Cirq import. Entries are bit-for-bit what
+# cirq.unitary returns for the gate objects below, so every backend agrees.
+_H = 0.7071067811865477
+_COS = math.cos(math.pi / 4)
+_SIN = math.sin(math.pi / 4)
+
+GATE_MATRICES: dict[str, np.ndarray] = {
+    Gate.X.value: np.array([[0, 1], [1, 0]]),
+    Gate.H.value: np.array([[_H, _H], [_H, -_H]]),
+    Gate.S.value: np.array([[1, 0], [0, 1j]]),
+    Gate.T.value: np.array([[1, 0], [0, np.exp(1j * math.pi / 4)]]),
+    Gate.RX.value: np.array([[_COS, -1j * _SIN], [-1j * _SIN, _COS]]),
+    Gate.RY.value: np.array([[_COS, -_SIN], [_SIN, _COS]]),
+    # Generic single-qubit gate (placeholder - needs parameters)
+    Gate.U.value: np.array([[_H, _H], [_H, -_H]]),  # Temporary: just use H
+    Gate.CNOT.value: np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]]),
+    Gate.CONTROLLED_Z.value: np.diag([1, 1, 1, -1]),
+    Gate.SWAP.value: np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]]),
+}
+for _name in GATE_MATRICES:
+    GATE_MATRICES[_name] = GATE_MATRICES[_name].astype(np.complex128)
+    GATE_MATRICES[_name].setflags(write=False)
+
+# Gates that only permute basis states (X, CNOT, SWAP): 0/1 permutation matrices
+PERMUTATION_GATES = frozenset(
+    name
+    for name, matrix in GATE_MATRICES.items()
+    if np.isin(matrix, (0, 1)).all()
+    and (matrix.sum(axis=0) == 1).all()
+    and (matrix.sum(axis=1) == 1).all()
+)
+
+
+@functools.lru_cache(maxsize=None)
+def gate_objects() -> dict[str, "cirq.Gate"]:
+    """
+    Cirq gate objects of the gate table, created once on first use so that
+    importing the gate table does not import Cirq.
+    """
+    import cirq
+
+    return {
+        Gate.X.value: cirq.X,
+        Gate.H.value: cirq.H,
+        Gate.S.value: cirq.S,
+        Gate.T.value: cirq.T,
+        Gate.RX.value: cirq.rx(math.pi / 2),
+        Gate.RY.value: cirq.ry(math.pi / 2),
+        # Generic single-qubit gate (placeholder - needs parameters)
+        Gate.U.value: cirq.H,  # Temporary: just use H
+        Gate.CNOT.value: cirq.CNOT,
+        Gate.CONTROLLED_Z.value: cirq.CZ,
+        Gate.SWAP.value: cirq.SWAP,
+    }
 
 
 class CirqGateMapper:
@@ -14,48 +104,34 @@ class CirqGateMapper:
         """
         Apply the desired quantum gate to the provided qubit(s).
         """
+        if gate not in GATE_ARITY:
+            raise ValueError(f"Unsupported gate: {gate}")
+
+        arity = GATE_ARITY[gate]
 
         # To handle cases where qubit order is not necessary
         if qubit_order is None:
-            qubit_order = list(range(len(qubits)))
-
-        selected_qubits = [qubits[i] for i in qubit_order]
-
-        print(
-            f"[DEBUG] Gate: {gate}, Qubit Order: {qubit_order}, "
-            f"Selected Qubits: {[str(q) for q in selected_qubits]}"
-        )
-
-        if gate == Gate.X.value:
-            return cirq.X(selected_qubits[0])
-
-        elif gate == Gate.H.value:
-            return cirq.H(selected_qubits[0])
-
-        elif gate == Gate.S.value:
-            return cirq.S(selected_qubits[0])
-
-        elif gate == Gate.T.value:
-            return cirq.T(selected_qubits[0])
-
-        elif gate == Gate.RX.value:
-            return cirq.rx(math.pi / 2)(selected_qubits[0]) 
-
-        elif gate == Gate.RY.value:
-            return cirq.ry(math.pi / 2)(selected_qubits[0])
-
-        elif gate == Gate.U.value:
-            # Generic single-qubit gate (placeholder - needs parameters)
-            return cirq.H(selected_qubits[0])  # Temporary: just use H
-
-        elif gate == Gate.CNOT.value:
-            return cirq.CNOT(selected_qubits[0], selected_qubits[1])
+            selected_qubits = qubits[:arity]
+        else:
+            selected_qubits = tuple(qubits[i] for i in qubit_order[:arity])
 
-        elif gate == Gate.CONTROLLED_Z.value:
-            return cirq.CZ(selected_qubits[0], selected_qubits[1])
+        return CirqGateMapper.operation(gate, selected_qubits)
 
-        elif gate == Gate.SWAP.value:
-            return cirq.SWAP(selected_qubits[0], selected_qubits[1])
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def operation(gate: str, qubits: tuple[Qubit, ...]) -> Operation:
+        """
+        Return the (memoized) operation of a gate on an ordered tuple of qubits.
+        """
+        return gate_objects()[gate].on(*qubits)
 
-        else:
+    @staticmethod
+    def matrix(gate: str) -> np.ndarray:
+        """
+        Return the unitary matrix of a gate acting on its own qubit(s),
+        in the same big-endian convention Cirq uses.
+        """
+        if gate not in GATE_MATRICES:
             raise ValueError(f"Unsupported gate: {gate}")
+
+        return GATE_MATRICES[gate]
@@ -1,19 +1,42 @@
 from app.services.circuit_builder import CircuitBuilder
-from app.services.simulator import CircuitSimulator
+from app.services.cost_model import CostEstimate, CostModel
+from app.services.simulator import CircuitSimulator, evolve_basis_chunk
 from app.services.target_builder import TargetUnitaryBuilder
 from app.utils.helpers import (
     generate_basis_states,
     initialize_qubit_sequence,
+    basis_state,
     build_target_truth_table,
+    format_ket,
+    get_qubit_order,
+    get_target_gates,
 )
 from app.dto.unitary import UnitaryDTO
 from app.dto.truth_table import TruthTableDTO
-from typing import Any
+from app.utils.types import Qubit
+from app.utils.constants import SimulationBackend, SimulationEngine
+from app.utils.metrics import bind_request_labels
+from typing import Any, Iterator, Optional
 import logging
+import numpy as np
 
 
 def simulate_unitaries(
-    trial_dto: UnitaryDTO, target_name: str, validate_target: bool = False
+    trial_dto: UnitaryDTO,
+    target_name: str,
+    validate_target: bool = False,
+    single_pass: bool = True,
+    decimals: int = 3,
+    backend: str = SimulationBackend.CIRQ.value,
+    use_target_cache: bool = True,
+    inputs: Optional[list[int]] = None,
+    permutation_fast_path: bool = True,
+    stabilizer_min_qubits: Optional[int] = None,
+    max_rows: int = 4096,
+    stabilizer_max_terms: int = 1024,
+    mps_min_qubits: Optional[int] = None,
+    mps_max_bond: int = 64,
+    outputs: Optional[list[int]] = None,
 ) -> tuple[dict[str, Any], int]:
     """
     Simulate trial circuit and optionally compute target circuit.
@@ -22,14 +45,59 @@ def simulate_unitaries(
         trial_dto: Student's circuit definition
         target_name: Target unitary identifier (e.g., "SWAP")
         validate_target: If True, compute target circuit. If False, use stored values.
+        single_pass: If True, build each circuit once and read every truth-table
+            row from its unitary. If False, simulate each basis state separately.
+        decimals: Rounding used for the Dirac-notation outputs.
+        backend: Simulation backend used for single-pass evaluation.
+        use_target_cache: If False, recompute the target instead of serving it
+            from the compiled target cache.
+        inputs: Basis-input indices of the truth-table rows to return (all if None).
+        permutation_fast_path: If True, X/CNOT/SWAP-only circuits are evaluated
+            with integer bit operations instead of state vectors.
+        stabilizer_min_qubits: Clifford-only circuits with at least this many
+            qubits run on the stabilizer backend (never if None).
+        max_rows: Largest truth table these fast paths return when no inputs
+            are selected.
+        stabilizer_max_terms: Largest output superposition the stabilizer
+            backend will render.
+        mps_min_qubits: Other circuits with at least this many qubits run on
+            the MPS backend (never if None).
+        mps_max_bond: Bond-dimension cap of the MPS backend.
+        outputs: Output basis-state indices whose amplitudes the MPS backend
+            returns, in place of truth tables.
 
     Returns:
-        Response dict with trial and target truth tables
+        Response dict with trial and target truth tables, or with per-input
+        output amplitudes when the MPS backend is selected
     """
+    engine = CircuitSimulator.select_engine(
+        trial_dto.gates,
+        trial_dto.number_of_qubits,
+        permutation_fast_path=permutation_fast_path,
+        stabilizer_min_qubits=stabilizer_min_qubits,
+        mps_min_qubits=mps_min_qubits,
+    )
 
-    # Initializing qubits and starting basis states
+    if engine == SimulationEngine.MPS.value:
+        return _simulate_mps(
+            trial_dto, target_name, inputs, outputs, max_rows, mps_max_bond
+        )
+
+    if engine != SimulationEngine.DENSE.value:
+        return _simulate_fast_path(
+            trial_dto,
+            target_name,
+            validate_target,
+            inputs,
+            decimals,
+            backend,
+            use_target_cache,
+            max_rows,
+            stabilizer_max_terms,
+        )
+
+    # Initializing qubits (basis states are generated lazily per row)
     qubits = initialize_qubit_sequence(trial_dto.number_of_qubits)
-    basis_states = generate_basis_states(trial_dto.number_of_qubits)
 
     # Preparing truth tables
     trial_truth_table_dto = TruthTableDTO([], [])
@@ -40,8 +108,826 @@ def simulate_unitaries(
         logging.info("Skipping target circuit validation - Using stored outputs.")
         build_target_truth_table(target_name, target_truth_table_dto)
 
+    if single_pass:
+        _simulate_single_pass(
+            trial_dto,
+            target_name,
+            validate_target,
+            qubits,
+            trial_truth_table_dto,
+            target_truth_table_dto,
+            decimals,
+            backend,
+            use_target_cache,
+        )
+    else:
+        _simulate_per_state(
+            trial_dto,
+            target_name,
+            validate_target,
+            qubits,
+            trial_truth_table_dto,
+            target_truth_table_dto,
+            decimals,
+        )
+
+    if inputs is not None:
+        trial_truth_table_dto = _select_rows(trial_truth_table_dto, inputs)
+        target_truth_table_dto = _select_rows(target_truth_table_dto, inputs)
+
+    logging.info("Passed simulation and results of circuit successfully!")
+    logging.debug("Trial Circuit Results: %s", trial_truth_table_dto)
+    logging.debug("Target Circuit Results: %s", target_truth_table_dto)
+
+    return {
+        "message": "Successfully simulated circuits.",
+        "trial_truth_table": trial_truth_table_dto.to_dict(),
+        "target_truth_table": target_truth_table_dto.to_dict(),
+        "validation_mode:": validate_target,
+    }, 200
+
+
+def estimate_cost(
+    trial_dto: UnitaryDTO,
+    single_pass: bool = True,
+    inputs: Optional[list[int]] = None,
+    outputs: Optional[list[int]] = None,
+    dense: bool = False,
+    permutation_fast_path: bool = True,
+    stabilizer_min_qubits: Optional[int] = None,
+    max_rows: int = 4096,
+    stabilizer_max_terms: int = 1024,
+    mps_min_qubits: Optional[int] = None,
+    mps_max_bond: int = 64,
+) -> CostEstimate:
+    """
+    Estimate the cost of simulating a trial circuit from its width, gate count
+    and the engine simulate_unitaries would pick, without building it.
+
+    Takes the same engine options as simulate_unitaries. dense=True estimates
+    the modes that always evaluate full state vectors (check, streaming and
+    binary states).
+    """
+    if dense:
+        engine = SimulationEngine.DENSE.value
+    else:
+        engine = CircuitSimulator.select_engine(
+            trial_dto.gates,
+            trial_dto.number_of_qubits,
+            permutation_fast_path=permutation_fast_path,
+            stabilizer_min_qubits=stabilizer_min_qubits,
+            mps_min_qubits=mps_min_qubits,
+        )
+
+    return CostModel.estimate(
+        trial_dto.number_of_qubits,
+        len(trial_dto.gates),
+        engine,
+        rows=None if inputs is None else len(inputs),
+        single_pass=single_pass or dense,
+        max_rows=max_rows,
+        max_bond=mps_max_bond,
+        amplitudes=0 if outputs is None else len(outputs),
+    )
+
+
+def selection_error(
+    trial_dto: UnitaryDTO,
+    inputs: Optional[list[int]] = None,
+    outputs: Optional[list[int]] = None,
+    permutation_fast_path: bool = True,
+    stabilizer_min_qubits: Optional[int] = None,
+    max_rows: int = 4096,
+    stabilizer_max_terms: int = 1024,
+    mps_min_qubits: Optional[int] = None,
+    mps_max_bond: int = 64,
+) -> Optional[str]:
+    """
+    Describe why the rows selected for a circuit cannot be served by the
+    engine simulate_unitaries would pick, or return None, so callers can reject
+    the request before simulating.
+
+    Takes the same engine options as simulate_unitaries.
+    """
+    engine = CircuitSimulator.select_engine(
+        trial_dto.gates,
+        trial_dto.number_of_qubits,
+        permutation_fast_path=permutation_fast_path,
+        stabilizer_min_qubits=stabilizer_min_qubits,
+        mps_min_qubits=mps_min_qubits,
+    )
+
+    if engine in (
+        SimulationEngine.PERMUTATION.value,
+        SimulationEngine.STABILIZER.value,
+    ):
+        return _rows_error(trial_dto.number_of_qubits, inputs, max_rows)
+    if engine == SimulationEngine.MPS.value:
+        return _mps_error(trial_dto.number_of_qubits, inputs, outputs, max_rows)
+
+    return None
+
+
+def check_unitaries(
+    trial_dto: UnitaryDTO,
+    target_name: str,
+    tolerance: float = 1e-6,
+    backend: str = SimulationBackend.CIRQ.value,
+    use_target_cache: bool = True,
+    chunk_size: int = 8,
+) -> tuple[dict[str, Any], int]:
+    """
+    Check whether the trial circuit implements the target unitary, up to a
+    global phase, without formatting any truth tables.
+
+    Output states are compared column by column in chunks of basis inputs
+    (chunk_size, then doubling) and the check stops at the first mismatching
+    column, so a wrong circuit is usually rejected after a few inputs.
+
+    Returns:
+        Response dict with the verdict and, on a mismatch, the offending input
+    """
+    number_of_qubits = trial_dto.number_of_qubits
+    dimension = 2**number_of_qubits
+
+    target_unitary = TargetUnitaryBuilder.compile(
+        target_name,
+        number_of_qubits,
+        backend=backend,
+        force=not use_target_cache,
+    ).unitary
+
+    circuit = None
+    if backend == SimulationBackend.CIRQ.value:
+        circuit = CircuitBuilder.build_circuit_base(
+            trial_dto.gates,
+            trial_dto.qubit_order,
+            initialize_qubit_sequence(number_of_qubits),
+        )
+
+    global_phase = None
+    mismatch_index = None
+    start, size = 0, max(chunk_size, 1)
+
+    while start < dimension:
+        stop = min(start + size, dimension)
+        trial_states = evolve_basis_chunk(
+            trial_dto.gates,
+            trial_dto.qubit_order,
+            number_of_qubits,
+            start,
+            stop,
+            backend,
+            circuit=circuit,
+        )
+        target_states = target_unitary[:, start:stop]
+
+        # Fix the global phase from the largest target amplitude of the first column
+        if global_phase is None:
+            pivot = int(np.argmax(np.abs(target_states[:, 0])))
+            global_phase = trial_states[pivot, 0] / target_states[pivot, 0]
+
+            if abs(abs(global_phase) - 1) > tolerance:
+                mismatch_index = start
+                break
+
+        differences = np.abs(trial_states - global_phase * target_states)
+        mismatched_columns = np.flatnonzero(np.any(differences > tolerance, axis=0))
+
+        if mismatched_columns.size:
+            mismatch_index = start + int(mismatched_columns[0])
+            break
+
+        start, size = stop, size * 2
+
+    match = mismatch_index is None
+    logging.info(f"Equivalence check against {target_name}: match={match}")
+
+    return {
+        "message": "Successfully checked trial circuit against target.",
+        "match": match,
+        "mismatch_input": (
+            None
+            if match
+            else format_ket(basis_state(mismatch_index, number_of_qubits))  # type: ignore
+        ),
+    }, 200
+
+
+def simulate_states(
+    trial_dto: UnitaryDTO,
+    target_name: str,
+    backend: str = SimulationBackend.CIRQ.value,
+    use_target_cache: bool = True,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the raw trial and target output-state matrices, skipping Dirac
+    formatting entirely. Column j of each matrix is the output for basis input j.
+    """
+    qubits = initialize_qubit_sequence(trial_dto.number_of_qubits)
+
+    trial_states = CircuitSimulator.output_states(
+        trial_dto.gates, trial_dto.qubit_order, qubits, backend=backend
+    )
+    target_states = TargetUnitaryBuilder.compile(
+        target_name,
+        trial_dto.number_of_qubits,
+        backend=backend,
+        force=not use_target_cache,
+    ).unitary
+
+    logging.info("Passed simulation of raw output states successfully!")
+
+    return trial_states, target_states
+
+
+def stream_unitaries(
+    trial_dto: UnitaryDTO,
+    target_name: str,
+    validate_target: bool = False,
+    decimals: int = 3,
+    backend: str = SimulationBackend.CIRQ.value,
+    chunk_size: int = 64,
+) -> Iterator[dict[str, Any]]:
+    """
+    Simulate trial circuit (and target) in chunks of basis inputs, yielding
+    truth-table rows as soon as each chunk is computed.
+
+    The target is looked up eagerly so an unknown target fails before streaming
+    starts. Memory is bounded by the chunk size rather than the table size.
+
+    Yields:
+        A header, one {"input", "trial", "target"} row per basis state, and a
+        closing summary (or an error entry if simulation fails mid-stream).
+    """
+    stored_target = None
+    target_steps = None
+
+    if validate_target:
+        target_steps = (get_target_gates(target_name), get_qubit_order(target_name))
+    else:
+        stored_target = TruthTableDTO([], [])
+        build_target_truth_table(target_name, stored_target)
+
+    return _stream_rows(
+        trial_dto,
+        target_name,
+        validate_target,
+        stored_target,
+        target_steps,
+        decimals,
+        backend,
+        max(chunk_size, 1),
+    )
+
+
+def _stream_rows(
+    trial_dto: UnitaryDTO,
+    target_name: str,
+    validate_target: bool,
+    stored_target: Optional[TruthTableDTO],
+    target_steps: Optional[tuple[list[str], list[list[int]]]],
+    decimals: int,
+    backend: str,
+    chunk_size: int,
+) -> Iterator[dict[str, Any]]:
+    number_of_qubits = trial_dto.number_of_qubits
+    dimension = 2**number_of_qubits
+
+    yield {
+        "type": "header",
+        "number_of_qubits": number_of_qubits,
+        "target_unitary": target_name,
+        "validation_mode": validate_target,
+    }
+
+    try:
+        for start in range(0, dimension, chunk_size):
+            stop = min(start + chunk_size, dimension)
+
+            trial_outputs = CircuitSimulator.format_states(
+                evolve_basis_chunk(
+                    trial_dto.gates,
+                    trial_dto.qubit_order,
+                    number_of_qubits,
+                    start,
+                    stop,
+                    backend,
+                ),
+                decimals=decimals,
+            )
+
+            if target_steps is not None:
+                target_outputs: list[Optional[str]] = list(
+                    CircuitSimulator.format_states(
+                        evolve_basis_chunk(
+                            *target_steps, number_of_qubits, start, stop, backend
+                        ),
+                        decimals=decimals,
+                    )
+                )
+            else:
+                stored_outputs = stored_target.output if stored_target else []
+                target_outputs = [
+                    stored_outputs[i] if i < len(stored_outputs) else None
+                    for i in range(start, stop)
+                ]
+
+            for offset, trial_output in enumerate(trial_outputs):
+                yield {
+                    "type": "row",
+                    "input": format_ket(basis_state(start + offset, number_of_qubits)),
+                    "trial": trial_output,
+                    "target": target_outputs[offset],
+                }
+
+    except Exception as e:
+        logging.exception("Streaming simulation failed")
+        yield {"type": "error", "error": str(e)}
+        return
+
+    yield {
+        "type": "end",
+        "message": "Successfully simulated circuits.",
+        "rows": dimension,
+    }
+
+
+def simulate_batch(
+    batch: list[tuple[UnitaryDTO, str]],
+    validate_target: bool = False,
+    single_pass: bool = True,
+    decimals: int = 3,
+    backend: str = SimulationBackend.CIRQ.value,
+    use_target_cache: bool = True,
+    selections: Optional[list[tuple[Optional[list[int]], Optional[list[int]]]]] = None,
+    permutation_fast_path: bool = True,
+    stabilizer_min_qubits: Optional[int] = None,
+    max_rows: int = 4096,
+    stabilizer_max_terms: int = 1024,
+    mps_min_qubits: Optional[int] = None,
+    mps_max_bond: int = 64,
+) -> list[tuple[dict[str, Any], int]]:
+    """
+    Simulate a batch of trial circuits.
+
+    Items are grouped by qubit count and target so the qubits, basis states and
+    target truth table are prepared once per group, and identical circuits in a
+    group are simulated once. Items that select rows or outputs, or that the
+    engine options route to the permutation, stabilizer or MPS engine, run
+    through simulate_unitaries on their own.
+
+    Args:
+        batch: (trial DTO, target name) pairs
+        selections: (inputs, outputs) per item, as in simulate_unitaries
+            (nothing selected if None)
+        (remaining arguments as in simulate_unitaries)
+
+    Returns:
+        One (response dict, status) pair per item, in input order. A failing
+        item yields an error entry without affecting the rest of the batch.
+    """
+    results: list[tuple[dict[str, Any], int]] = [({}, 500)] * len(batch)
+    groups: dict[tuple[int, str], list[int]] = {}
+    selections = selections or [(None, None)] * len(batch)
+    engine_options = {
+        "permutation_fast_path": permutation_fast_path,
+        "stabilizer_min_qubits": stabilizer_min_qubits,
+        "max_rows": max_rows,
+        "stabilizer_max_terms": stabilizer_max_terms,
+        "mps_min_qubits": mps_min_qubits,
+        "mps_max_bond": mps_max_bond,
+    }
+
+    for index, (trial_dto, target_name) in enumerate(batch):
+        inputs, outputs = selections[index]
+        engine = CircuitSimulator.select_engine(
+            trial_dto.gates,
+            trial_dto.number_of_qubits,
+            permutation_fast_path=permutation_fast_path,
+            stabilizer_min_qubits=stabilizer_min_qubits,
+            mps_min_qubits=mps_min_qubits,
+        )
+
+        selected = inputs is not None or outputs is not None
+        if engine != SimulationEngine.DENSE.value or selected:
+            bind_request_labels(trial_dto.number_of_qubits, target_name)
+            results[index] = _batch_item(
+                simulate_unitaries,
+                trial_dto,
+                target_name,
+                validate_target,
+                single_pass,
+                decimals,
+                backend,
+                use_target_cache,
+                inputs=inputs,
+                outputs=outputs,
+                **engine_options,
+            )
+            continue
+
+        groups.setdefault((trial_dto.number_of_qubits, target_name), []).append(index)
+
+    for (number_of_qubits, target_name), indices in groups.items():
+        bind_request_labels(number_of_qubits, target_name)
+
+        # Per-state mode has nothing to share between items
+        if not single_pass:
+            for index in indices:
+                results[index] = _batch_item(
+                    simulate_unitaries,
+                    batch[index][0],
+                    target_name,
+                    validate_target,
+                    single_pass,
+                    decimals,
+                    backend,
+                    use_target_cache,
+                )
+            continue
+
+        logging.info(
+            f"Simulating batch group of {len(indices)} circuits "
+            f"({number_of_qubits} qubits, target {target_name})"
+        )
+
+        try:
+            qubits = initialize_qubit_sequence(number_of_qubits)
+            target_truth_table_dto = _target_truth_table(
+                target_name,
+                number_of_qubits,
+                validate_target,
+                decimals,
+                backend,
+                use_target_cache,
+            )
+        except Exception as e:
+            for index in indices:
+                results[index] = _batch_error(e)
+            continue
+
+        # Identical circuits within a group share one simulation
+        simulated: dict[tuple, tuple[dict[str, Any], int]] = {}
+
+        for index in indices:
+            trial_dto = batch[index][0]
+            circuit_key = (
+                tuple(trial_dto.gates),
+                tuple(tuple(order) for order in trial_dto.qubit_order),
+            )
+
+            if circuit_key not in simulated:
+                simulated[circuit_key] = _batch_item(
+                    _simulate_trial,
+                    trial_dto,
+                    qubits,
+                    target_truth_table_dto,
+                    validate_target,
+                    decimals,
+                    backend,
+                )
+
+            results[index] = simulated[circuit_key]
+
+    return results
+
+
+def _batch_item(simulate: Any, *args: Any, **kwargs: Any) -> tuple[dict[str, Any], int]:
+    """
+    Run one batch item, turning any failure into an error entry.
+    """
+    try:
+        return simulate(*args, **kwargs)
+    except Exception as e:
+        return _batch_error(e)
+
+
+def _batch_error(error: Exception) -> tuple[dict[str, Any], int]:
+    return {
+        "message": "Unexpected error occured when simulating circuit.",
+        "error": str(error),
+    }, 500
+
+
+def _simulate_trial(
+    trial_dto: UnitaryDTO,
+    qubits: list[Qubit],
+    target_truth_table_dto: TruthTableDTO,
+    validate_target: bool,
+    decimals: int,
+    backend: str,
+) -> tuple[dict[str, Any], int]:
+    """
+    Simulate one trial circuit against an already prepared target truth table.
+    """
+    trial_truth_table_dto = TruthTableDTO([], [])
+
+    trial_states = CircuitSimulator.output_states(
+        trial_dto.gates, trial_dto.qubit_order, qubits, backend=backend
+    )
+    CircuitSimulator.unitary_truth_table(
+        trial_states, trial_truth_table_dto, decimals=decimals
+    )
+
+    return {
+        "message": "Successfully simulated circuits.",
+        "trial_truth_table": trial_truth_table_dto.to_dict(),
+        "target_truth_table": target_truth_table_dto.to_dict(),
+        "validation_mode:": validate_target,
+    }, 200
+
+
+def _target_truth_table(
+    target_name: str,
+    number_of_qubits: int,
+    validate_target: bool,
+    decimals: int,
+    backend: str,
+    use_target_cache: bool,
+) -> TruthTableDTO:
+    """
+    Return the target truth table, either from stored outputs or from the
+    compiled target cache.
+    """
+    target_truth_table_dto = TruthTableDTO([], [])
+
+    if not validate_target:
+        build_target_truth_table(target_name, target_truth_table_dto)
+        return target_truth_table_dto
+
+    compiled_target = TargetUnitaryBuilder.compile(
+        target_name,
+        number_of_qubits,
+        decimals=decimals,
+        backend=backend,
+        force=not use_target_cache,
+    )
+    target_truth_table_dto.input.extend(compiled_target.truth_table.input)
+    target_truth_table_dto.output.extend(compiled_target.truth_table.output)
+
+    return target_truth_table_dto
+
+
+def _simulate_fast_path(
+    trial_dto: UnitaryDTO,
+    target_name: str,
+    validate_target: bool,
+    inputs: Optional[list[int]],
+    decimals: int,
+    backend: str,
+    use_target_cache: bool,
+    max_rows: int,
+    max_terms: int,
+) -> tuple[dict[str, Any], int]:
+    """
+    Fill the requested truth-table rows of a permutation or Clifford circuit,
+    and of its target, without building 2^n state vectors. Stored target
+    outputs are used when not validating, as in the dense paths.
+    """
+    number_of_qubits = trial_dto.number_of_qubits
+
+    rows_error = _rows_error(number_of_qubits, inputs, max_rows)
+    if rows_error is not None:
+        raise ValueError(rows_error)
+
+    trial_truth_table_dto = TruthTableDTO([], [])
+    target_truth_table_dto = TruthTableDTO([], [])
+
+    _fast_truth_table(
+        trial_dto.gates,
+        trial_dto.qubit_order,
+        number_of_qubits,
+        inputs,
+        trial_truth_table_dto,
+        decimals,
+        max_terms,
+    )
+
+    target_gates = get_target_gates(target_name)
+
+    if not validate_target:
+        build_target_truth_table(target_name, target_truth_table_dto)
+        if inputs is not None:
+            target_truth_table_dto = _select_rows(target_truth_table_dto, inputs)
+    elif CircuitSimulator.is_clifford(target_gates):
+        _fast_truth_table(
+            target_gates,
+            get_qubit_order(target_name),
+            number_of_qubits,
+            inputs,
+            target_truth_table_dto,
+            decimals,
+            max_terms,
+        )
+    else:
+        target_truth_table_dto = _target_truth_table(
+            target_name, number_of_qubits, True, decimals, backend, use_target_cache
+        )
+        if inputs is not None:
+            target_truth_table_dto = _select_rows(target_truth_table_dto, inputs)
+
+    return {
+        "message": "Successfully simulated circuits.",
+        "trial_truth_table": trial_truth_table_dto.to_dict(),
+        "target_truth_table": target_truth_table_dto.to_dict(),
+        "validation_mode:": validate_target,
+    }, 200
+
+
+def _simulate_mps(
+    trial_dto: UnitaryDTO,
+    target_name: str,
+    inputs: Optional[list[int]],
+    outputs: Optional[list[int]],
+    max_rows: int,
+    max_bond: int,
+) -> tuple[dict[str, Any], int]:
+    """
+    Return the amplitudes of the requested output basis states for each
+    requested input, for the trial circuit and its target, from matrix
+    product states.
+    """
+    number_of_qubits = trial_dto.number_of_qubits
+    logging.info(f"Evaluating {number_of_qubits}-qubit circuit as an MPS")
+
+    mps_error = _mps_error(number_of_qubits, inputs, outputs, max_rows)
+    if mps_error is not None:
+        raise ValueError(mps_error)
+    if inputs is None:
+        inputs = list(range(2**number_of_qubits))
+
+    trial_amplitudes = CircuitSimulator.mps_amplitudes(
+        trial_dto.gates,
+        trial_dto.qubit_order,
+        number_of_qubits,
+        inputs,
+        outputs,
+        max_bond=max_bond,
+    )
+    target_amplitudes = CircuitSimulator.mps_amplitudes(
+        get_target_gates(target_name),
+        get_qubit_order(target_name),
+        number_of_qubits,
+        inputs,
+        outputs,
+        max_bond=max_bond,
+    )
+
+    return {
+        "message": "Successfully simulated circuits.",
+        "engine": SimulationEngine.MPS.value,
+        "trial_amplitudes": trial_amplitudes,
+        "target_amplitudes": target_amplitudes,
+        "validation_mode:": True,
+    }, 200
+
+
+def _fast_truth_table(
+    gates: list[str],
+    qubit_order: list[list[int]],
+    number_of_qubits: int,
+    inputs: Optional[list[int]],
+    truth_table: TruthTableDTO,
+    decimals: int,
+    max_terms: int,
+) -> None:
+    """
+    Fill truth-table rows from integer bit operations for permutation
+    circuits (no Cirq objects at all), or from stabilizer states for other
+    Clifford circuits.
+    """
+    if CircuitSimulator.is_permutation(gates):
+        logging.info("Evaluating permutation circuit with bit operations")
+        CircuitSimulator.permutation_truth_table(
+            gates, qubit_order, number_of_qubits, inputs, truth_table
+        )
+        return None
+
+    logging.info(f"Evaluating {number_of_qubits}-qubit Clifford circuit (stabilizer)")
+    CircuitSimulator.stabilizer_truth_table(
+        gates,
+        qubit_order,
+        initialize_qubit_sequence(number_of_qubits),
+        inputs if inputs is not None else list(range(2**number_of_qubits)),
+        truth_table,
+        decimals=decimals,
+        max_terms=max_terms,
+    )
+
+    return None
+
+
+def _rows_error(
+    number_of_qubits: int, inputs: Optional[list[int]], max_rows: int
+) -> Optional[str]:
+    """
+    Fast paths only return a whole truth table up to max_rows rows.
+    """
+    if inputs is None and 2**number_of_qubits > max_rows:
+        return (
+            f"Select the truth-table rows to compute with 'inputs': a "
+            f"{number_of_qubits}-qubit table has more than {max_rows} rows"
+        )
+
+    return None
+
+
+def _mps_error(
+    number_of_qubits: int,
+    inputs: Optional[list[int]],
+    outputs: Optional[list[int]],
+    max_rows: int,
+) -> Optional[str]:
+    """
+    The MPS engine returns amplitudes of selected outputs, for at most
+    max_rows inputs unless they are selected too.
+    """
+    if outputs is None:
+        return (
+            f"Select the output basis states to return with 'outputs': "
+            f"{number_of_qubits}-qubit circuits return amplitudes, not truth tables"
+        )
+    if inputs is None and 2**number_of_qubits > max_rows:
+        return (
+            f"Select the basis inputs to simulate with 'inputs': a "
+            f"{number_of_qubits}-qubit circuit has more than {max_rows} inputs"
+        )
+
+    return None
+
+
+def _select_rows(truth_table: TruthTableDTO, inputs: list[int]) -> TruthTableDTO:
+    """
+    Keep only the truth-table rows of the given basis-input indices, in order.
+    Tables that do not have a row for every input (stored target outputs for
+    another qubit count) are returned unchanged.
+    """
+    if any(index >= len(truth_table.output) for index in inputs):
+        return truth_table
+
+    return TruthTableDTO(
+        [truth_table.input[index] for index in inputs],
+        [truth_table.output[index] for index in inputs],
+    )
+
+
+def _simulate_single_pass(
+    trial_dto: UnitaryDTO,
+    target_name: str,
+    validate_target: bool,
+    qubits: list[Qubit],
+    trial_truth_table_dto: TruthTableDTO,
+    target_truth_table_dto: TruthTableDTO,
+    decimals: int,
+    backend: str,
+    use_target_cache: bool,
+) -> None:
+    """
+    Evolve every basis state through each circuit in one pass and fill the
+    truth-table rows from the resulting output-state columns.
+    """
+    logging.info(f"Evaluating trial circuit in a single pass ({backend} backend)")
+
+    trial_states = CircuitSimulator.output_states(
+        trial_dto.gates, trial_dto.qubit_order, qubits, backend=backend
+    )
+    CircuitSimulator.unitary_truth_table(
+        trial_states, trial_truth_table_dto, decimals=decimals
+    )
+
+    if validate_target:
+        logging.info("Serving target validation from compiled target cache")
+
+        compiled_truth_table = _target_truth_table(
+            target_name,
+            trial_dto.number_of_qubits,
+            validate_target,
+            decimals,
+            backend,
+            use_target_cache,
+        )
+        target_truth_table_dto.input.extend(compiled_truth_table.input)
+        target_truth_table_dto.output.extend(compiled_truth_table.output)
+
+    return None
+
+
+def _simulate_per_state(
+    trial_dto: UnitaryDTO,
+    target_name: str,
+    validate_target: bool,
+    qubits: list[Qubit],
+    trial_truth_table_dto: TruthTableDTO,
+    target_truth_table_dto: TruthTableDTO,
+    decimals: int,
+) -> None:
+    """
+    Prepare and simulate a separate circuit for every basis state.
+    """
+
     # Running simulations for each basis state
-    for state in basis_states:
+    for state in generate_basis_states(trial_dto.number_of_qubits):
 
         logging.info(f"Constructing circuit for state: {state}")
 
@@ -50,11 +936,10 @@ def simulate_unitaries(
         )
 
         logging.info("Passed circuit construction successfully.")
-        print("Trial Circuit:")
-        print(trial_circuit)
+        logging.debug("Trial Circuit:\n%s", trial_circuit)
 
         CircuitSimulator.simulate_and_update(
-            trial_circuit, qubits, state, trial_truth_table_dto, decimals=3
+            trial_circuit, qubits, state, trial_truth_table_dto, decimals=decimals
         )
 
         if validate_target:
@@ -65,24 +950,10 @@ def simulate_unitaries(
                 CircuitBuilder.prepare_basis_state(state, qubits) + target_circuit_base
             )
 
-            print("Target Circuit:")
-            print(target_circuit)
+            logging.debug("Target Circuit:\n%s", target_circuit)
 
             CircuitSimulator.simulate_and_update(
-                target_circuit, qubits, state, target_truth_table_dto, decimals=3
+                target_circuit, qubits, state, target_truth_table_dto, decimals=decimals
             )
 
-    logging.info("Passed simulation and results of circuit successfully!")
-
-    # Printing results
-    print("Trial Circuit Results:")
-    print(trial_truth_table_dto)
-    print("Target Circuit Results:")
-    print(target_truth_table_dto)
-
-    return {
-        "message": "Successfully simulated circuits.",
-        "trial_truth_table": trial_truth_table_dto.to_dict(),
-        "target_truth_table": target_truth_table_dto.to_dict(),
-        "validation_mode:": validate_target,
-    }, 200
+    return None
@@ -1,6 +1,11 @@
 from app.api import api
 from app import create_app
 from app.settings import Config
+from app.services.target_artifact import TargetArtifact
+from app.services.target_builder import TargetUnitaryBuilder
+from app.services.executor import SIMULATION_EXECUTOR
+from app.services.prefix_cache import PREFIX_CACHE
+from app.utils.metrics import REGISTRY
 from flask_cors import CORS
 import logging
 
@@ -28,5 +33,26 @@ app.url_map.strict_slashes = False
 # Initialize RESTX after CORS wraps the app
 api.init_app(app)
 
+# Toggle per-stage latency metrics
+REGISTRY.enabled = config.METRICS_ENABLED
+
+# Size the process pool used to fan large circuits out across cores
+SIMULATION_EXECUTOR.configure(config.SIMULATION_WORKERS, config.PARALLEL_MIN_QUBITS)
+
+# Budget the gate-prefix unitary cache used to resume resubmitted circuits
+PREFIX_CACHE.configure(
+    config.PREFIX_CACHE_MAX_MB * 2**20, config.PREFIX_CACHE_MAX_QUBITS
+)
+
+# Map the prebuilt target artifact, or compile the target library once, so
+# validation never resimulates targets
+if config.VALIDATE_TARGET_CIRCUITS and config.PRECOMPILE_TARGETS:
+    if not TargetArtifact.load(
+        config.TARGET_ARTIFACT_PATH, decimals=config.TRUTH_TABLE_DECIMALS
+    ):
+        TargetUnitaryBuilder.compile_library(
+            decimals=config.TRUTH_TABLE_DECIMALS, backend=config.SIMULATION_BACKEND
+        )
+
 if __name__ == "__main__":
     app.run(debug=True)
@@ -1,8 +1,12 @@
-import cirq
+import logging
 from app.config.gates import CirqGateMapper
 from app.utils.helpers import index_to_letter
+from app.utils.metrics import time_stage
 from app.utils.types import Qubit, Circuit
-from app.utils.constants import Gate
+from app.utils.constants import Gate, PipelineStage
+
+
+logger = logging.getLogger(__name__)
 
 
 class CircuitBuilder:
@@ -19,6 +23,8 @@ class CircuitBuilder:
         Returns:
             A Cirq Circuit that sets the qubits to the given state.
         """
+        import cirq
+
         operations = []
 
         if len(basis_state) != len(qubits):
@@ -40,14 +46,19 @@ class CircuitBuilder:
         Creates a circuit based on the order of gate operations for a specified
         number of qubits.
         """
-        operations = []
+        import cirq
 
-        for i in range(len(gates)):
+        with time_stage(PipelineStage.CONSTRUCT.value):
+            operations = []
 
-            print(f"Applying {gates[i]} for order {qubit_order[i]}")
-            operations.append(CirqGateMapper.apply(gates[i], qubit_order[i], *qubits))
+            for i in range(len(gates)):
 
-        return cirq.Circuit(operations)
+                logger.debug("Applying %s for order %s", gates[i], qubit_order[i])
+                operations.append(
+                    CirqGateMapper.apply(gates[i], qubit_order[i], *qubits)
+                )
+
+            return cirq.Circuit(operations)
 
     @staticmethod
     def construct_unitary_circuit(
@@ -60,9 +71,8 @@ class CircuitBuilder:
         Prepares the basis state, applies the gate sequence, and returns a circuit.
         """
         circuit = CircuitBuilder.prepare_basis_state(basis_state, qubits)
-        print("Prepared basis state...")
         circuit.append(CircuitBuilder.build_circuit_base(gates, qubit_order, qubits))
-        print("Built circuit base...")
+        logger.debug("Built circuit for basis state %s", basis_state)
 
         return circuit
 
@@ -73,6 +83,8 @@ class CircuitBuilder:
         Creates a circuit to measures each qubit at the end
         of a circuit sequence.
         """
+        import cirq
+
         operations = []
 
         # Measurement Note:
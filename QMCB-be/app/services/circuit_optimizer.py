@@ -0,0 +1,170 @@
+import logging
+import numpy as np
+from app.config.gates import GATE_ARITY, GATE_MATRICES
+from app.dto.unitary import UnitaryDTO
+from app.utils.constants import Gate, PipelineStage
+from app.utils.metrics import time_stage
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Gates that are their own inverse (G G = I), read off the gate table
+SELF_INVERSE_GATES = frozenset(
+    name
+    for name, matrix in GATE_MATRICES.items()
+    if np.allclose(matrix @ matrix, np.eye(len(matrix)))
+)
+
+# Two-qubit gates unchanged by swapping their qubits (CZ, SWAP)
+_SWAP_MATRIX = GATE_MATRICES[Gate.SWAP.value]
+SYMMETRIC_GATES = frozenset(
+    name
+    for name, matrix in GATE_MATRICES.items()
+    if GATE_ARITY[name] == 2
+    and np.allclose(_SWAP_MATRIX @ matrix @ _SWAP_MATRIX, matrix)
+)
+
+# Same-axis rotations merged by summing their multiples of the smallest step:
+# gate -> (family, steps per gate). Every family is exactly periodic in 8 steps
+# (T^8 = I, RX(pi/2)^8 = RY(pi/2)^8 = I) so merging never changes global phase.
+ROTATION_STEPS: dict[str, tuple[str, int]] = {
+    Gate.T.value: (Gate.T.value, 1),
+    Gate.S.value: (Gate.T.value, 2),
+    Gate.RX.value: (Gate.RX.value, 1),
+    Gate.RY.value: (Gate.RY.value, 1),
+}
+ROTATION_PERIOD = 8
+
+
+class CircuitOptimizer:
+
+    @staticmethod
+    def optimize(trial_dto: UnitaryDTO) -> UnitaryDTO:
+        """
+        Return an equivalent, shorter gate sequence for a trial circuit.
+
+        - Cancels adjacent self-inverse pairs on the same qubits (H H, X X,
+          CNOT CNOT, CZ CZ, SWAP SWAP), where "adjacent" means no gate in
+          between touches any of their qubits
+        - Merges runs of same-axis rotations (S/T phases, RX, RY) and drops
+          them when they add up to the identity
+
+        Circuits with unknown gates or malformed qubit orders are returned
+        unchanged so the simulator reports the error as before.
+        """
+        with time_stage(PipelineStage.OPTIMIZE.value):
+            if not CircuitOptimizer._is_well_formed(trial_dto):
+                return trial_dto
+
+            # Live nodes: [gate or rotation family, qubits, steps, qubit order]
+            nodes: list[Optional[list]] = []
+            # Per qubit, indices of the live nodes touching it (top = latest)
+            stacks: dict[int, list[int]] = {
+                q: [] for q in range(trial_dto.number_of_qubits)
+            }
+
+            for gate, order in zip(trial_dto.gates, trial_dto.qubit_order):
+                targets = tuple(order[: GATE_ARITY[gate]])
+                previous = CircuitOptimizer._previous_node(nodes, stacks, targets)
+
+                if previous is not None:
+                    node = nodes[previous]
+
+                    if gate in ROTATION_STEPS:
+                        family, steps = ROTATION_STEPS[gate]
+                        if node[0] == family and node[2] is not None:
+                            node[2] = (node[2] + steps) % ROTATION_PERIOD
+                            if node[2] == 0:
+                                CircuitOptimizer._remove(nodes, stacks, previous)
+                            continue
+
+                    elif gate in SELF_INVERSE_GATES and node[0] == gate:
+                        if node[1] == targets or (
+                            gate in SYMMETRIC_GATES and set(node[1]) == set(targets)
+                        ):
+                            CircuitOptimizer._remove(nodes, stacks, previous)
+                            continue
+
+                if gate in ROTATION_STEPS:
+                    family, steps = ROTATION_STEPS[gate]
+                    nodes.append([family, targets, steps, [targets[0]]])
+                else:
+                    nodes.append([gate, targets, None, order])
+
+                for q in targets:
+                    stacks[q].append(len(nodes) - 1)
+
+            gates: list[str] = []
+            qubit_order: list[list[int]] = []
+
+            for node in nodes:
+                if node is None:
+                    continue
+                for gate in CircuitOptimizer._expand(node[0], node[2]):
+                    gates.append(gate)
+                    qubit_order.append(node[3])
+
+        logger.debug(
+            "Optimized circuit from %d to %d gates", len(trial_dto.gates), len(gates)
+        )
+
+        return UnitaryDTO(trial_dto.number_of_qubits, gates, qubit_order)
+
+    @staticmethod
+    def _is_well_formed(trial_dto: UnitaryDTO) -> bool:
+        if len(trial_dto.gates) != len(trial_dto.qubit_order):
+            return False
+
+        for gate, order in zip(trial_dto.gates, trial_dto.qubit_order):
+            arity = GATE_ARITY.get(gate)
+            if arity is None or len(order) < arity:
+                return False
+
+            targets = order[:arity]
+            if len(set(targets)) < arity or not all(
+                isinstance(q, int) and 0 <= q < trial_dto.number_of_qubits
+                for q in targets
+            ):
+                return False
+
+        return True
+
+    @staticmethod
+    def _previous_node(
+        nodes: list[Optional[list]],
+        stacks: dict[int, list[int]],
+        targets: tuple[int, ...],
+    ) -> Optional[int]:
+        """
+        Index of the latest live node if it acts on exactly these qubits and no
+        later node touches any of them, else None.
+        """
+        tops = {stacks[q][-1] if stacks[q] else None for q in targets}
+        if len(tops) != 1:
+            return None
+
+        index = tops.pop()
+        if index is None or set(nodes[index][1]) != set(targets):  # type: ignore
+            return None
+
+        return index
+
+    @staticmethod
+    def _remove(
+        nodes: list[Optional[list]], stacks: dict[int, list[int]], index: int
+    ) -> None:
+        for q in nodes[index][1]:  # type: ignore
+            stacks[q].pop()
+        nodes[index] = None
+
+    @staticmethod
+    def _expand(gate: str, steps: Optional[int]) -> list[str]:
+        """
+        Re-emit a node as gates from the gate table.
+        """
+        if steps is None:
+            return [gate]
+        if gate == Gate.T.value:
+            return [Gate.S.value] * (steps // 2) + [Gate.T.value] * (steps % 2)
+        return [gate] * steps
@@ -0,0 +1,103 @@
+from dataclasses import dataclass, asdict
+from typing import Optional
+from app.utils.constants import SimulationEngine
+
+
+# Bytes per complex128 amplitude
+AMPLITUDE_BYTES = 16
+
+# Fixed cost (in amplitude updates) of building and running one Cirq simulation,
+# paid once per basis state on the per-state path
+PER_STATE_OVERHEAD = 1e4
+
+
+@dataclass(frozen=True)
+class CostEstimate:
+    """
+    Predicted work of one simulate request, derived from its shape alone.
+    `operations` counts amplitude updates (or the engine's equivalent) and
+    `memory_bytes` the largest buffers the engine holds at once.
+    """
+
+    engine: str
+    number_of_qubits: int
+    gate_count: int
+    rows: int
+    operations: float
+    memory_bytes: float
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class CostModel:
+
+    @staticmethod
+    def estimate(
+        number_of_qubits: int,
+        gate_count: int,
+        engine: str,
+        *,
+        rows: Optional[int] = None,
+        single_pass: bool = True,
+        max_rows: int = 4096,
+        max_bond: int = 64,
+        amplitudes: int = 0,
+    ) -> CostEstimate:
+        """
+        Estimate the cost of simulating a circuit on a given engine without
+        touching Cirq.
+
+        Args:
+            number_of_qubits: Circuit width
+            gate_count: Gates left after optimization
+            engine: Engine chosen by CircuitSimulator.select_engine
+            rows: Basis inputs requested (all 2^n if None)
+            single_pass: Dense path builds one unitary instead of one
+                simulation per basis state
+            max_rows: Rows the non-dense engines compute when none are selected
+            max_bond: Bond-dimension cap of the MPS engine
+            amplitudes: Output amplitudes read per input (MPS engine)
+        """
+        n = number_of_qubits
+        dimension = 2.0**n
+        work = gate_count + 1
+
+        if engine == SimulationEngine.DENSE.value:
+            # Dense paths evaluate every basis input, whatever rows are selected
+            rows = int(dimension)
+            if single_pass:
+                operations = work * dimension**2
+                memory = 2 * dimension**2 * AMPLITUDE_BYTES
+            else:
+                operations = dimension * (work * dimension + PER_STATE_OVERHEAD)
+                memory = 2 * dimension * AMPLITUDE_BYTES
+
+        else:
+            rows = rows if rows is not None else int(min(dimension, max_rows))
+
+            if engine == SimulationEngine.PERMUTATION.value:
+                operations = float(rows * work)
+                memory = float(2 * rows * AMPLITUDE_BYTES)
+
+            elif engine == SimulationEngine.STABILIZER.value:
+                # O(n) tableau update per gate, O(n^3) to read the output state
+                operations = float(rows * (work * n + n**3))
+                memory = float(2 * n * n * AMPLITUDE_BYTES)
+
+            else:
+                # Entanglement across a cut grows by at most one bit per gate
+                bond = min(max_bond, 2 ** min(gate_count, n // 2))
+                operations = float(
+                    rows * (work * n * bond**3 + amplitudes * n * bond**2)
+                )
+                memory = float(2 * n * bond**2 * 2 * AMPLITUDE_BYTES)
+
+        return CostEstimate(
+            engine=engine,
+            number_of_qubits=n,
+            gate_count=gate_count,
+            rows=rows,
+            operations=operations,
+            memory_bytes=memory,
+        )
@@ -0,0 +1,114 @@
+import logging
+import math
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_worker() -> None:
+    """
+    Process-pool initializer: pre-import Cirq and the simulation modules so the
+    first task in each worker does not pay the import cost, and disable nested
+    fan-out inside workers.
+    """
+    SIMULATION_EXECUTOR.configure(max_workers=0)
+
+    import cirq  # noqa: F401
+    import app.services.simulator  # noqa: F401
+
+    logger.debug("Simulation worker %s warmed up", os.getpid())
+
+
+def _noop() -> int:
+    return os.getpid()
+
+
+class SimulationExecutor:
+    """
+    Lazily started, pre-warmed process pool for simulation work.
+
+    With max_workers=0 the executor is disabled and callers run in-process.
+    """
+
+    def __init__(self, max_workers: int = 0, min_qubits: int = 0) -> None:
+        self.max_workers = max_workers
+        self.min_qubits = min_qubits
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def configure(self, max_workers: int, min_qubits: Optional[int] = None) -> None:
+        """
+        Set the worker count (and optionally the fan-out threshold). Takes effect
+        the next time the pool is started.
+        """
+        self.max_workers = max_workers
+        if min_qubits is not None:
+            self.min_qubits = min_qubits
+
+        return None
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_workers > 0
+
+    def should_fan_out(self, number_of_qubits: int) -> bool:
+        """
+        Whether a circuit is wide enough for chunked fan-out to beat the
+        inter-process overhead.
+        """
+        return (
+            self.enabled
+            and self.max_workers > 1
+            and number_of_qubits >= self.min_qubits
+        )
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                logger.info(f"Starting simulation pool with {self.max_workers} workers")
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers, initializer=_warm_worker
+                )
+            return self._pool
+
+    def warm(self) -> None:
+        """
+        Start every worker now instead of on the first request.
+        """
+        if not self.enabled:
+            return None
+
+        pool = self._get_pool()
+        for future in [pool.submit(_noop) for _ in range(self.max_workers)]:
+            future.result()
+
+        return None
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Run fn(*args, **kwargs) on a worker process.
+        """
+        return self._get_pool().submit(fn, *args, **kwargs)
+
+    def chunks(self, size: int) -> list[tuple[int, int]]:
+        """
+        Split range(size) into one contiguous (start, stop) chunk per worker.
+        """
+        step = math.ceil(size / max(self.max_workers, 1))
+        return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+
+        return None
+
+
+# Shared pool used to fan basis-state chunks out across cores
+SIMULATION_EXECUTOR = SimulationExecutor()
@@ -0,0 +1,86 @@
+import threading
+import uuid
+from cachetools import TTLCache
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+from app.services.executor import SimulationExecutor
+from app.utils.constants import JobStatus
+
+
+class JobQueue:
+    """
+    Runs simulations on a local process pool and keeps their results in a
+    bounded store (oldest jobs are evicted past `max_jobs` or after `ttl` seconds).
+    """
+
+    def __init__(self, max_workers: int, max_jobs: int, ttl: float) -> None:
+        # Own warm pool, so long jobs never queue ahead of request fan-out
+        self._executor = SimulationExecutor(max_workers)
+        self._jobs: TTLCache = TTLCache(maxsize=max_jobs, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        on_done: Optional[Callable[[Any], None]] = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Schedule fn(*args, **kwargs) on a worker process and return the job id.
+        on_done is called with the result once the job succeeds.
+        """
+        job_id = uuid.uuid4().hex
+        future = self._executor.submit(fn, *args, **kwargs)
+
+        with self._lock:
+            self._jobs[job_id] = future
+
+        if on_done is not None:
+            future.add_done_callback(
+                lambda f: on_done(f.result()) if f.exception() is None else None
+            )
+
+        return job_id
+
+    def complete(self, result: Any) -> str:
+        """
+        Record a result computed synchronously as a finished job.
+        """
+        job_id = uuid.uuid4().hex
+        future: Future = Future()
+        future.set_result(result)
+
+        with self._lock:
+            self._jobs[job_id] = future
+
+        return job_id
+
+    def status(self, job_id: str) -> Optional[dict[str, Any]]:
+        """
+        Return {"status", "result"/"error"} for a job, or None if it is unknown
+        or has been evicted.
+        """
+        with self._lock:
+            future = self._jobs.get(job_id)
+
+        if future is None:
+            return None
+
+        if not future.done():
+            state = JobStatus.RUNNING if future.running() else JobStatus.PENDING
+            return {"status": state.value}
+
+        error = future.exception()
+        if error is not None:
+            return {"status": JobStatus.FAILED.value, "error": str(error)}
+
+        return {"status": JobStatus.DONE.value, "result": future.result()}
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker pool, waiting for running jobs to finish.
+        """
+        self._executor.shutdown()
+
+        return None
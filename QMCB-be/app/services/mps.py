@@ -0,0 +1,146 @@
+import numpy as np
+from app.config.gates import CirqGateMapper
+from app.utils.constants import Gate
+from app.utils.helpers import basis_state
+
+
+class MatrixProductState:
+    """
+    Tensor-train (MPS) state of n qubits, one (left bond, 2, right bond) tensor
+    per qubit in qubit order. Kept in mixed canonical form around `center`, so
+    the singular values dropped when a bond is truncated are exactly the weight
+    lost from the state.
+    """
+
+    def __init__(
+        self,
+        number_of_qubits: int,
+        input_index: int = 0,
+        *,
+        max_bond: int = 64,
+        cutoff: float = 1e-12,
+    ) -> None:
+        self.number_of_qubits = number_of_qubits
+        self.max_bond = max_bond
+        self.cutoff = cutoff
+        # Product over truncations of the weight kept (estimated state fidelity)
+        self.fidelity = 1.0
+
+        self.tensors: list[np.ndarray] = []
+        for bit in basis_state(input_index, number_of_qubits):
+            tensor = np.zeros((1, 2, 1), dtype=np.complex128)
+            tensor[0, bit, 0] = 1
+            self.tensors.append(tensor)
+        self.center = 0
+
+    @property
+    def truncation_error(self) -> float:
+        """
+        Estimated infidelity caused by bond truncation (0 when exact).
+        """
+        return 1.0 - self.fidelity
+
+    @property
+    def bond_dimension(self) -> int:
+        """
+        Largest bond dimension currently in the chain.
+        """
+        return max(tensor.shape[2] for tensor in self.tensors)
+
+    def apply(self, gate: str, targets: list[int]) -> None:
+        """
+        Apply a one- or two-qubit gate. Non-adjacent two-qubit gates are brought
+        together with adjacent swaps and moved back afterwards.
+        """
+        matrix = CirqGateMapper.matrix(gate)
+
+        if len(targets) == 1:
+            site = targets[0]
+            self.tensors[site] = np.einsum("ij,ajb->aib", matrix, self.tensors[site])
+            return None
+
+        first, second = targets
+        low, high = min(first, second), max(first, second)
+        swap = CirqGateMapper.matrix(Gate.SWAP.value)
+
+        for site in range(high - 1, low, -1):
+            self._apply_adjacent(swap, site, reverse=False)
+
+        self._apply_adjacent(matrix, low, reverse=first > second)
+
+        for site in range(low + 1, high):
+            self._apply_adjacent(swap, site, reverse=False)
+
+        return None
+
+    def amplitudes(self, indices: list[int]) -> np.ndarray:
+        """
+        Return <x|psi> for each big-endian basis index x.
+        """
+        values = np.empty(len(indices), dtype=np.complex128)
+
+        for position, index in enumerate(indices):
+            vector = np.ones(1, dtype=np.complex128)
+            for tensor, bit in zip(
+                self.tensors, basis_state(index, self.number_of_qubits)
+            ):
+                vector = vector @ tensor[:, bit, :]
+            values[position] = vector[0]
+
+        return values
+
+    def _apply_adjacent(self, matrix: np.ndarray, site: int, *, reverse: bool) -> None:
+        """
+        Apply a two-qubit gate to sites (site, site + 1) and split the result
+        back into two tensors with a truncated SVD. reverse=True applies the
+        gate with its first qubit on site + 1.
+        """
+        self._move_center(site)
+
+        gate = matrix.reshape(2, 2, 2, 2)
+        if reverse:
+            gate = gate.transpose(1, 0, 3, 2)
+
+        theta = np.einsum("aib,bjc->aijc", self.tensors[site], self.tensors[site + 1])
+        theta = np.einsum("ijkl,aklc->aijc", gate, theta)
+        left, _, _, right = theta.shape
+
+        u, s, vh = np.linalg.svd(
+            theta.reshape(left * 2, 2 * right), full_matrices=False
+        )
+
+        keep = max(1, min(self.max_bond, int(np.count_nonzero(s > self.cutoff))))
+        self.fidelity *= 1.0 - float(np.sum(s[keep:] ** 2))
+        s = s[:keep] / np.linalg.norm(s[:keep])
+
+        self.tensors[site] = u[:, :keep].reshape(left, 2, keep)
+        self.tensors[site + 1] = (s[:, np.newaxis] * vh[:keep]).reshape(keep, 2, right)
+        self.center = site + 1
+
+        return None
+
+    def _move_center(self, site: int) -> None:
+        """
+        Shift the orthogonality center to a site with QR sweeps.
+        """
+        while self.center < site:
+            tensor = self.tensors[self.center]
+            left, _, right = tensor.shape
+            q, r = np.linalg.qr(tensor.reshape(left * 2, right))
+            self.tensors[self.center] = q.reshape(left, 2, q.shape[1])
+            self.tensors[self.center + 1] = np.einsum(
+                "ab,bjc->ajc", r, self.tensors[self.center + 1]
+            )
+            self.center += 1
+
+        while self.center > site:
+            tensor = self.tensors[self.center]
+            left, _, right = tensor.shape
+            q, r = np.linalg.qr(tensor.reshape(left, 2 * right).T)
+            self.tensors[self.center] = q.T.reshape(q.shape[1], 2, right)
+            self.tensors[self.center - 1] = np.einsum(
+                "aib,bc->aic", self.tensors[self.center - 1], r.T
+            )
+            self.center -= 1
+
+        return None
@@ -0,0 +1,180 @@
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+from app.config.gates import GATE_ARITY
+
+
+# One trie edge: a gate and the qubits it acts on
+Step = tuple[str, tuple[int, ...]]
+
+
+def prefix_steps(gates: list[str], qubit_order: list[list[int]]) -> list[Step]:
+    """
+    Trie keys for a gate sequence. Orders are cut to the gate's arity, so a
+    single-qubit [q, q] and [q] name the same step.
+    """
+    return [
+        (gate, tuple(int(q) for q in order[: GATE_ARITY.get(gate, len(order))]))
+        for gate, order in zip(gates, qubit_order)
+    ]
+
+
+class _Node:
+    __slots__ = ("parent", "step", "children", "unitary")
+
+    def __init__(self, parent: Optional["_Node"], step: Optional[Step]) -> None:
+        self.parent = parent
+        self.step = step
+        self.children: dict[Step, _Node] = {}
+        self.unitary: Optional[np.ndarray] = None
+
+
+class PrefixUnitaryCache:
+    """
+    Trie of partial circuit unitaries keyed by gate/qubit-order prefix, so a
+    resubmitted circuit only applies the gates after its longest cached prefix.
+
+    Tries are kept per namespace (backend and qubit count). Stored unitaries
+    are read-only and evicted least-recently-used once their total size passes
+    max_bytes; trie nodes left without a unitary or children are pruned with
+    them. With max_bytes=0 the cache is disabled.
+    """
+
+    def __init__(self, max_bytes: int = 0, max_qubits: int = 10) -> None:
+        self.max_bytes = max_bytes
+        self.max_qubits = max_qubits
+        self._roots: dict[Hashable, _Node] = {}
+        self._lru: OrderedDict[_Node, None] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def configure(self, max_bytes: int, max_qubits: Optional[int] = None) -> None:
+        """
+        Set the memory budget (and optionally the widest circuit cached),
+        dropping every stored prefix.
+        """
+        self.max_bytes = max_bytes
+        if max_qubits is not None:
+            self.max_qubits = max_qubits
+        self.clear()
+
+        return None
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def accepts(self, number_of_qubits: int) -> bool:
+        """
+        Whether circuits of this width are cached.
+        """
+        return self.enabled and number_of_qubits <= self.max_qubits
+
+    def lookup(
+        self, namespace: Hashable, steps: list[Step]
+    ) -> tuple[int, Optional[np.ndarray]]:
+        """
+        Return the length of the longest cached prefix of steps and its
+        unitary, or (0, None) when nothing is cached.
+        """
+        with self._lock:
+            node = self._roots.get(namespace)
+            depth, best = 0, None
+
+            for position, step in enumerate(steps):
+                node = node.children.get(step) if node is not None else None
+                if node is None:
+                    break
+                if node.unitary is not None:
+                    depth, best = position + 1, node
+
+            if best is None:
+                self.misses += 1
+                return 0, None
+
+            self.hits += 1
+            self._lru.move_to_end(best)
+            return depth, best.unitary
+
+    def store(
+        self, namespace: Hashable, steps: list[Step], unitary: np.ndarray
+    ) -> None:
+        """
+        Cache the unitary of a gate prefix (marked read-only in place), evicting
+        the least recently used prefixes to stay within max_bytes.
+        """
+        if not steps or unitary.nbytes > self.max_bytes:
+            return None
+
+        unitary.setflags(write=False)
+
+        with self._lock:
+            node = self._roots.setdefault(namespace, _Node(None, None))
+            for step in steps:
+                child = node.children.get(step)
+                if child is None:
+                    child = node.children[step] = _Node(node, step)
+                node = child
+
+            if node.unitary is not None:
+                self._bytes -= node.unitary.nbytes
+            node.unitary = unitary
+            self._bytes += unitary.nbytes
+            self._lru[node] = None
+            self._lru.move_to_end(node)
+
+            while self._bytes > self.max_bytes:
+                self._evict(next(iter(self._lru)))
+
+        return None
+
+    def clear(self) -> None:
+        """
+        Drop every cached prefix and reset the counters.
+        """
+        with self._lock:
+            self._roots.clear()
+            self._lru.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return stored prefixes, bytes held, limits and hit/miss counters.
+        """
+        with self._lock:
+            return {
+                "prefixes": len(self._lru),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "max_qubits": self.max_qubits,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _evict(self, node: _Node) -> None:
+        """
+        Drop a node's unitary and prune the branch it leaves empty.
+        """
+        del self._lru[node]
+        if node.unitary is not None:
+            self._bytes -= node.unitary.nbytes
+            node.unitary = None
+
+        while node.parent is not None and not node.children and node.unitary is None:
+            del node.parent.children[node.step]  # type: ignore[index]
+            node = node.parent
+
+        if node.parent is None and not node.children:
+            for namespace, root in list(self._roots.items()):
+                if root is node:
+                    del self._roots[namespace]
+
+
+PREFIX_CACHE = PrefixUnitaryCache()
@@ -0,0 +1,83 @@
+import cProfile
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from cachetools import TTLCache
+from typing import Any, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileStore:
+    """
+    Bounded store of request profile summaries (oldest are evicted past
+    `max_profiles` or after `ttl` seconds). When `directory` is set, each
+    profile is also written there as <id>.json plus the raw <id>.prof stats
+    for pstats or snakeviz.
+    """
+
+    def __init__(self, max_profiles: int, ttl: float, directory: str = "") -> None:
+        self._profiles: TTLCache = TTLCache(maxsize=max_profiles, ttl=ttl)
+        self._lock = threading.Lock()
+        self._directory = directory
+
+    def add(
+        self,
+        summary: dict[str, Any],
+        profiler: Optional[cProfile.Profile] = None,
+        **details: Any,
+    ) -> str:
+        """
+        Store a profile summary with request details and return its id.
+        """
+        profile_id = uuid.uuid4().hex
+        entry = {"profile_id": profile_id, "time": time.time(), **details, **summary}
+
+        with self._lock:
+            self._profiles[profile_id] = entry
+
+        if self._directory:
+            self._write(profile_id, entry, profiler)
+
+        return profile_id
+
+    def get(self, profile_id: str) -> Optional[dict[str, Any]]:
+        """
+        Return a stored profile, or None if it is unknown or has been evicted.
+        """
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def recent(self, limit: int = 50) -> list[dict[str, Any]]:
+        """
+        List the newest stored profiles without their frames.
+        """
+        with self._lock:
+            entries = list(self._profiles.values())
+
+        entries.sort(key=lambda entry: entry["time"], reverse=True)
+
+        return [
+            {k: v for k, v in entry.items() if k not in ("top", "focus")}
+            for entry in entries[:limit]
+        ]
+
+    def _write(
+        self,
+        profile_id: str,
+        entry: dict[str, Any],
+        profiler: Optional[cProfile.Profile],
+    ) -> None:
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            path = os.path.join(self._directory, profile_id)
+            with open(f"{path}.json", "w") as summary_file:
+                json.dump(entry, summary_file, indent=2)
+            if profiler is not None:
+                profiler.dump_stats(f"{path}.prof")
+        except OSError as e:
+            logger.warning(f"Could not write profile {profile_id}: {e}")
@@ -0,0 +1,93 @@
+import hashlib
+import json
+import threading
+from cachetools import TTLCache
+from typing import Any, Optional
+
+
+class ResultCache:
+    """
+    Bounded, content-addressed cache of simulate responses.
+
+    Entries are keyed on a canonical hash of the circuit definition, evicted
+    least-recently-used once `maxsize` is reached and expired after `ttl` seconds.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        number_of_qubits: int,
+        gates: list[str],
+        qubit_order: list[list[int]],
+        target_unitary: str,
+        decimals: int,
+        **options: Any,
+    ) -> str:
+        """
+        Build a canonical SHA-256 key for a circuit definition. Extra options
+        that change the response (e.g. validation mode) are folded in as well.
+        """
+        payload = {
+            "number_of_qubits": int(number_of_qubits),
+            "gates": [str(gate) for gate in gates],
+            "qubit_order": [[int(q) for q in order] for order in qubit_order],
+            "target_unitary": target_unitary,
+            "decimals": int(decimals),
+            "options": options,
+        }
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached response for a key, or None on a miss.
+        """
+        with self._lock:
+            value = self._cache.get(key)
+
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a response under a key, evicting the least-recently-used entry
+        if the cache is full.
+        """
+        with self._lock:
+            self._cache[key] = value
+
+        return None
+
+    def clear(self) -> None:
+        """
+        Drop every cached response and reset the counters.
+        """
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return current size, limits and hit/miss counters.
+        """
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "maxsize": self._cache.maxsize,
+                "ttl": self._cache.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
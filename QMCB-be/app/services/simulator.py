@@ -1,8 +1,42 @@
-import cirq
+import logging
 import numpy as np
+from app.config.gates import (
+    CLIFFORD_GATES,
+    GATE_ARITY,
+    PERMUTATION_GATES,
+    CirqGateMapper,
+)
 from app.dto.truth_table import TruthTableDTO
-from app.utils.helpers import extract_results, format_ket, list_to_joint_string
+from app.services.circuit_builder import CircuitBuilder
+from app.services.executor import SIMULATION_EXECUTOR
+from app.services.mps import MatrixProductState
+from app.services.prefix_cache import PREFIX_CACHE, prefix_steps
+from app.utils.constants import (
+    Gate,
+    PipelineStage,
+    SimulationBackend,
+    SimulationEngine,
+)
+from app.utils.helpers import (
+    basis_label,
+    basis_labels,
+    basis_state,
+    extract_results,
+    format_ket,
+    initialize_qubit_sequence,
+    list_to_joint_string,
+)
+from app.utils.dirac import (
+    dirac_notation,
+    dirac_notation_columns,
+    dirac_notation_sparse,
+)
+from app.utils.metrics import PREFIX_CACHE_GATES, PREFIX_CACHE_TOTAL, time_stage
 from app.utils.types import Circuit, Qubit
+from typing import Any, Optional
+
+
+logger = logging.getLogger(__name__)
 
 
 class CircuitSimulator:
@@ -15,14 +49,300 @@ class CircuitSimulator:
         """
         Deterministically simulate and return the final state as a Dirac-notation string.
         """
-        sim = cirq.Simulator()
-        # Pass qubit_order to fix basis ordering in the pretty string:
-        result = sim.simulate(circuit, qubit_order=qubits)
-        formatted_psi = cirq.dirac_notation(
-            result.final_state_vector, decimals=decimals
-        )
+        import cirq
+
+        with time_stage(PipelineStage.SIMULATE.value):
+            sim = cirq.Simulator()
+            # Pass qubit_order to fix basis ordering in the pretty string:
+            result = sim.simulate(circuit, qubit_order=qubits)
+
+        with time_stage(PipelineStage.FORMAT.value):
+            formatted_psi = dirac_notation(result.final_state_vector, decimals=decimals)
         return formatted_psi
 
+    # ---------- unitary path (single pass over every basis state) ----------
+    @staticmethod
+    def simulate_unitary(circuit: Circuit, qubits: list[Qubit]) -> np.ndarray:
+        """
+        Compute the full 2^n x 2^n unitary of a circuit in one pass.
+        Column j is the output state for basis input j (big-endian, qubit 0 first).
+        """
+        with time_stage(PipelineStage.SIMULATE.value):
+            return circuit.unitary(qubit_order=qubits)
+
+    @staticmethod
+    def output_states(
+        gates: list[str],
+        qubit_order: list[list[int]],
+        qubits: list[Qubit],
+        *,
+        backend: str = SimulationBackend.CIRQ.value,
+        use_prefix_cache: bool = True,
+    ) -> np.ndarray:
+        """
+        Evolve every basis input through the gate sequence with the selected
+        backend. Column j of the result is the output state for basis input j.
+        Pass use_prefix_cache=False to simulate every gate from scratch.
+        """
+        if backend not in SIMULATION_BACKENDS:
+            raise ValueError(f"Unsupported simulation backend: {backend}")
+
+        # Fanning out beats resuming from a prefix: the workers split every
+        # gate, while a cached prefix only saves the gates the circuits share
+        if SIMULATION_EXECUTOR.should_fan_out(len(qubits)):
+            return CircuitSimulator.parallel_output_states(
+                gates, qubit_order, len(qubits), backend=backend
+            )
+
+        if use_prefix_cache and gates and PREFIX_CACHE.accepts(len(qubits)):
+            return CircuitSimulator.incremental_output_states(
+                gates, qubit_order, qubits, backend=backend
+            )
+
+        return SIMULATION_BACKENDS[backend].output_states(gates, qubit_order, qubits)
+
+    @staticmethod
+    def incremental_output_states(
+        gates: list[str],
+        qubit_order: list[list[int]],
+        qubits: list[Qubit],
+        *,
+        backend: str = SimulationBackend.CIRQ.value,
+    ) -> np.ndarray:
+        """
+        Resume from the longest gate prefix in the prefix cache and apply only
+        the gates after it. The full circuit and the prefix before its last gate
+        are cached, since students mostly append or change the last gate.
+        """
+        namespace = (backend, len(qubits))
+        steps = prefix_steps(gates, qubit_order)
+        simulator = SIMULATION_BACKENDS[backend]
+
+        depth, states = PREFIX_CACHE.lookup(namespace, steps)
+        PREFIX_CACHE_TOTAL.inc(result="hit" if depth else "miss")
+        PREFIX_CACHE_GATES.inc(depth, kind="reused")
+        PREFIX_CACHE_GATES.inc(len(gates) - depth, kind="applied")
+
+        for stop in sorted({max(depth, len(gates) - 1), len(gates)}):
+            if stop > depth:
+                states = simulator.extend(
+                    states, gates[depth:stop], qubit_order[depth:stop], qubits
+                )
+                PREFIX_CACHE.store(namespace, steps[:stop], states)
+                depth = stop
+
+        return states
+
+    @staticmethod
+    def parallel_output_states(
+        gates: list[str],
+        qubit_order: list[list[int]],
+        number_of_qubits: int,
+        *,
+        backend: str = SimulationBackend.CIRQ.value,
+    ) -> np.ndarray:
+        """
+        Fan contiguous chunks of basis inputs out to the simulation pool and
+        stitch the returned output-state columns back together.
+        """
+        with time_stage(PipelineStage.SIMULATE.value):
+            futures = [
+                SIMULATION_EXECUTOR.submit(
+                    evolve_basis_chunk,
+                    gates,
+                    qubit_order,
+                    number_of_qubits,
+                    start,
+                    stop,
+                    backend,
+                )
+                for start, stop in SIMULATION_EXECUTOR.chunks(2**number_of_qubits)
+            ]
+
+            return np.hstack([future.result() for future in futures])
+
+    @staticmethod
+    def unitary_truth_table(
+        unitary: np.ndarray,
+        truth_table: TruthTableDTO,
+        *,
+        decimals: int = 3,
+        input_as_ket: bool = True,
+    ) -> None:
+        """
+        Append one truth-table row per basis state, reading each output state
+        from the matching column of the circuit unitary.
+        """
+        number_of_qubits = unitary.shape[0].bit_length() - 1
+        outputs = CircuitSimulator.format_states(unitary, decimals=decimals)
+
+        for index, output in enumerate(outputs):
+            state = basis_state(index, number_of_qubits)
+            CircuitSimulator.wavefunction_truth_table(
+                state, truth_table, output, input_as_ket=input_as_ket
+            )
+
+        return None
+
+    @staticmethod
+    def format_states(states: np.ndarray, *, decimals: int = 3) -> list[str]:
+        """
+        Render every column of a (2^n x batch) state matrix in Dirac notation.
+        """
+        with time_stage(PipelineStage.FORMAT.value):
+            return dirac_notation_columns(states, decimals=decimals)
+
+    @staticmethod
+    def select_engine(
+        gates: list[str],
+        number_of_qubits: int,
+        *,
+        permutation_fast_path: bool = True,
+        stabilizer_min_qubits: Optional[int] = None,
+        mps_min_qubits: Optional[int] = None,
+    ) -> str:
+        """
+        Pick the simulation engine for a circuit from its gate set and width:
+        bit permutations for X/CNOT/SWAP circuits, stabilizer states for wide
+        Clifford circuits, MPS for circuits too wide for dense state vectors,
+        and dense simulation otherwise.
+        """
+        if permutation_fast_path and CircuitSimulator.is_permutation(gates):
+            return SimulationEngine.PERMUTATION.value
+
+        if (
+            stabilizer_min_qubits is not None
+            and number_of_qubits >= stabilizer_min_qubits
+            and CircuitSimulator.is_clifford(gates)
+        ):
+            return SimulationEngine.STABILIZER.value
+
+        if mps_min_qubits is not None and number_of_qubits >= mps_min_qubits:
+            return SimulationEngine.MPS.value
+
+        return SimulationEngine.DENSE.value
+
+    # ---------- permutation path (X / CNOT / SWAP circuits) ----------
+    @staticmethod
+    def is_permutation(gates: list[str]) -> bool:
+        """
+        Whether every gate of a circuit maps basis states to basis states, so
+        each output is a single ket computable with integer bit operations.
+        """
+        return all(gate in PERMUTATION_GATES for gate in gates)
+
+    @staticmethod
+    def permutation_truth_table(
+        gates: list[str],
+        qubit_order: list[list[int]],
+        number_of_qubits: int,
+        inputs: Optional[list[int]],
+        truth_table: TruthTableDTO,
+    ) -> None:
+        """
+        Append one truth-table row per basis input (every input if None) of a
+        permutation circuit. Outputs carry amplitude exactly 1, so they render
+        as the bare output ket, e.g. '|10⟩'.
+        """
+        outputs = PermutationBackend.output_indices(
+            gates, qubit_order, number_of_qubits, inputs
+        )
+
+        with time_stage(PipelineStage.FORMAT.value):
+            if inputs is None:
+                inputs = np.arange(len(outputs))
+            input_labels = basis_labels(np.asarray(inputs), number_of_qubits)
+            output_labels = basis_labels(outputs, number_of_qubits)
+
+            truth_table.input.extend(f"|{label}>" for label in input_labels)
+            truth_table.output.extend(f"|{label}⟩" for label in output_labels)
+
+        return None
+
+    # ---------- MPS path (wide circuits) ----------
+    @staticmethod
+    def mps_amplitudes(
+        gates: list[str],
+        qubit_order: list[list[int]],
+        number_of_qubits: int,
+        inputs: list[int],
+        outputs: list[int],
+        *,
+        max_bond: int = 64,
+    ) -> list[dict[str, Any]]:
+        """
+        Evolve each requested basis input as a matrix product state and return
+        the amplitudes of the requested output basis states, as [real, imag]
+        pairs, along with the bond dimension reached and the truncation error.
+        """
+        rows = []
+
+        for index in inputs:
+            with time_stage(PipelineStage.SIMULATE.value):
+                state = MPSBackend.evolve(
+                    gates, qubit_order, number_of_qubits, index, max_bond=max_bond
+                )
+                amplitudes = state.amplitudes(outputs)
+
+            rows.append(
+                {
+                    "input": format_ket(basis_state(index, number_of_qubits)),
+                    "amplitudes": {
+                        basis_label(output, number_of_qubits): [
+                            float(amplitude.real),
+                            float(amplitude.imag),
+                        ]
+                        for output, amplitude in zip(outputs, amplitudes)
+                    },
+                    "bond_dimension": state.bond_dimension,
+                    "truncation_error": state.truncation_error,
+                }
+            )
+
+        return rows
+
+    # ---------- stabilizer path (Clifford-only circuits) ----------
+    @staticmethod
+    def is_clifford(gates: list[str]) -> bool:
+        """
+        Whether every gate of a circuit is Clifford, so it can be simulated on a
+        stabilizer state in polynomial time.
+        """
+        return all(gate in CLIFFORD_GATES for gate in gates)
+
+    @staticmethod
+    def stabilizer_truth_table(
+        gates: list[str],
+        qubit_order: list[list[int]],
+        qubits: list[Qubit],
+        inputs: list[int],
+        truth_table: TruthTableDTO,
+        *,
+        decimals: int = 3,
+        max_terms: int = 1024,
+    ) -> None:
+        """
+        Append one truth-table row per requested basis input of a Clifford
+        circuit, without ever building a 2^n state vector.
+        """
+        number_of_qubits = len(qubits)
+        circuit = CircuitBuilder.build_circuit_base(gates, qubit_order, qubits)
+
+        for index in inputs:
+            with time_stage(PipelineStage.SIMULATE.value):
+                indices, amplitudes = StabilizerBackend.output_state(
+                    circuit, qubits, index, max_terms=max_terms
+                )
+            with time_stage(PipelineStage.FORMAT.value):
+                output = dirac_notation_sparse(
+                    indices, amplitudes, number_of_qubits, decimals
+                )
+            CircuitSimulator.wavefunction_truth_table(
+                basis_state(index, number_of_qubits), truth_table, output
+            )
+
+        return None
+
     @staticmethod
     def wavefunction_truth_table(
         state: list[int],
@@ -34,7 +354,7 @@ class CircuitSimulator:
         """
         Append a single row to the truth table.
         - Input column stored as '|01>' when input_as_ket=True (default), else '01'.
-        - Output column stored as the Dirac-notation string produced by Cirq.
+        - Output column stored as the Dirac-notation string (same format as Cirq).
         """
         inp = format_ket(state) if input_as_ket else list_to_joint_string(state)
         truth_table.input.append(inp)
@@ -49,9 +369,11 @@ class CircuitSimulator:
         Runs a circuit through the cirq simulator, executes a measurement
         at the end of the circuit, and returns the extracted results.
         """
+        import cirq
+
         simulator = cirq.Simulator()
-        result = simulator.run(circuit, repetitions=1)  
-        print(f"Result test: {result}")
+        result = simulator.run(circuit, repetitions=1)
+        logger.debug("Result test: %s", result)
         output = extract_results(number_of_qubits, result)
 
         return output
@@ -86,10 +408,320 @@ class CircuitSimulator:
         output = CircuitSimulator.simulate_wavefunction(
             circuit, qubits, decimals=decimals
         )
-        print("Circuit successully ran...")
         CircuitSimulator.wavefunction_truth_table(
             state, truth_table, output, input_as_ket=input_as_ket
         )
-        print("Truth table updated...")
+        logger.debug("Truth table updated for basis state %s", state)
 
         return None
+
+
+class CirqBackend:
+    """
+    Reference backend: builds a cirq.Circuit and lets Cirq compute its unitary.
+    """
+
+    @staticmethod
+    def output_states(
+        gates: list[str], qubit_order: list[list[int]], qubits: list[Qubit]
+    ) -> np.ndarray:
+        circuit = CircuitBuilder.build_circuit_base(gates, qubit_order, qubits)
+        return CircuitSimulator.simulate_unitary(circuit, qubits)
+
+    @staticmethod
+    def extend(
+        states: Optional[np.ndarray],
+        gates: list[str],
+        qubit_order: list[list[int]],
+        qubits: list[Qubit],
+    ) -> np.ndarray:
+        """
+        Apply more gates to a matrix of output states (None for the identity).
+        The gates act on the states directly instead of multiplying by their
+        unitary, so each one costs O(4^n) rather than the O(8^n) of a matmul.
+        """
+        if states is None:
+            return CirqBackend.output_states(gates, qubit_order, qubits)
+
+        with time_stage(PipelineStage.SIMULATE.value):
+            circuit = CircuitBuilder.build_circuit_base(gates, qubit_order, qubits)
+            return CirqBackend.apply(circuit, qubits, states)
+
+    @staticmethod
+    def apply(circuit: Circuit, qubits: list[Qubit], states: np.ndarray) -> np.ndarray:
+        """
+        Cirq's own batched kernel: apply the circuit's operations to every
+        column of a (2^n x batch) matrix of states at once, with the batch as
+        a trailing axis. The input matrix is left untouched.
+        """
+        import cirq
+
+        dimension, batch = states.shape
+        tensor = states.reshape((2,) * len(qubits) + (batch,)).copy()
+        args = cirq.ApplyUnitaryArgs(
+            target_tensor=tensor,
+            available_buffer=np.empty_like(tensor),
+            axes=range(len(qubits)),
+        )
+        evolved = cirq.apply_unitaries(circuit.all_operations(), qubits, args)
+
+        return evolved.reshape(dimension, batch)
+
+
+class NumpyBackend:
+    """
+    Lean backend: applies gate matrices straight to a batch of state vectors
+    held as a (2,) * n + (batch,) complex array, one tensordot per gate.
+    """
+
+    @staticmethod
+    def apply_gate(
+        states: np.ndarray, matrix: np.ndarray, targets: list[int]
+    ) -> np.ndarray:
+        """
+        Apply a k-qubit gate matrix to the target axes of a batched state tensor.
+        """
+        k = len(targets)
+        gate_tensor = matrix.reshape((2,) * (2 * k))
+        evolved = np.tensordot(
+            gate_tensor, states, axes=(list(range(k, 2 * k)), targets)
+        )
+
+        # tensordot puts the gate's output axes first; move them back in place
+        return np.moveaxis(evolved, list(range(k)), targets)
+
+    @staticmethod
+    def evolve(
+        gates: list[str],
+        qubit_order: list[list[int]],
+        number_of_qubits: int,
+        states: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Evolve a (2^n x batch) matrix of input states through the gate sequence.
+        Defaults to the identity, i.e. every basis input at once.
+        """
+        with time_stage(PipelineStage.SIMULATE.value):
+            dimension = 2**number_of_qubits
+
+            if states is None:
+                states = np.eye(dimension, dtype=np.complex128)
+
+            batch = states.shape[1]
+            tensor = states.reshape((2,) * number_of_qubits + (batch,))
+
+            for gate, order in zip(gates, qubit_order):
+                matrix = CirqGateMapper.matrix(gate)
+                arity = matrix.shape[0].bit_length() - 1
+                targets = list(order[:arity])
+
+                if len(set(targets)) != arity or not all(
+                    0 <= t < number_of_qubits for t in targets
+                ):
+                    raise ValueError(f"Invalid qubit order {order} for gate {gate}")
+
+                tensor = NumpyBackend.apply_gate(tensor, matrix, targets)
+
+            return tensor.reshape(dimension, batch)
+
+    @staticmethod
+    def output_states(
+        gates: list[str], qubit_order: list[list[int]], qubits: list[Qubit]
+    ) -> np.ndarray:
+        return NumpyBackend.evolve(gates, qubit_order, len(qubits))
+
+    @staticmethod
+    def extend(
+        states: Optional[np.ndarray],
+        gates: list[str],
+        qubit_order: list[list[int]],
+        qubits: list[Qubit],
+    ) -> np.ndarray:
+        """
+        Apply more gates to a matrix of output states (None for the identity).
+        """
+        return NumpyBackend.evolve(gates, qubit_order, len(qubits), states)
+
+
+class PermutationBackend:
+    """
+    Classical reversible backend: tracks the basis index of every input through
+    X / CNOT / SWAP as integer bit operations, with no complex arithmetic.
+    """
+
+    @staticmethod
+    def output_indices(
+        gates: list[str],
+        qubit_order: list[list[int]],
+        number_of_qubits: int,
+        inputs: Optional[list[int]] = None,
+    ) -> np.ndarray:
+        """
+        Return the output basis index for each input index (every input if None).
+        Qubit q is bit n-1-q of the index (big-endian, qubit 0 first).
+        """
+        with time_stage(PipelineStage.SIMULATE.value):
+            # Python ints once indices no longer fit in an int64
+            dtype = np.int64 if number_of_qubits < 63 else object
+            if inputs is None:
+                indices = np.arange(2**number_of_qubits, dtype=dtype)
+            else:
+                indices = np.array(inputs, dtype=dtype)
+
+            for gate, order in zip(gates, qubit_order):
+                arity = GATE_ARITY[gate]
+                targets = list(order[:arity])
+
+                if len(set(targets)) != arity or not all(
+                    0 <= t < number_of_qubits for t in targets
+                ):
+                    raise ValueError(f"Invalid qubit order {order} for gate {gate}")
+
+                shifts = [number_of_qubits - 1 - t for t in targets]
+
+                if gate == Gate.X.value:
+                    indices ^= 1 << shifts[0]
+                elif gate == Gate.CNOT.value:
+                    control = (indices >> shifts[0]) & 1
+                    indices ^= control << shifts[1]
+                elif gate == Gate.SWAP.value:
+                    differ = ((indices >> shifts[0]) ^ (indices >> shifts[1])) & 1
+                    indices ^= (differ << shifts[0]) | (differ << shifts[1])
+                else:
+                    raise ValueError(f"{gate} is not a permutation gate")
+
+            return indices
+
+
+class MPSBackend:
+    """
+    Tensor-train backend for circuits too wide for dense state vectors: one
+    basis input at a time, with the bond dimension capped at max_bond.
+    """
+
+    @staticmethod
+    def evolve(
+        gates: list[str],
+        qubit_order: list[list[int]],
+        number_of_qubits: int,
+        input_index: int,
+        *,
+        max_bond: int = 64,
+    ) -> MatrixProductState:
+        state = MatrixProductState(number_of_qubits, input_index, max_bond=max_bond)
+
+        for gate, order in zip(gates, qubit_order):
+            arity = GATE_ARITY.get(gate)
+            if arity is None:
+                raise ValueError(f"Unsupported gate: {gate}")
+
+            targets = list(order[:arity])
+            if len(set(targets)) != arity or not all(
+                0 <= t < number_of_qubits for t in targets
+            ):
+                raise ValueError(f"Invalid qubit order {order} for gate {gate}")
+
+            state.apply(gate, targets)
+
+        return state
+
+
+class StabilizerBackend:
+    """
+    Clifford backend: evolves one basis input at a time on a CH-form stabilizer
+    state (Bravyi et al.), which tracks the global phase, and reads back only
+    the nonzero amplitudes of the output.
+    """
+
+    @staticmethod
+    def output_state(
+        circuit: Circuit, qubits: list[Qubit], input_index: int, *, max_terms: int
+    ) -> tuple[list[int], np.ndarray]:
+        """
+        Return the basis indices (ascending) and amplitudes of the output state
+        for one basis input.
+        """
+        import cirq
+
+        simulation_state = cirq.StabilizerChFormSimulationState(
+            qubits=qubits, initial_state=input_index
+        )
+        for operation in circuit.all_operations():
+            cirq.act_on(operation, simulation_state)
+        state = simulation_state.state
+
+        # <y|psi> is nonzero iff u = yF agrees with s outside the Hadamard
+        # positions v, so the support is {uF^-1 : u_j = s_j for j not in v}
+        free = np.flatnonzero(state.v)
+        if 2 ** len(free) > max_terms:
+            raise ValueError(
+                f"Output state has 2^{len(free)} terms, more than the "
+                f"{max_terms} that can be returned"
+            )
+
+        codes = np.arange(2 ** len(free))
+        u = np.tile(state.s, (len(codes), 1))
+        u[:, free] = (codes[:, np.newaxis] >> np.arange(len(free))) & 1
+        y = (u.astype(np.int64) @ _gf2_inverse(state.F).astype(np.int64)) % 2
+
+        indices = sorted(int("".join(map(str, bits)), 2) for bits in y.tolist())
+        amplitudes = np.array(
+            [state.inner_product_of_state_and_x(index) for index in indices],
+            dtype=np.complex128,
+        )
+
+        return indices, amplitudes
+
+
+def _gf2_inverse(matrix: np.ndarray) -> np.ndarray:
+    """
+    Invert a square boolean matrix over GF(2) by Gauss-Jordan elimination.
+    """
+    size = matrix.shape[0]
+    augmented = np.concatenate([matrix.astype(bool), np.eye(size, dtype=bool)], axis=1)
+
+    for column in range(size):
+        pivot = column + int(np.argmax(augmented[column:, column]))
+        if not augmented[pivot, column]:
+            raise ValueError("Matrix is singular over GF(2)")
+        augmented[[column, pivot]] = augmented[[pivot, column]]
+
+        rows = augmented[:, column].copy()
+        rows[column] = False
+        augmented[rows] ^= augmented[column]
+
+    return augmented[:, size:]
+
+
+def evolve_basis_chunk(
+    gates: list[str],
+    qubit_order: list[list[int]],
+    number_of_qubits: int,
+    start: int,
+    stop: int,
+    backend: str,
+    circuit: Optional[Circuit] = None,
+) -> np.ndarray:
+    """
+    Worker task: output states for basis inputs start..stop-1 as a compact
+    (2^n x chunk) complex array, so no Cirq objects cross the process boundary.
+    In-process callers evaluating several chunks can pass the Cirq circuit
+    built once for the gates.
+    """
+    states = np.zeros((2**number_of_qubits, stop - start), dtype=np.complex128)
+    states[np.arange(start, stop), np.arange(stop - start)] = 1
+
+    if backend == SimulationBackend.NUMPY.value:
+        return NumpyBackend.evolve(gates, qubit_order, number_of_qubits, states)
+
+    qubits = initialize_qubit_sequence(number_of_qubits)
+    if circuit is None:
+        circuit = CircuitBuilder.build_circuit_base(gates, qubit_order, qubits)
+
+    return CirqBackend.apply(circuit, qubits, states)
+
+
+SIMULATION_BACKENDS = {
+    SimulationBackend.CIRQ.value: CirqBackend,
+    SimulationBackend.NUMPY.value: NumpyBackend,
+}
@@ -0,0 +1,233 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import struct
+import numpy as np
+from pathlib import Path
+from app.config import target_library
+from app.config.gates import GATE_MATRICES
+from app.config.target_library import TARGET_LIBRARY
+from app.dto.truth_table import TruthTableDTO
+from app.services.target_builder import CompiledTarget, TargetUnitaryBuilder
+from app.settings import Config
+from app.utils.constants import SimulationBackend, TargetLibraryField
+
+
+logger = logging.getLogger(__name__)
+
+# Header: magic, format version, decimals, bytes per amplitude, entry count,
+# library hash, index length
+ARTIFACT_MAGIC = b"QMCBTGT\x00"
+ARTIFACT_VERSION = 1
+ARTIFACT_HEADER = struct.Struct("<8sHBBI32sQ")
+
+# Unitary blocks start on this boundary so each maps as an aligned array
+ARTIFACT_ALIGNMENT = 64
+
+_AMPLITUDE = np.dtype("<c16")
+
+
+def library_hash() -> bytes:
+    """
+    SHA-256 of target_library.py and of what its compiled targets depend on
+    (the resolved library definition and the gate matrices). An artifact
+    carrying a different hash is stale.
+    """
+    digest = hashlib.sha256()
+    digest.update(Path(target_library.__file__).read_bytes())
+    digest.update(json.dumps(TARGET_LIBRARY, sort_keys=True).encode("utf-8"))
+
+    for name in sorted(GATE_MATRICES):
+        digest.update(name.encode("utf-8"))
+        digest.update(np.ascontiguousarray(GATE_MATRICES[name], _AMPLITUDE).tobytes())
+
+    return digest.digest()
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ARTIFACT_ALIGNMENT) * ARTIFACT_ALIGNMENT
+
+
+class TargetArtifact:
+    """
+    The whole target library compiled into one file that worker processes map
+    read-only, so they skip Cirq at startup and share the unitary pages.
+
+    Layout (little-endian):
+        header     magic b"QMCBTGT\\0", format version, truth-table decimals,
+                   bytes per amplitude (16), entry count, SHA-256 library hash,
+                   index length
+        index      UTF-8 JSON list, one entry per target: name, number of
+                   qubits, fingerprint, truth table and the offset of its
+                   unitary from the start of the data section
+        data       starts at the first 64-byte boundary after the index; each
+                   unitary is 2^n x 2^n complex128 in row-major order, also
+                   64-byte aligned
+    """
+
+    @staticmethod
+    def build(
+        path: str,
+        *,
+        decimals: int = 3,
+        backend: str = SimulationBackend.CIRQ.value,
+    ) -> int:
+        """
+        Compile every TARGET_LIBRARY entry and write the artifact to path,
+        replacing any previous file atomically. Returns the number of targets.
+        """
+        TargetUnitaryBuilder.compile_library(decimals=decimals, backend=backend)
+
+        entries: list[dict] = []
+        blocks: list[bytes] = []
+        offset = 0
+
+        for name, level_def in TARGET_LIBRARY.items():
+            compiled = TargetUnitaryBuilder.compile(
+                name,
+                level_def[TargetLibraryField.NUM_QUBITS.value],
+                decimals=decimals,
+                backend=backend,
+            )
+            block = np.ascontiguousarray(compiled.unitary, _AMPLITUDE).tobytes()
+
+            entries.append(
+                {
+                    "name": name,
+                    "number_of_qubits": compiled.number_of_qubits,
+                    "fingerprint": compiled.fingerprint,
+                    "truth_table": compiled.truth_table.to_dict(),
+                    "offset": offset,
+                }
+            )
+            blocks.append(block + bytes(_aligned(len(block)) - len(block)))
+            offset += len(blocks[-1])
+
+        index = json.dumps(entries, separators=(",", ":")).encode("utf-8")
+        header = ARTIFACT_HEADER.pack(
+            ARTIFACT_MAGIC,
+            ARTIFACT_VERSION,
+            decimals,
+            _AMPLITUDE.itemsize,
+            len(entries),
+            library_hash(),
+            len(index),
+        )
+        padding = bytes(_aligned(len(header) + len(index)) - len(header) - len(index))
+
+        temporary = f"{path}.tmp"
+        with open(temporary, "wb") as artifact:
+            artifact.write(header + index + padding)
+            for block in blocks:
+                artifact.write(block)
+        os.replace(temporary, path)
+
+        logger.info(f"Wrote {len(entries)} compiled targets to {path}")
+
+        return len(entries)
+
+    @staticmethod
+    def load(path: str, *, decimals: int = 3) -> bool:
+        """
+        Map a prebuilt artifact and serve its targets from the compiled-target
+        cache. Returns False, leaving the cache untouched, when the artifact is
+        missing, unreadable, built for other decimals, or stale against
+        target_library.py; callers then compile the library instead.
+        """
+        if not path or not os.path.exists(path):
+            logger.info(f"No target artifact at {path!r}; compiling targets")
+            return False
+
+        try:
+            with open(path, "rb") as artifact:
+                header = artifact.read(ARTIFACT_HEADER.size)
+                magic, version, built_decimals, itemsize, count, digest, length = (
+                    ARTIFACT_HEADER.unpack(header)
+                )
+                index = artifact.read(length)
+
+            if magic != ARTIFACT_MAGIC or version != ARTIFACT_VERSION:
+                raise ValueError("bad magic or format version")
+            if itemsize != _AMPLITUDE.itemsize:
+                raise ValueError(f"unsupported amplitude size {itemsize}")
+
+            if digest != library_hash():
+                logger.warning(
+                    f"Target artifact {path} is stale (target library changed); "
+                    f"compiling targets. Rebuild it with `make targets`."
+                )
+                return False
+            if built_decimals != decimals:
+                logger.warning(
+                    f"Target artifact {path} was built for {built_decimals} "
+                    f"decimals, not {decimals}; compiling targets"
+                )
+                return False
+
+            entries = json.loads(index)
+            if len(entries) != count:
+                raise ValueError("index does not match entry count")
+
+            data = np.memmap(path, dtype=np.uint8, mode="r")
+            data_start = _aligned(ARTIFACT_HEADER.size + length)
+            compiled_targets = []
+
+            for entry in entries:
+                dimension = 2 ** entry["number_of_qubits"]
+                start = data_start + entry["offset"]
+                stop = start + dimension * dimension * _AMPLITUDE.itemsize
+                if stop > data.size:
+                    raise ValueError(f"truncated unitary for {entry['name']}")
+
+                # Read-only view of the mapped pages (no copy)
+                unitary = data[start:stop].view(_AMPLITUDE, np.ndarray)
+
+                compiled_targets.append(
+                    CompiledTarget(
+                        entry["name"],
+                        entry["number_of_qubits"],
+                        decimals,
+                        unitary.reshape(dimension, dimension),
+                        TruthTableDTO(**entry["truth_table"]),
+                        entry["fingerprint"],
+                    )
+                )
+
+        except (OSError, ValueError, KeyError, TypeError, struct.error) as e:
+            logger.warning(f"Could not load target artifact {path}: {e}")
+            return False
+
+        for compiled in compiled_targets:
+            TargetUnitaryBuilder.register(compiled)
+
+        logger.info(f"Loaded {len(compiled_targets)} compiled targets from {path}")
+
+        return True
+
+
+def main() -> None:
+    """
+    Build the target artifact: python -m app.services.target_artifact
+    """
+    parser = argparse.ArgumentParser(
+        description="Compile the target library into a memory-mappable artifact."
+    )
+    parser.add_argument("--output", default=Config.TARGET_ARTIFACT_PATH)
+    parser.add_argument("--decimals", type=int, default=Config.TRUTH_TABLE_DECIMALS)
+    parser.add_argument("--backend", default=Config.SIMULATION_BACKEND)
+    args = parser.parse_args()
+
+    if not args.output:
+        parser.error("no output path (set --output or TARGET_ARTIFACT_PATH)")
+
+    count = TargetArtifact.build(
+        args.output, decimals=args.decimals, backend=args.backend
+    )
+    print(f"Wrote {count} targets to {args.output}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -1,8 +1,61 @@
-import cirq
+import hashlib
+import logging
+import numpy as np
+from dataclasses import dataclass
 from app.config.target_library import TARGET_LIBRARY
 from app.config.gates import CirqGateMapper
+from app.dto.truth_table import TruthTableDTO
+from app.services.simulator import CircuitSimulator
+from app.utils.helpers import (
+    get_qubit_order,
+    get_target_gates,
+    initialize_qubit_sequence,
+    validate_target_entry,
+)
 from app.utils.types import Qubit, Circuit
-from app.utils.constants import Gate
+from app.utils.constants import Gate, SimulationBackend, TargetLibraryField
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CompiledTarget:
+    """
+    A target unitary evaluated once: its matrix, formatted truth table and
+    canonical fingerprint.
+    """
+
+    name: str
+    number_of_qubits: int
+    decimals: int
+    unitary: np.ndarray
+    truth_table: TruthTableDTO
+    fingerprint: str
+
+
+# Compiled targets keyed by (name, number_of_qubits, decimals)
+_COMPILED_TARGETS: dict[tuple[str, int, int], CompiledTarget] = {}
+
+# Decimal places kept when fingerprinting a unitary
+FINGERPRINT_DECIMALS = 8
+
+
+def unitary_fingerprint(unitary: np.ndarray) -> str:
+    """
+    SHA-256 of a unitary with its global phase removed (largest entry of the
+    first column made real and positive) and entries rounded, so equivalent
+    circuits share a fingerprint whatever simulator produced them.
+    """
+    pivot = unitary[int(np.argmax(np.abs(unitary[:, 0]))), 0]
+    canonical = unitary * (abs(pivot) / pivot)
+    rounded = np.round(canonical, FINGERPRINT_DECIMALS) + 0j  # drop negative zeros
+
+    digest = hashlib.sha256()
+    digest.update(np.asarray(rounded.shape, dtype="<i8").tobytes())
+    digest.update(np.ascontiguousarray(rounded, dtype="<c16").tobytes())
+
+    return digest.hexdigest()
 
 
 class TargetUnitaryBuilder:
@@ -10,6 +63,7 @@ class TargetUnitaryBuilder:
     @staticmethod
     def build(name: str, qubits: list[Qubit]) -> Circuit:
         """Build target unitary circuit from TARGET_LIBRARY definition."""
+        import cirq
 
         if name not in TARGET_LIBRARY:
             raise ValueError(f"Unknown target unitary: {name}")
@@ -29,10 +83,94 @@ class TargetUnitaryBuilder:
 
         return cirq.Circuit(*operations)
 
+    @staticmethod
+    def compile(
+        name: str,
+        number_of_qubits: int,
+        *,
+        decimals: int = 3,
+        backend: str = SimulationBackend.CIRQ.value,
+        force: bool = False,
+    ) -> CompiledTarget:
+        """
+        Return the compiled unitary and truth table for a target, evaluating it
+        on first use only. Pass force=True to recompute from scratch, bypassing
+        the prefix cache, and refresh the cache.
+        """
+        key = (name, number_of_qubits, decimals)
+
+        if not force and key in _COMPILED_TARGETS:
+            return _COMPILED_TARGETS[key]
+
+        logger.info(f"Compiling target unitary {name} on {number_of_qubits} qubits")
+
+        qubits = initialize_qubit_sequence(number_of_qubits)
+        unitary = CircuitSimulator.output_states(
+            get_target_gates(name),
+            get_qubit_order(name),
+            qubits,
+            backend=backend,
+            use_prefix_cache=not force,
+        )
+        unitary.setflags(write=False)
+
+        truth_table = TruthTableDTO([], [])
+        CircuitSimulator.unitary_truth_table(unitary, truth_table, decimals=decimals)
+
+        compiled = CompiledTarget(
+            name,
+            number_of_qubits,
+            decimals,
+            unitary,
+            truth_table,
+            unitary_fingerprint(unitary),
+        )
+        _COMPILED_TARGETS[key] = compiled
+
+        return compiled
+
+    @staticmethod
+    def register(compiled: CompiledTarget) -> None:
+        """
+        Serve a target compiled elsewhere (e.g. loaded from a prebuilt artifact).
+        """
+        key = (compiled.name, compiled.number_of_qubits, compiled.decimals)
+        _COMPILED_TARGETS[key] = compiled
+
+        return None
+
+    @staticmethod
+    def compile_library(
+        *, decimals: int = 3, backend: str = SimulationBackend.CIRQ.value
+    ) -> None:
+        """
+        Compile every TARGET_LIBRARY entry at its own qubit count.
+        """
+        for name, level_def in TARGET_LIBRARY.items():
+            validate_target_entry(name, level_def)
+            TargetUnitaryBuilder.compile(
+                name,
+                level_def[TargetLibraryField.NUM_QUBITS.value],
+                decimals=decimals,
+                backend=backend,
+            )
+
+        return None
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Drop every compiled target so the next request recomputes it.
+        """
+        _COMPILED_TARGETS.clear()
+
+        return None
+
     # Old Method
     @staticmethod
     def get_unitary(name: str, qubits: list[Qubit]) -> Circuit:
         """Builds and returns a cirq.Circuit for a given unitary name."""
+        import cirq
 
         # Level 2.1: CNOT with flipped control/target
         if name == Gate.CNOT_FLIPPED.value:
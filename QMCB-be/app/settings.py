@@ -26,3 +26,130 @@ class Config:
     VALIDATE_TARGET_CIRCUITS = (
         getenv("VALIDATE_TARGET_CIRCUITS", "true").lower() == "true"
     )
+
+    # Cancel self-inverse gate pairs and merge same-axis rotations in trial
+    # circuits before simulating them
+    OPTIMIZE_CIRCUITS = getenv("OPTIMIZE_CIRCUITS", "true").lower() == "true"
+
+    # Evaluate each circuit once via its unitary instead of one simulation
+    # per basis state. Set to False to fall back to per-state simulation.
+    SINGLE_PASS_UNITARY = getenv("SINGLE_PASS_UNITARY", "true").lower() == "true"
+
+    # Backend for single-pass evaluation: "cirq" (reference) or "numpy"
+    SIMULATION_BACKEND = getenv("SIMULATION_BACKEND", "cirq").lower()
+
+    # Serve target validation from targets compiled once per process.
+    # Set to False to force recomputation on every request (debugging).
+    CACHE_TARGET_UNITARIES = getenv("CACHE_TARGET_UNITARIES", "true").lower() == "true"
+
+    # Compile every TARGET_LIBRARY entry at startup instead of on first use
+    PRECOMPILE_TARGETS = getenv("PRECOMPILE_TARGETS", "true").lower() == "true"
+
+    # Prebuilt target library (`make targets`), memory-mapped at startup instead
+    # of compiling targets; ignored with a warning when stale. Empty disables.
+    TARGET_ARTIFACT_PATH = getenv("TARGET_ARTIFACT_PATH", "targets.qmcb")
+
+    # Decimal places used when formatting truth-table amplitudes
+    TRUTH_TABLE_DECIMALS = int(getenv("TRUTH_TABLE_DECIMALS", "3"))
+
+    # Content-addressed cache of simulate responses (LRU eviction + TTL)
+    RESULT_CACHE_ENABLED = getenv("RESULT_CACHE_ENABLED", "true").lower() == "true"
+    RESULT_CACHE_MAXSIZE = int(getenv("RESULT_CACHE_MAXSIZE", "1024"))
+    RESULT_CACHE_TTL = float(getenv("RESULT_CACHE_TTL", "3600"))
+
+    # Basis inputs evaluated per chunk when streaming NDJSON truth-table rows
+    STREAM_CHUNK_SIZE = int(getenv("STREAM_CHUNK_SIZE", "64"))
+
+    # Amplitude precision of binary (application/vnd.qmcb.states) responses:
+    # "complex128" (lossless) or "complex64" (half the size)
+    STATE_BUFFER_DTYPE = getenv("STATE_BUFFER_DTYPE", "complex128")
+
+    # Absolute tolerance used by check mode (?mode=check) when comparing trial
+    # and target output states up to a global phase
+    CHECK_TOLERANCE = float(getenv("CHECK_TOLERANCE", "1e-6"))
+
+    # Basis inputs compared in check mode's first chunk; each later chunk is
+    # twice as large, so mismatches surface early and matches take few passes
+    CHECK_CHUNK_SIZE = int(getenv("CHECK_CHUNK_SIZE", "8"))
+
+    # Evaluate circuits made only of X, CNOT and SWAP as bit permutations of
+    # the basis indices instead of simulating state vectors
+    PERMUTATION_FAST_PATH = getenv("PERMUTATION_FAST_PATH", "true").lower() == "true"
+
+    # Clifford-only circuits (X, H, S, RX, RY, CNOT, CZ, SWAP) with at least
+    # this many qubits are simulated on stabilizer states instead of dense
+    # state vectors; 0 disables the stabilizer path
+    STABILIZER_MIN_QUBITS = int(getenv("STABILIZER_MIN_QUBITS", "10"))
+
+    # Other circuits with at least this many qubits are simulated as matrix
+    # product states (bond dimension capped at MPS_MAX_BOND) and return the
+    # amplitudes of the requested "outputs" instead of truth tables; 0 disables
+    MPS_MIN_QUBITS = int(getenv("MPS_MIN_QUBITS", "14"))
+    MPS_MAX_BOND = int(getenv("MPS_MAX_BOND", "64"))
+
+    # Permutation/stabilizer/MPS path limits: rows returned when no "inputs" are
+    # selected, and nonzero terms rendered per stabilizer output state
+    TRUTH_TABLE_MAX_ROWS = int(getenv("TRUTH_TABLE_MAX_ROWS", "4096"))
+    STABILIZER_MAX_TERMS = int(getenv("STABILIZER_MAX_TERMS", "1024"))
+
+    # Admission control: request bodies with more qubits or gates than this are
+    # rejected before any circuit is built
+    MAX_QUBITS = int(getenv("MAX_QUBITS", "128"))
+    MAX_GATES = int(getenv("MAX_GATES", "10000"))
+
+    # Estimated cost budget per synchronous simulation, in amplitude updates
+    # (see app/services/cost_model.py) and bytes of state held at once.
+    # Asynchronous jobs get the larger ASYNC_JOB_MAX_COST budget.
+    MAX_SIMULATION_COST = float(getenv("MAX_SIMULATION_COST", "2e9"))
+    MAX_SIMULATION_MEMORY_MB = int(getenv("MAX_SIMULATION_MEMORY_MB", "1024"))
+    ASYNC_JOB_MAX_COST = float(getenv("ASYNC_JOB_MAX_COST", "5e10"))
+
+    # Maximum number of circuits accepted by POST /api/simulate/batch
+    BATCH_MAX_ITEMS = int(getenv("BATCH_MAX_ITEMS", "500"))
+
+    # Asynchronous jobs (POST /api/simulate/jobs): circuits with at least
+    # ASYNC_JOB_MIN_QUBITS qubits or ASYNC_JOB_MIN_GATES gates run on a local
+    # process pool; smaller ones are simulated synchronously.
+    ASYNC_JOB_WORKERS = int(getenv("ASYNC_JOB_WORKERS", "2"))
+    ASYNC_JOB_MIN_QUBITS = int(getenv("ASYNC_JOB_MIN_QUBITS", "6"))
+    ASYNC_JOB_MIN_GATES = int(getenv("ASYNC_JOB_MIN_GATES", "200"))
+    ASYNC_JOB_MAX_STORED = int(getenv("ASYNC_JOB_MAX_STORED", "1000"))
+    ASYNC_JOB_TTL = float(getenv("ASYNC_JOB_TTL", "900"))
+
+    # Worker processes used to fan basis-state chunks of one request out across
+    # cores (0 disables fan-out). Only circuits with at least
+    # PARALLEL_MIN_QUBITS qubits are split; smaller ones run in-process.
+    SIMULATION_WORKERS = int(getenv("SIMULATION_WORKERS", "0"))
+    PARALLEL_MIN_QUBITS = int(getenv("PARALLEL_MIN_QUBITS", "9"))
+
+    # Gate-prefix cache of partial unitaries: a resubmitted circuit resumes from
+    # its longest cached gate prefix instead of resimulating every gate. Holds at
+    # most PREFIX_CACHE_MAX_MB of unitaries (least recently used evicted first)
+    # for circuits of up to PREFIX_CACHE_MAX_QUBITS qubits; 0 MB disables it.
+    # Circuits split across SIMULATION_WORKERS skip it.
+    PREFIX_CACHE_MAX_MB = int(getenv("PREFIX_CACHE_MAX_MB", "256"))
+    PREFIX_CACHE_MAX_QUBITS = int(getenv("PREFIX_CACHE_MAX_QUBITS", "10"))
+
+    # Record per-stage latency metrics (served at /api/metrics)
+    METRICS_ENABLED = getenv("METRICS_ENABLED", "true").lower() == "true"
+
+    # Per-request profiling of POST /api/simulate (off unless PROFILING_ENABLED).
+    # A request is profiled when it sends PROFILE_HEADER: 1, or at random with
+    # probability PROFILE_SAMPLE_RATE; summaries (PROFILE_TOP_N frames by
+    # cumulative time plus frames matching PROFILE_FOCUS) are kept in memory and,
+    # if PROFILE_DIR is set, written there with the raw .prof stats.
+    PROFILING_ENABLED = getenv("PROFILING_ENABLED", "false").lower() == "true"
+    PROFILE_HEADER = getenv("PROFILE_HEADER", "X-QMCB-Profile")
+    PROFILE_SAMPLE_RATE = float(getenv("PROFILE_SAMPLE_RATE", "0"))
+    PROFILE_TOP_N = int(getenv("PROFILE_TOP_N", "25"))
+    PROFILE_FOCUS = tuple(
+        getenv(
+            "PROFILE_FOCUS",
+            "gates.py:apply,sim/simulator.py:simulate,dirac_notation,"
+            "dirac_notation_columns,unitary_protocol.py:unitary,"
+            "services/simulator.py:output_states,services/simulator.py:evolve",
+        ).split(",")
+    )
+    PROFILE_MAX_STORED = int(getenv("PROFILE_MAX_STORED", "200"))
+    PROFILE_TTL = float(getenv("PROFILE_TTL", "86400"))
+    PROFILE_DIR = getenv("PROFILE_DIR", "")
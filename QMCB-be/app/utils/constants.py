@@ -9,15 +9,7 @@ class Basis(Enum):
 
 
 LEVEL2_QUBITS = 2
-TWO_QUBIT_INPUTS = [
-    Basis.STATE_00.value,
-    Basis.STATE_01.value,
-    Basis.STATE_10.value,
-    Basis.STATE_11.value,
-]
-
 LEVEL3_QUBITS = 3
-THREE_QUBIT_INPUTS = ["000", "001", "010", "011", "100", "101", "110", "111"]
 
 
 class Gate(Enum):
@@ -34,6 +26,45 @@ class Gate(Enum):
     SWAP = "SWAP"
 
 
+class SimulationBackend(Enum):
+    CIRQ = "cirq"
+    NUMPY = "numpy"
+
+
+class SimulationEngine(Enum):
+    DENSE = "dense"
+    PERMUTATION = "permutation"
+    STABILIZER = "stabilizer"
+    MPS = "mps"
+
+
+class PipelineStage(Enum):
+    PARSE = "parse"
+    OPTIMIZE = "optimize"
+    CONSTRUCT = "construct"
+    SIMULATE = "simulate"
+    FORMAT = "format"
+    SERIALIZE = "serialize"
+
+
+class JobStatus(Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class SimulationMode(Enum):
+    TABLE = "table"
+    CHECK = "check"
+
+
+class MimeType(Enum):
+    JSON = "application/json"
+    NDJSON = "application/x-ndjson"
+    STATES = "application/vnd.qmcb.states"
+
+
 class TargetLibraryField(Enum):
     NUM_QUBITS = "num_qubits"
     STEPS = "steps"
@@ -53,6 +84,7 @@ class HttpStatus(Enum):
     NOT_FOUND = 404
     METHOD_NOT_ALLOWED = 405
     CONFLICT = 409
+    UNPROCESSABLE_ENTITY = 422
     INTERNAL_SERVER_ERROR = 500
     NOT_IMPLEMENTED = 501
     BAD_GATEWAY = 502
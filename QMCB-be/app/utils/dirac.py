@@ -0,0 +1,138 @@
+import functools
+import numpy as np
+
+
+# Real amplitude rendered as '{:.Ng}', imaginary as '{:.Ng}j', both as '({:.Ng})'
+_REAL, _IMAG, _COMPLEX, _ONE = range(4)
+
+
+@functools.lru_cache(maxsize=None)
+def _ket_labels(number_of_qubits: int) -> tuple[str, ...]:
+    """
+    Returns the basis kets '|00⟩', '|01⟩', ... in big-endian order.
+    """
+    return tuple(
+        "|" + format(index, f"0{number_of_qubits}b") + "⟩" if number_of_qubits else "|⟩"
+        for index in range(2**number_of_qubits)
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _render_amplitude(
+    kind: int, real: float, imag: float, dtype: str, decimals: int
+) -> str:
+    """
+    Renders a single rounded amplitude exactly as cirq.dirac_notation does.
+    Memoized, since circuits keep producing the same few amplitudes (±1, ±0.707, ...).
+    """
+    scalar = np.dtype(dtype).type
+    if kind == _ONE:
+        return ""
+    if kind == _REAL:
+        return ("{:." + str(decimals) + "g}").format(scalar(real))
+    if kind == _IMAG:
+        return ("{:." + str(decimals) + "g}j").format(scalar(imag))
+    value = scalar(real) + 1j * scalar(imag)
+    return ("({:." + str(decimals) + "g})").format(value)
+
+
+def _classify(
+    states: np.ndarray, decimals: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Rounds amplitudes the way cirq.dirac_notation does and returns the rounded
+    real and imaginary parts, the nonzero mask and the rendering kind of each.
+    """
+    real = np.round(states.real, decimals)
+    imag = np.round(states.imag, decimals)
+    real_nonzero = np.round(real, decimals) != 0
+    imag_nonzero = np.round(imag, decimals) != 0
+
+    kind = np.full(states.shape, _COMPLEX, dtype=np.int8)
+    kind[~real_nonzero & imag_nonzero] = _IMAG
+    kind[real_nonzero & ~imag_nonzero] = _REAL
+    kind[(real == 1) & (imag == 0)] = _ONE
+
+    return real, imag, real_nonzero | imag_nonzero, kind
+
+
+def dirac_notation_columns(states: np.ndarray, decimals: int = 2) -> list[str]:
+    """
+    Renders every column of a (2^n x batch) state matrix in Dirac notation.
+    Output is identical to calling cirq.dirac_notation on each column, but the
+    rounding and thresholding run over the whole matrix in NumPy and each
+    distinct amplitude is formatted once.
+    """
+    states = np.asarray(states)
+    if states.ndim == 1:
+        states = states[:, np.newaxis]
+
+    dimension, batch = states.shape
+    number_of_qubits = dimension.bit_length() - 1
+    if dimension != 2**number_of_qubits:
+        raise ValueError(f"state has incorrect size: {dimension} is not a power of 2")
+
+    real, imag, nonzero, kind = _classify(states, decimals)
+
+    # Transposed so the nonzero terms come out grouped per column, in basis order
+    columns, rows = np.nonzero(nonzero.T)
+    term_kind = kind.T[columns, rows]
+    term_real = real.T[columns, rows]
+    term_imag = imag.T[columns, rows]
+
+    kets = _ket_labels(number_of_qubits)
+    dtype = real.dtype.str
+    bounds = np.searchsorted(columns, np.arange(batch + 1))
+
+    rendered: list[str] = []
+    for column in range(batch):
+        start, stop = bounds[column], bounds[column + 1]
+        if start == stop:
+            rendered.append("0")
+            continue
+        terms = [
+            _render_amplitude(k, r, i, dtype, decimals) + kets[row]
+            for k, r, i, row in zip(
+                term_kind[start:stop].tolist(),
+                term_real[start:stop].tolist(),
+                term_imag[start:stop].tolist(),
+                rows[start:stop].tolist(),
+            )
+        ]
+        rendered.append(" + ".join(terms).replace(" + -", " - "))
+
+    return rendered
+
+
+def dirac_notation(state: np.ndarray, decimals: int = 2) -> str:
+    """
+    Renders a single state vector in Dirac notation (see dirac_notation_columns).
+    """
+    return dirac_notation_columns(np.asarray(state)[:, np.newaxis], decimals)[0]
+
+
+def dirac_notation_sparse(
+    indices: list[int], amplitudes: np.ndarray, number_of_qubits: int, decimals: int = 2
+) -> str:
+    """
+    Renders a state given only its (possibly) nonzero amplitudes, for states too
+    wide to hold densely. indices are big-endian basis indices in ascending order.
+    Output matches dirac_notation on the equivalent dense vector.
+    """
+    real, imag, nonzero, kind = _classify(np.asarray(amplitudes), decimals)
+    dtype = real.dtype.str
+
+    terms = [
+        _render_amplitude(k, r, i, dtype, decimals)
+        + "|"
+        + format(index, f"0{number_of_qubits}b")
+        + "⟩"
+        for index, k, r, i, keep in zip(
+            indices, kind.tolist(), real.tolist(), imag.tolist(), nonzero.tolist()
+        )
+        if keep
+    ]
+    if not terms:
+        return "0"
+
+    return " + ".join(terms).replace(" + -", " - ")
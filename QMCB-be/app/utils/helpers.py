@@ -1,8 +1,9 @@
-import cirq
+import numpy as np
 from app.config.gates import CirqGateMapper
 from app.config.target_library import TARGET_LIBRARY
 from app.utils.types import Qubit, Operation, Result, WavefunctionResult
-from app.utils.constants import Gate, TargetLibraryField, TWO_QUBIT_INPUTS
+from app.utils.constants import Gate, TargetLibraryField
+from typing import Any, Iterator
 from app.dto.truth_table import TruthTableDTO
 
 
@@ -11,6 +12,8 @@ def initialize_qubit_sequence(number_of_qubits: int) -> list[Qubit]:
     Creates a linear sequence of n qubits and returns list of callable
     qubits in sequential order.
     """
+    import cirq
+
     qubit_sequence: list[Qubit] = []
 
     for n in range(number_of_qubits):
@@ -19,12 +22,41 @@ def initialize_qubit_sequence(number_of_qubits: int) -> list[Qubit]:
     return qubit_sequence
 
 
-def generate_basis_states(n_qubits: int) -> list[list[int]]:
+def generate_basis_states(n_qubits: int) -> Iterator[list[int]]:
+    """
+    Lazily yields every basis state for a given number of qubits, one at a time.
+    Example sequence: [0, 0], [0, 1], [1, 0], [1, 1]
+    """
+    for index in range(2**n_qubits):
+        yield basis_state(index, n_qubits)
+
+
+def basis_state(index: int, n_qubits: int) -> list[int]:
+    """
+    Returns the bits of the basis state at a given index (qubit 0 first).
+    Example: basis_state(2, 2) --> [1, 0]
+    """
+    return [(index >> (n_qubits - 1 - q)) & 1 for q in range(n_qubits)]
+
+
+def basis_label(index: int, n_qubits: int) -> str:
     """
-    Generates list of all possible basis states for a given number of qubits.
-    Example format: [[0, 0], [0, 1], [1, 0], [1, 1]]
+    Returns the bit string of the basis state at a given index.
+    Example: basis_label(2, 2) --> "10"
     """
-    return [list(map(int, format(i, f"0{n_qubits}b"))) for i in range(2**n_qubits)]
+    return format(index, f"0{n_qubits}b")
+
+
+def basis_labels(indices: np.ndarray, n_qubits: int) -> list[str]:
+    """
+    Vectorized basis_label for an array of indices.
+    Example: basis_labels(np.array([2, 3]), 2) --> ["10", "11"]
+    """
+    shifts = np.arange(n_qubits - 1, -1, -1)
+    bits = (np.asarray(indices)[:, np.newaxis] >> shifts) & 1
+    characters = (bits.astype(np.uint8) + ord("0")).view(f"S{max(n_qubits, 1)}")
+
+    return characters.ravel().astype(str).tolist()
 
 
 def set_qubit_to_1(qubit: Qubit) -> Operation:
@@ -113,16 +145,42 @@ def build_target_truth_table(
         raise ValueError(f"Target '{target_name}' not found in TARGET_LIBRARY")
 
     target_info = TARGET_LIBRARY[target_name]
-    inputs = TWO_QUBIT_INPUTS
+    validate_target_entry(target_name, target_info)
+
+    num_qubits = target_info[TargetLibraryField.NUM_QUBITS.value]
     outputs = target_info[TargetLibraryField.EXPECTED_OUTPUTS.value]
 
-    for inp, out in zip(inputs, outputs):
-        target_truth_table.input.append(inp)
+    for index, out in enumerate(outputs):
+        target_truth_table.input.append(basis_label(index, num_qubits))
         target_truth_table.output.append(out)
 
     return None
 
 
+def validate_target_entry(target_name: str, target_info: dict[str, Any]) -> None:
+    """
+    Checks that a target's stored expected outputs cover every basis state of
+    its qubit count, with one bit per qubit.
+    """
+    num_qubits = target_info[TargetLibraryField.NUM_QUBITS.value]
+    outputs = target_info[TargetLibraryField.EXPECTED_OUTPUTS.value]
+
+    if len(outputs) != 2**num_qubits:
+        raise ValueError(
+            f"Target '{target_name}' has {len(outputs)} expected outputs, "
+            f"expected {2**num_qubits} for {num_qubits} qubits"
+        )
+
+    for out in outputs:
+        if len(out) != num_qubits or set(out) - {"0", "1"}:
+            raise ValueError(
+                f"Target '{target_name}' has invalid expected output '{out}' "
+                f"for {num_qubits} qubits"
+            )
+
+    return None
+
+
 # Might not need this anymore but keeping for now
 def extract_results(number_of_qubits: int, result: Result) -> str:
     """
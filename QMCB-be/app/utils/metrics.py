@@ -0,0 +1,247 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+# Latency buckets (seconds) shared by every stage histogram
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Estimated-cost buckets (amplitude updates, see app/services/cost_model.py)
+COST_BUCKETS = tuple(10.0**k for k in range(3, 13))
+
+# Labels describing the request currently being served (qubit count, target)
+_request_labels: ContextVar[dict[str, str]] = ContextVar("request_labels", default={})
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class Counter:
+    """
+    Monotonic counter with a fixed set of label names.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} counter",
+        ]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}{labels} {value:g}")
+        return lines
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram with a fixed set of label names.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        # Per label set: [bucket counts..., +Inf count], sum
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+        self._sums: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[index] += 1
+            self._sums[key] += value
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        bucket_names = self.labelnames + ("le",)
+        with self._lock:
+            for key, counts in sorted(self._counts.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    labels = _format_labels(bucket_names, key + (le,))
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {self._sums[key]:.6f}")
+                lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Process-local registry rendering its metrics in Prometheus text format.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: list = []
+        self.enabled = True
+
+    def counter(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "qmcb_simulate_stage_seconds",
+    "Time spent in each stage of the simulate pipeline.",
+    ("stage", "qubits", "target"),
+)
+REQUEST_SECONDS = REGISTRY.histogram(
+    "qmcb_simulate_request_seconds",
+    "End-to-end time spent serving a simulate request.",
+    ("endpoint", "qubits", "target"),
+)
+REQUESTS_TOTAL = REGISTRY.counter(
+    "qmcb_simulate_requests_total",
+    "Simulate requests served, by HTTP status.",
+    ("endpoint", "status", "qubits", "target"),
+)
+RESULT_CACHE_TOTAL = REGISTRY.counter(
+    "qmcb_result_cache_requests_total",
+    "Result cache lookups, by outcome.",
+    ("result",),
+)
+PREFIX_CACHE_TOTAL = REGISTRY.counter(
+    "qmcb_prefix_cache_requests_total",
+    "Gate-prefix unitary cache lookups, by outcome.",
+    ("result",),
+)
+PREFIX_CACHE_GATES = REGISTRY.counter(
+    "qmcb_prefix_cache_gates_total",
+    "Gates served from a cached prefix (reused) or simulated (applied).",
+    ("kind",),
+)
+ESTIMATED_COST = REGISTRY.histogram(
+    "qmcb_simulate_estimated_cost",
+    "Estimated cost of admitted and rejected simulate requests, by engine.",
+    ("endpoint", "engine", "qubits", "target"),
+    buckets=COST_BUCKETS,
+)
+ADMISSION_TOTAL = REGISTRY.counter(
+    "qmcb_simulate_admission_total",
+    "Admission-control decisions, by outcome and engine.",
+    ("endpoint", "decision", "engine"),
+)
+PROFILES_TOTAL = REGISTRY.counter(
+    "qmcb_simulate_profiles_total",
+    "Profiled simulate requests, by trigger and outcome.",
+    ("trigger", "outcome"),
+)
+
+
+def bind_request_labels(
+    number_of_qubits: Optional[int] = None, target: Optional[str] = None
+) -> None:
+    """
+    Attach the qubit count and target of the current request to every stage
+    timing recorded while serving it.
+    """
+    _request_labels.set(
+        {
+            "qubits": "" if number_of_qubits is None else str(number_of_qubits),
+            "target": "" if target is None else str(target),
+        }
+    )
+
+
+def request_labels() -> dict[str, str]:
+    """
+    Return the labels bound to the current request.
+    """
+    return _request_labels.get()
+
+
+@contextmanager
+def time_stage(stage: str) -> Iterator[None]:
+    """
+    Record the wall time of a pipeline stage under the current request labels.
+    """
+    if not REGISTRY.enabled:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.observe(
+            time.perf_counter() - start, stage=stage, **_request_labels.get()
+        )
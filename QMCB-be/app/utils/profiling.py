@@ -0,0 +1,130 @@
+import cProfile
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+
+# cProfile hooks are process-wide, so only one request is profiled at a time
+_profiler_lock = threading.Lock()
+
+# Path prefixes stripped from frame locations (site-packages, then the app root)
+_PATH_PREFIXES = sorted(
+    {p for p in sys.path if p and os.path.isdir(p)} | {os.getcwd()},
+    key=len,
+    reverse=True,
+)
+
+
+def profile_trigger(
+    header_value: Optional[str], *, enabled: bool, sample_rate: float
+) -> Optional[str]:
+    """
+    Decide whether to profile the current request: "header" when the client
+    asked for it, "sampled" when drawn at sample_rate, otherwise None.
+    """
+    if not enabled:
+        return None
+    if header_value is not None and header_value.lower() in ("1", "true", "yes"):
+        return "header"
+    if sample_rate > 0 and random.random() < sample_rate:
+        return "sampled"
+    return None
+
+
+class RequestProfile:
+    """
+    Deterministic (cProfile) profile of one request. `summary` is filled in
+    when the profiled block exits; it stays None if another request already
+    held the profiler.
+    """
+
+    def __init__(self) -> None:
+        self.profiler: Optional[cProfile.Profile] = None
+        self.summary: Optional[dict[str, Any]] = None
+
+
+@contextmanager
+def profile_request(
+    *, top_n: int = 25, focus: tuple[str, ...] = ()
+) -> Iterator[RequestProfile]:
+    """
+    Run the enclosed block under cProfile and summarize the top top_n frames
+    by cumulative time, plus every frame matching one of the focus patterns.
+    """
+    profile = RequestProfile()
+
+    if not _profiler_lock.acquire(blocking=False):
+        yield profile
+        return
+
+    try:
+        profile.profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profile.profiler.enable()
+        try:
+            yield profile
+        finally:
+            profile.profiler.disable()
+            elapsed = time.perf_counter() - start
+    finally:
+        _profiler_lock.release()
+
+    profile.summary = summarize(profile.profiler, elapsed, top_n=top_n, focus=focus)
+
+
+def summarize(
+    profiler: cProfile.Profile,
+    elapsed: float,
+    *,
+    top_n: int = 25,
+    focus: tuple[str, ...] = (),
+) -> dict[str, Any]:
+    """
+    Reduce a profile to JSON: wall time, call count, the top_n frames by
+    cumulative time and the frames matching focus patterns ("func" or
+    "path-fragment:func", e.g. "gates.py:apply").
+    """
+    stats = pstats.Stats(profiler).stats  # type: ignore[attr-defined]
+    frames = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)
+
+    return {
+        "wall_s": elapsed,
+        "calls": sum(nc for _, nc, _, _, _ in stats.values()),
+        "top": [_frame(key, value) for key, value in frames[:top_n]],
+        "focus": [_frame(key, value) for key, value in frames if _matches(key, focus)],
+    }
+
+
+def _frame(key: tuple[str, int, str], value: tuple) -> dict[str, Any]:
+    filename, line, function = key
+    primitive_calls, calls, tottime, cumtime, _ = value
+
+    return {
+        "function": function,
+        "location": f"{_short_path(filename)}:{line}" if line else filename,
+        "calls": calls,
+        "primitive_calls": primitive_calls,
+        "tottime_s": tottime,
+        "cumtime_s": cumtime,
+    }
+
+
+def _matches(key: tuple[str, int, str], focus: tuple[str, ...]) -> bool:
+    filename, _, function = key
+    for pattern in focus:
+        fragment, _, name = pattern.rpartition(":")
+        if function == name and fragment in filename.replace(os.sep, "/"):
+            return True
+    return False
+
+
+def _short_path(filename: str) -> str:
+    for prefix in _PATH_PREFIXES:
+        if filename.startswith(prefix + os.sep):
+            return filename[len(prefix) + 1 :].replace(os.sep, "/")
+    return filename
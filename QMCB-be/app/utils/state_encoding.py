@@ -0,0 +1,73 @@
+import struct
+import numpy as np
+from typing import Optional
+
+
+# Header: magic, format version, number of qubits, bytes per amplitude, flags
+STATES_MAGIC = b"QMCB"
+STATES_VERSION = 1
+STATES_HEADER = struct.Struct("<4sBBBB")
+
+# Flag bits
+HAS_TARGET = 0x01
+
+_DTYPES = {8: np.dtype("<c8"), 16: np.dtype("<c16")}
+
+
+def encode_states(
+    trial_states: np.ndarray,
+    target_states: Optional[np.ndarray] = None,
+    *,
+    dtype: str = "complex128",
+) -> bytes:
+    """
+    Pack trial (and optionally target) output states into a compact binary buffer.
+
+    Layout (little-endian):
+        8-byte header  magic b"QMCB", version, number of qubits,
+                       bytes per amplitude (8 = complex64, 16 = complex128), flags
+        trial states   2^n x 2^n amplitudes, one output state per basis input
+                       (row j of the buffer is the output for input j)
+        target states  same layout, present when flags & HAS_TARGET
+    """
+    amplitude = np.dtype(dtype).newbyteorder("<")
+    if amplitude.itemsize not in _DTYPES:
+        raise ValueError(f"Unsupported amplitude dtype: {dtype}")
+
+    dimension = trial_states.shape[0]
+    number_of_qubits = dimension.bit_length() - 1
+    flags = HAS_TARGET if target_states is not None else 0
+
+    parts = [
+        STATES_HEADER.pack(
+            STATES_MAGIC, STATES_VERSION, number_of_qubits, amplitude.itemsize, flags
+        ),
+        np.ascontiguousarray(trial_states.T, dtype=amplitude).tobytes(),
+    ]
+    if target_states is not None:
+        parts.append(np.ascontiguousarray(target_states.T, dtype=amplitude).tobytes())
+
+    return b"".join(parts)
+
+
+def decode_states(payload: bytes) -> tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Unpack a buffer written by encode_states into (trial, target) state matrices,
+    with column j holding the output state for basis input j.
+    """
+    magic, version, number_of_qubits, itemsize, flags = STATES_HEADER.unpack_from(
+        payload
+    )
+    if magic != STATES_MAGIC or version != STATES_VERSION:
+        raise ValueError("Not a QMCB states buffer (bad magic or version)")
+
+    dimension = 2**number_of_qubits
+    amplitudes = np.frombuffer(
+        payload, dtype=_DTYPES[itemsize], offset=STATES_HEADER.size
+    )
+    matrices = amplitudes.reshape(-1, dimension, dimension).transpose(0, 2, 1)
+
+    trial_states = matrices[0]
+    target_states = matrices[1] if flags & HAS_TARGET else None
+
+    return trial_states, target_states
@@ -1,11 +1,17 @@
-import cirq
-from typing import TypedDict, List, Union
-
-Qubit = Union[cirq.Qid, cirq.LineQubit, cirq.GridQubit]
-Circuit = cirq.Circuit
-Operation = cirq.Operation
-Result = cirq.Result
-WavefunctionResult = cirq.StateVectorTrialResult
+from typing import TYPE_CHECKING, Any, TypedDict, List, Union
+
+# Cirq types are only needed by the type checker; at runtime they are Any so
+# importing this module (and everything annotated with it) never imports Cirq
+if TYPE_CHECKING:
+    import cirq
+
+    Qubit = Union[cirq.Qid, cirq.LineQubit, cirq.GridQubit]
+    Circuit = cirq.Circuit
+    Operation = cirq.Operation
+    Result = cirq.Result
+    WavefunctionResult = cirq.StateVectorTrialResult
+else:
+    Qubit = Circuit = Operation = Result = WavefunctionResult = Any
 
 
 class TargetLibraryEntry(TypedDict):
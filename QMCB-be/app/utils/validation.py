@@ -0,0 +1,96 @@
+from app.config.gates import GATE_ARITY
+from app.config.target_library import TARGET_LIBRARY
+from app.utils.constants import SimulationMode
+from typing import Any
+
+
+def validate_unitary_info(
+    unitary_info: Any, *, max_qubits: int, max_gates: int
+) -> list[str]:
+    """
+    Cheap structural check of a simulate request body, run before any DTO or
+    circuit is built. Returns a list of problems (empty when the body is valid).
+    """
+    if not isinstance(unitary_info, dict):
+        return ["Request body must be a JSON object"]
+
+    errors: list[str] = []
+
+    number_of_qubits = unitary_info.get("number_of_qubits")
+    if not _is_int(number_of_qubits) or not 1 <= number_of_qubits <= max_qubits:
+        errors.append(f"'number_of_qubits' must be an integer from 1 to {max_qubits}")
+        number_of_qubits = None
+
+    target = unitary_info.get("target_unitary")
+    if not isinstance(target, str) or target not in TARGET_LIBRARY:
+        errors.append(f"'target_unitary' must be one of {sorted(TARGET_LIBRARY)}")
+
+    gates = unitary_info.get("gates")
+    qubit_order = unitary_info.get("qubit_order")
+
+    if not isinstance(gates, list):
+        errors.append("'gates' must be a list of gate names")
+        gates = None
+    elif len(gates) > max_gates:
+        errors.append(f"'gates' has {len(gates)} entries, the limit is {max_gates}")
+        gates = None
+    else:
+        unknown = sorted(
+            {str(g) for g in gates if not isinstance(g, str) or g not in GATE_ARITY}
+        )
+        if unknown:
+            errors.append(
+                f"Unknown gates {unknown}; expected one of {sorted(GATE_ARITY)}"
+            )
+            gates = None
+
+    if not isinstance(qubit_order, list):
+        errors.append("'qubit_order' must be a list of qubit index lists")
+    elif gates is not None:
+        if len(qubit_order) != len(gates):
+            errors.append(
+                f"'qubit_order' has {len(qubit_order)} entries for {len(gates)} gates"
+            )
+        else:
+            for position, (gate, order) in enumerate(zip(gates, qubit_order)):
+                problem = _check_targets(gate, order, number_of_qubits)
+                if problem:
+                    errors.append(f"'qubit_order[{position}]' ({gate}): {problem}")
+                    break
+
+    for field in ("inputs", "outputs"):
+        selected = unitary_info.get(field)
+        if selected is not None and not isinstance(selected, list):
+            errors.append(f"'{field}' must be a list of bit strings")
+
+    mode = unitary_info.get("mode")
+    modes = [m.value for m in SimulationMode]
+    if mode is not None and str(mode).lower() not in modes:
+        errors.append(f"'mode' must be one of {modes}")
+
+    return errors
+
+
+def _check_targets(gate: str, order: Any, number_of_qubits: Any) -> str:
+    """
+    Describe what is wrong with the qubits a gate acts on, or return "".
+    """
+    arity = GATE_ARITY[gate]
+    if not isinstance(order, list) or len(order) < arity:
+        return f"expected a list of at least {arity} qubit indices"
+
+    targets = order[:arity]
+    if not all(_is_int(q) for q in targets):
+        return "qubit indices must be integers"
+    if len(set(targets)) < arity:
+        return "a gate cannot act on the same qubit twice"
+    if number_of_qubits is not None and not all(
+        0 <= q < number_of_qubits for q in targets
+    ):
+        return f"qubit indices must be between 0 and {number_of_qubits - 1}"
+
+    return ""
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
@@ -0,0 +1,111 @@
+"""
+Cold-start benchmark: how long a fresh worker takes to import the app and
+answer its first requests.
+
+Every run starts a new interpreter, so nothing is shared between runs.
+Reported per run, and as medians:
+    import_cirq_s        `import cirq` alone (the cost the app now defers)
+    import_app_s         `from app.main import app`, including target startup
+    cirq_loaded_at_start whether startup imported Cirq anyway
+    first_health_s       first GET /api/health
+    first_simulate_s     first POST /api/simulate (pays the lazy Cirq import
+                         when the selected engine needs it)
+    warm_simulate_s      the same request again
+    time_to_first_s      import_app_s + first_health_s
+
+Usage (from QMCB-be):
+    PYTHONPATH=. python benchmarks/cold_start.py [--runs 5] [--output FILE]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+_IMPORT_CIRQ = """
+import json, time
+start = time.perf_counter()
+import cirq  # noqa: F401
+print(json.dumps({"import_cirq_s": time.perf_counter() - start}))
+"""
+
+_COLD_START = """
+import json, logging, sys, time
+start = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+logging.disable(logging.CRITICAL)
+cirq_loaded_at_start = "cirq" in sys.modules
+
+client = app.test_client()
+body = {
+    "target_unitary": "SWAP",
+    "number_of_qubits": 2,
+    "gates": ["CNOT", "CNOT", "CNOT"],
+    "qubit_order": [[0, 1], [1, 0], [0, 1]],
+}
+
+t0 = time.perf_counter()
+assert client.get("/api/health").status_code == 200
+t1 = time.perf_counter()
+assert client.post("/api/simulate", json=body).status_code == 200
+t2 = time.perf_counter()
+body["gates"] = ["CNOT", "H", "CNOT"]
+assert client.post("/api/simulate", json=body).status_code == 200
+t3 = time.perf_counter()
+
+print(json.dumps({
+    "import_app_s": imported - start,
+    "cirq_loaded_at_start": cirq_loaded_at_start,
+    "first_health_s": t1 - t0,
+    "first_simulate_s": t2 - t1,
+    "warm_simulate_s": t3 - t2,
+    "time_to_first_s": imported - start + t1 - t0,
+}))
+"""
+
+
+def _run(code: str) -> dict:
+    """
+    Run a snippet in a fresh interpreter and parse the JSON it prints last.
+    """
+    env = {**os.environ, "PYTHONPATH": os.environ.get("PYTHONPATH", ".")}
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="also write the results as JSON here")
+    args = parser.parse_args()
+
+    runs = [{**_run(_IMPORT_CIRQ), **_run(_COLD_START)} for _ in range(args.runs)]
+    median = {
+        key: statistics.median(run[key] for run in runs)
+        for key in runs[0]
+        if key.endswith("_s")
+    }
+    median["cirq_loaded_at_start"] = any(run["cirq_loaded_at_start"] for run in runs)
+
+    for key, value in median.items():
+        print(
+            f"{key:>22}  {value:.4f}" if key.endswith("_s") else f"{key:>22}  {value}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump({"runs": runs, "median": median}, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+"""
+Load generator that replays classroom traffic against the real app.
+
+Simulated students pick a level from TARGET_LIBRARY and submit either its
+correct circuit or a plausible wrong attempt (a dropped, replaced, reversed
+or extra gate). Traffic follows a sequence of phases:
+    burst:N           N requests released at the same instant
+                      ("30 students click Check Solution at once")
+    steady:RATE:SECS  open-loop arrivals at RATE requests/s for SECS seconds
+    idle:SECS         no traffic
+
+Requests are spread over endpoints by weight (--mix):
+    simulate    POST /api/simulate (truth tables)
+    check       POST /api/simulate with "mode": "check"
+    batch       POST /api/simulate/batch with several attempts at one level
+    jobs        POST /api/simulate/jobs, polling the job until it finishes
+    health      GET /api/health
+
+Latency runs from when a request is due to when its response arrives, so
+time spent queued behind busy workers counts. Reported per endpoint:
+requests, throughput, error rate (non-2xx or connection failures), status
+codes and p50/p95/p99/max latency.
+
+Without --url the app runs in-process through the Flask test client, using
+the configuration from the environment (see app/settings.py). With --url it
+drives a served app, e.g. `make run` or gunicorn, so server configurations
+can be compared. Everything uses the standard library and runs offline.
+
+Usage (from QMCB-be):
+    PYTHONPATH=. python benchmarks/load_test.py [--url http://127.0.0.1:5000] \\
+        [--phase burst:30 --phase steady:5:10] [--mix simulate=6,check=3,health=1] \\
+        [--correct-ratio 0.3] [--levels SWAP,CONTROLLED_Z] [--output FILE]
+"""
+
+import argparse
+import json
+import logging
+import platform
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+
+DEFAULT_PHASES = ["burst:30", "idle:2", "steady:5:10", "burst:30"]
+DEFAULT_MIX = "simulate=6,check=3,batch=1,jobs=1,health=1"
+
+# Attempts per batch request, and how often jobs are polled (seconds)
+BATCH_SIZE = 4
+JOB_POLL_INTERVAL = 0.05
+JOB_TIMEOUT = 60.0
+
+Transport = Callable[[str, str, Optional[dict]], tuple[int, Any]]
+
+
+def _parse_phase(value: str) -> tuple[str, float, float]:
+    """
+    "burst:30" -> ("burst", 30, 0); "steady:5:10" -> ("steady", 5, 10);
+    "idle:2" -> ("idle", 0, 2)
+    """
+    kind, _, rest = value.partition(":")
+    numbers = [float(n) for n in rest.split(":") if n]
+
+    if kind == "burst" and len(numbers) == 1:
+        return kind, numbers[0], 0.0
+    if kind == "steady" and len(numbers) == 2:
+        return kind, numbers[0], numbers[1]
+    if kind == "idle" and len(numbers) == 1:
+        return kind, 0.0, numbers[0]
+
+    raise argparse.ArgumentTypeError(
+        f"bad phase {value!r}; use burst:N, steady:RATE:SECS or idle:SECS"
+    )
+
+
+def _parse_mix(value: str) -> dict[str, float]:
+    """
+    "simulate=6,health=1" -> {"simulate": 6.0, "health": 1.0}
+    """
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(
+                f"unknown endpoint {name!r}; expected one of {sorted(ENDPOINTS)}"
+            )
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not sorted_values:
+        return float("nan")
+    rank = max(1, round(fraction * len(sorted_values) + 0.5))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class Classroom:
+    """
+    Generates student submissions for the levels in TARGET_LIBRARY.
+    """
+
+    def __init__(self, levels: list[str], correct_ratio: float, seed: int):
+        from app.config.gates import GATE_ARITY
+        from app.config.target_library import TARGET_LIBRARY
+        from app.utils.constants import TargetLibraryField
+        from app.utils.helpers import get_qubit_order, get_target_gates
+
+        self.gate_arity = GATE_ARITY
+        self.correct_ratio = correct_ratio
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.solutions = {
+            level: (
+                TARGET_LIBRARY[level][TargetLibraryField.NUM_QUBITS.value],
+                get_target_gates(level),
+                get_qubit_order(level),
+            )
+            for level in levels
+        }
+
+    def attempt(self, level: Optional[str] = None) -> dict:
+        """
+        One submission: the level's solution, or a wrong attempt at it.
+        """
+        with self.lock:
+            level = level or self.rng.choice(sorted(self.solutions))
+            number_of_qubits, gates, qubit_order = self.solutions[level]
+            gates, qubit_order = list(gates), [list(q) for q in qubit_order]
+
+            if self.rng.random() >= self.correct_ratio:
+                self._mistake(number_of_qubits, gates, qubit_order)
+
+        return {
+            "target_unitary": level,
+            "number_of_qubits": number_of_qubits,
+            "gates": gates,
+            "qubit_order": qubit_order,
+        }
+
+    def _mistake(
+        self, number_of_qubits: int, gates: list[str], qubit_order: list[list[int]]
+    ) -> None:
+        """
+        Turn a solution into a typical wrong attempt, in place.
+        """
+        position = self.rng.randrange(len(gates))
+        mistake = self.rng.choice(("drop", "replace", "reverse", "extra"))
+
+        if mistake == "drop" and len(gates) > 1:
+            del gates[position], qubit_order[position]
+
+        elif mistake == "reverse" and self.gate_arity[gates[position]] > 1:
+            qubit_order[position].reverse()
+
+        elif mistake == "replace":
+            # Single-qubit orders repeat their wire ([q, q]), so keep the arity
+            arity = self.gate_arity[gates[position]]
+            gates[position] = self.rng.choice(
+                [g for g in sorted(self.gate_arity) if self.gate_arity[g] == arity]
+            )
+
+        else:
+            gate = self.rng.choice(
+                [
+                    g
+                    for g in sorted(self.gate_arity)
+                    if self.gate_arity[g] <= number_of_qubits
+                ]
+            )
+            gates.append(gate)
+            qubit_order.append(
+                self.rng.sample(range(number_of_qubits), self.gate_arity[gate])
+            )
+
+
+def _simulate(send: Transport, classroom: Classroom) -> int:
+    return send("POST", "/api/simulate", classroom.attempt())[0]
+
+
+def _check(send: Transport, classroom: Classroom) -> int:
+    return send("POST", "/api/simulate", {**classroom.attempt(), "mode": "check"})[0]
+
+
+def _batch(send: Transport, classroom: Classroom) -> int:
+    level = classroom.attempt()["target_unitary"]
+    items = [classroom.attempt(level) for _ in range(BATCH_SIZE)]
+    return send("POST", "/api/simulate/batch", {"items": items})[0]
+
+
+def _jobs(send: Transport, classroom: Classroom) -> int:
+    status, body = send("POST", "/api/simulate/jobs", classroom.attempt())
+    deadline = time.perf_counter() + JOB_TIMEOUT
+
+    # 202: poll until the worker pool finishes the job
+    while status == 202 and time.perf_counter() < deadline:
+        time.sleep(JOB_POLL_INTERVAL)
+        poll_status, job = send("GET", f"/api/simulate/jobs/{body['job_id']}", None)
+        if poll_status != 200:
+            return poll_status
+        if job["status"] == "done":
+            return 200
+        if job["status"] == "failed":
+            return 500
+
+    return status
+
+
+def _health(send: Transport, classroom: Classroom) -> int:
+    return send("GET", "/api/health", None)[0]
+
+
+ENDPOINTS: dict[str, Callable[[Transport, Classroom], int]] = {
+    "simulate": _simulate,
+    "check": _check,
+    "batch": _batch,
+    "jobs": _jobs,
+    "health": _health,
+}
+
+
+def http_transport(base_url: str, timeout: float) -> Transport:
+    """
+    Send requests to a served app with urllib (one connection per request).
+    """
+
+    def send(method: str, path: str, body: Optional[dict]) -> tuple[int, Any]:
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        request = urllib.request.Request(
+            base_url.rstrip("/") + path,
+            data=data,
+            method=method,
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return response.status, json.loads(response.read() or b"null")
+        except urllib.error.HTTPError as e:
+            return e.code, None
+
+    return send
+
+
+def in_process_transport() -> Transport:
+    """
+    Call the app through one Flask test client per thread.
+    """
+    from app.main import app
+
+    clients = threading.local()
+
+    def send(method: str, path: str, body: Optional[dict]) -> tuple[int, Any]:
+        if not hasattr(clients, "client"):
+            clients.client = app.test_client()
+        response = clients.client.open(path, method=method, json=body)
+        return response.status_code, response.get_json(silent=True)
+
+    return send
+
+
+def run(args: argparse.Namespace) -> dict:
+    from app.config.target_library import TARGET_LIBRARY
+    from app.settings import Config
+
+    if args.url:
+        send = http_transport(args.url, args.timeout)
+    else:
+        logging.disable(logging.CRITICAL)
+        send = in_process_transport()
+        if args.no_cache:
+            from app.services.prefix_cache import PREFIX_CACHE
+
+            Config.RESULT_CACHE_ENABLED = False
+            PREFIX_CACHE.configure(0)
+
+    levels = args.levels.split(",") if args.levels else list(TARGET_LIBRARY)
+    unknown = sorted(set(levels) - set(TARGET_LIBRARY))
+    if unknown:
+        raise SystemExit(f"Unknown levels {unknown}; expected {sorted(TARGET_LIBRARY)}")
+
+    classroom = Classroom(levels, args.correct_ratio, args.seed)
+    rng = random.Random(args.seed)
+    names, weights = zip(*args.mix.items())
+
+    latencies: dict[str, list[float]] = defaultdict(list)
+    statuses: dict[str, Counter] = defaultdict(Counter)
+    record_lock = threading.Lock()
+
+    def request(endpoint: str, due: float) -> None:
+        try:
+            status = ENDPOINTS[endpoint](send, classroom)
+        except Exception as e:
+            status = type(e).__name__
+        elapsed = time.perf_counter() - due
+        with record_lock:
+            latencies[endpoint].append(elapsed)
+            statuses[endpoint][str(status)] += 1
+
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        for kind, amount, seconds in args.phase:
+            phase_start = time.perf_counter()
+
+            if kind == "burst":
+                for _ in range(int(amount)):
+                    endpoint = rng.choices(names, weights)[0]
+                    pool.submit(request, endpoint, phase_start)
+
+            elif kind == "steady":
+                for i in range(int(amount * seconds)):
+                    due = phase_start + i / amount
+                    time.sleep(max(0.0, due - time.perf_counter()))
+                    pool.submit(request, rng.choices(names, weights)[0], due)
+
+            # Let each phase run its course before the next one starts
+            time.sleep(max(0.0, phase_start + seconds - time.perf_counter()))
+
+    duration = time.perf_counter() - start
+
+    endpoints = {}
+    for endpoint in sorted(latencies):
+        values = sorted(latencies[endpoint])
+        errors = sum(
+            count
+            for status, count in statuses[endpoint].items()
+            if not status.startswith("2")
+        )
+        endpoints[endpoint] = {
+            "requests": len(values),
+            "throughput_rps": len(values) / duration,
+            "error_rate": errors / len(values),
+            "statuses": dict(statuses[endpoint]),
+            "p50_s": _percentile(values, 0.50),
+            "p95_s": _percentile(values, 0.95),
+            "p99_s": _percentile(values, 0.99),
+            "max_s": values[-1],
+        }
+
+    meta = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "target": args.url or "in-process",
+        "phases": [":".join(f"{p:g}" for p in phase[1:]) for phase in args.phase],
+        "mix": args.mix,
+        "correct_ratio": args.correct_ratio,
+        "concurrency": args.concurrency,
+        "duration_s": duration,
+    }
+    if not args.url:
+        meta.update(
+            backend=Config.SIMULATION_BACKEND,
+            single_pass=Config.SINGLE_PASS_UNITARY,
+            result_cache=Config.RESULT_CACHE_ENABLED,
+        )
+
+    return {"meta": meta, "endpoints": endpoints}
+
+
+def report(results: dict) -> None:
+    meta = results["meta"]
+    print(f"{meta['target']}: {meta['duration_s']:.2f} s")
+    print(
+        f"{'endpoint':<10} {'requests':>8} {'req/s':>8} {'errors':>7} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}  statuses"
+    )
+    for endpoint, stats in results["endpoints"].items():
+        print(
+            f"{endpoint:<10} {stats['requests']:>8} {stats['throughput_rps']:>8.2f} "
+            f"{stats['error_rate']:>7.1%} {stats['p50_s'] * 1e3:>9.1f} "
+            f"{stats['p95_s'] * 1e3:>9.1f} {stats['p99_s'] * 1e3:>9.1f} "
+            f"{stats['max_s'] * 1e3:>9.1f}  {stats['statuses']}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", help="served app to drive (default: in-process)")
+    parser.add_argument(
+        "--phase",
+        type=_parse_phase,
+        action="append",
+        help=f"traffic phase, repeatable (default: {' '.join(DEFAULT_PHASES)})",
+    )
+    parser.add_argument("--mix", type=_parse_mix, default=_parse_mix(DEFAULT_MIX))
+    parser.add_argument(
+        "--correct-ratio",
+        type=float,
+        default=0.3,
+        help="share of submissions that are the level's correct circuit",
+    )
+    parser.add_argument("--levels", help="comma-separated targets (default: all)")
+    parser.add_argument(
+        "--concurrency", type=int, default=32, help="requests in flight at most"
+    )
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="disable the result and prefix caches (in-process only)",
+    )
+    parser.add_argument("--output", help="also write the results as JSON here")
+    args = parser.parse_args()
+    args.phase = args.phase or [_parse_phase(p) for p in DEFAULT_PHASES]
+
+    results = run(args)
+    report(results)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
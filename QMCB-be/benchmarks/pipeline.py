@@ -0,0 +1,274 @@
+"""
+Benchmark suite for the simulation pipeline, with a regression check.
+
+Times, for a sweep of qubit counts, gate counts, validate-target on/off and
+every TARGET_LIBRARY entry:
+    construct       CircuitBuilder.construct_unitary_circuit (one basis input)
+    wavefunction    CircuitSimulator.simulate_and_update (one basis input)
+    controller      simulate_unitaries
+    api             POST /api/simulate through the Flask test client
+                    (result and prefix caches disabled, so every call
+                    simulates)
+
+Circuits are random but seeded by their shape, so the same sweep always
+times the same circuits. Backend, single-pass mode and decimals come from
+the usual environment variables (see app/settings.py) and are recorded with
+the results.
+
+Usage (from QMCB-be):
+    PYTHONPATH=. python benchmarks/pipeline.py run --output current.json \\
+        [--qubits 1-12] [--gates 10,50] [--repeats 3]
+    PYTHONPATH=. python benchmarks/pipeline.py compare baseline.json \\
+        current.json [--threshold 0.25] [--min-delta 0.002]
+
+compare exits with status 1 when any benchmark's median got slower than
+the baseline by more than --threshold (a fraction) and by more than
+--min-delta seconds, the noise floor for very fast cases.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+
+def _parse_range(value: str) -> list[int]:
+    """
+    "1-4,8" -> [1, 2, 3, 4, 8]
+    """
+    numbers: list[int] = []
+    for part in value.split(","):
+        low, _, high = part.partition("-")
+        numbers.extend(range(int(low), int(high or low) + 1))
+    return numbers
+
+
+def _random_circuit(
+    number_of_qubits: int, gate_count: int
+) -> tuple[list[str], list[list[int]]]:
+    """
+    A reproducible random circuit of a given shape.
+    """
+    from app.config.gates import GATE_ARITY
+
+    rng = random.Random(f"{number_of_qubits}-{gate_count}")
+    names = [g for g in sorted(GATE_ARITY) if GATE_ARITY[g] <= number_of_qubits]
+    gates, qubit_order = [], []
+
+    for _ in range(gate_count):
+        gate = rng.choice(names)
+        gates.append(gate)
+        qubit_order.append(rng.sample(range(number_of_qubits), GATE_ARITY[gate]))
+
+    return gates, qubit_order
+
+
+def _time(func: Callable[[], Any], repeats: int, max_time: float) -> dict:
+    """
+    Time func after one warm-up call (lazy imports, compiled targets). Cases
+    whose warm-up takes longer than max_time are timed once.
+    """
+    start = time.perf_counter()
+    func()
+    if time.perf_counter() - start > max_time:
+        repeats = 1
+
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+
+    return {
+        "min_s": min(samples),
+        "median_s": statistics.median(samples),
+        "repeats": repeats,
+    }
+
+
+def run(args: argparse.Namespace) -> None:
+    logging.disable(logging.CRITICAL)
+
+    from app.config.target_library import TARGET_LIBRARY
+    from app.controllers.simulate import simulate_unitaries
+    from app.dto.truth_table import TruthTableDTO
+    from app.dto.unitary import UnitaryDTO
+    from app.main import app
+    from app.services.circuit_builder import CircuitBuilder
+    from app.services.prefix_cache import PREFIX_CACHE
+    from app.services.simulator import CircuitSimulator
+    from app.settings import Config
+    from app.utils.constants import TargetLibraryField
+    from app.utils.helpers import basis_state, initialize_qubit_sequence
+
+    # Every call must simulate, not hit the result or prefix caches or
+    # admission limits
+    Config.RESULT_CACHE_ENABLED = False
+    PREFIX_CACHE.configure(0)
+    Config.MAX_SIMULATION_COST = float("inf")
+    Config.MAX_SIMULATION_MEMORY_MB = sys.maxsize
+    client = app.test_client()
+
+    results: list[dict] = []
+
+    def record(benchmark: str, params: dict, func: Callable[[], Any]) -> None:
+        key = benchmark + "".join(f"|{k}={v}" for k, v in params.items())
+        timing = _time(func, args.repeats, args.max_time)
+        results.append({"key": key, "benchmark": benchmark, **params, **timing})
+        print(f"{key:<70} {timing['median_s'] * 1e3:10.3f} ms", flush=True)
+
+    for number_of_qubits in _parse_range(args.qubits):
+        qubits = initialize_qubit_sequence(number_of_qubits)
+        state = basis_state(0, number_of_qubits)
+
+        for gate_count in _parse_range(args.gates):
+            gates, qubit_order = _random_circuit(number_of_qubits, gate_count)
+            shape = {"qubits": number_of_qubits, "gates": gate_count}
+
+            record(
+                "construct",
+                shape,
+                lambda: CircuitBuilder.construct_unitary_circuit(
+                    state, gates, qubit_order, qubits
+                ),
+            )
+            circuit = CircuitBuilder.construct_unitary_circuit(
+                state, gates, qubit_order, qubits
+            )
+            record(
+                "wavefunction",
+                shape,
+                lambda: CircuitSimulator.simulate_and_update(
+                    circuit,
+                    qubits,
+                    state,
+                    TruthTableDTO([], []),
+                    decimals=Config.TRUTH_TABLE_DECIMALS,
+                ),
+            )
+
+            for target, level_def in TARGET_LIBRARY.items():
+                # Targets cannot be simulated on fewer qubits than they act on
+                if number_of_qubits < level_def[TargetLibraryField.NUM_QUBITS.value]:
+                    continue
+
+                for validate in (True, False):
+                    params = {"target": target, **shape, "validate": validate}
+                    trial_dto = UnitaryDTO(number_of_qubits, gates, qubit_order)
+                    body = {
+                        "target_unitary": target,
+                        "number_of_qubits": number_of_qubits,
+                        "gates": gates,
+                        "qubit_order": qubit_order,
+                    }
+
+                    record(
+                        "controller",
+                        params,
+                        lambda: simulate_unitaries(
+                            trial_dto,
+                            target,
+                            validate,
+                            Config.SINGLE_PASS_UNITARY,
+                            decimals=Config.TRUTH_TABLE_DECIMALS,
+                            backend=Config.SIMULATION_BACKEND,
+                            use_target_cache=Config.CACHE_TARGET_UNITARIES,
+                        ),
+                    )
+
+                    Config.VALIDATE_TARGET_CIRCUITS = validate
+                    response = client.post("/api/simulate", json=body)
+                    if response.status_code != 200:
+                        raise RuntimeError(f"{params}: {response.get_json()}")
+                    record(
+                        "api", params, lambda: client.post("/api/simulate", json=body)
+                    )
+
+    meta = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "backend": Config.SIMULATION_BACKEND,
+        "single_pass": Config.SINGLE_PASS_UNITARY,
+        "optimize": Config.OPTIMIZE_CIRCUITS,
+        "decimals": Config.TRUTH_TABLE_DECIMALS,
+        "repeats": args.repeats,
+    }
+    with open(args.output, "w") as output:
+        json.dump({"meta": meta, "results": results}, output, indent=2)
+
+    print(f"Wrote {len(results)} results to {args.output}")
+
+
+def compare(args: argparse.Namespace) -> int:
+    with open(args.baseline) as baseline_file, open(args.current) as current_file:
+        baseline = {r["key"]: r for r in json.load(baseline_file)["results"]}
+        current = {r["key"]: r for r in json.load(current_file)["results"]}
+
+    stat = f"{args.stat}_s"
+    regressions = []
+
+    for key in sorted(baseline.keys() & current.keys()):
+        before, after = baseline[key][stat], current[key][stat]
+        ratio = after / before if before else float("inf")
+        regressed = ratio > 1 + args.threshold and after - before > args.min_delta
+        if regressed:
+            regressions.append(key)
+        if regressed or args.verbose:
+            print(
+                f"{'REGRESSION' if regressed else 'ok':<10} {key:<70} "
+                f"{before * 1e3:10.3f} -> {after * 1e3:10.3f} ms  ({ratio:.2f}x)"
+            )
+
+    for key in sorted(baseline.keys() - current.keys()):
+        print(f"{'missing':<10} {key}")
+
+    print(
+        f"{len(baseline.keys() & current.keys())} compared, "
+        f"{len(regressions)} regressions (threshold {args.threshold:.0%}, "
+        f"min delta {args.min_delta * 1e3:g} ms, {args.stat})"
+    )
+
+    return 1 if regressions else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the sweep and write JSON")
+    run_parser.add_argument("--output", default="benchmark.json")
+    run_parser.add_argument("--qubits", default="1-12")
+    run_parser.add_argument("--gates", default="10,50")
+    run_parser.add_argument("--repeats", type=int, default=3)
+    run_parser.add_argument(
+        "--max-time",
+        type=float,
+        default=1.0,
+        help="time cases slower than this (seconds) only once",
+    )
+
+    compare_parser = commands.add_parser("compare", help="check for regressions")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.25)
+    compare_parser.add_argument("--min-delta", type=float, default=0.002)
+    compare_parser.add_argument("--stat", choices=("median", "min"), default="median")
+    compare_parser.add_argument("--verbose", action="store_true")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        run(args)
+    else:
+        sys.exit(compare(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 import cirq
 from app.utils.constants import Gate
-from app.repositories.construct_circuit import ConstructCircuitRepository
-from app.repositories.simulate_circuit import SimulateCircuitRepository
-from app.repositories.quantum_gates import QuantumGateRepository
+from app.config.gates import CirqGateMapper
+from app.services.circuit_builder import CircuitBuilder
+from app.services.simulator import CircuitSimulator
 from app.utils.helpers import initialize_qubit_sequence
 from app.dto.unitary import UnitaryDTO
 
@@ -23,56 +23,54 @@ state00 = [1, 0]
 qubits = initialize_qubit_sequence(trial_dto.number_of_qubits)
 
 # Run basis test
-basis_test_circuit = ConstructCircuitRepository.prepare_basis_state(state00, qubits)
-measure = ConstructCircuitRepository.measure_qubits(qubits)
+basis_test_circuit = CircuitBuilder.prepare_basis_state(state00, qubits)
+measure = CircuitBuilder.measure_qubits(qubits)
 basis_test_circuit.append(measure)
 
-basis_results = SimulateCircuitRepository.run_circuit(
-    trial_dto.number_of_qubits, basis_test_circuit, 1
+basis_results = CircuitSimulator.run_and_measure(
+    trial_dto.number_of_qubits, basis_test_circuit
 )
 print(f"Basis Results: {basis_results}")
 
 # First CNOT
-basis_circuit = ConstructCircuitRepository.prepare_basis_state(state00, qubits)
+basis_circuit = CircuitBuilder.prepare_basis_state(state00, qubits)
 print(f"For qubit order: {trial_dto.qubit_order[0]}")
-operations = [
-    QuantumGateRepository.apply(json_gates[0], trial_dto.qubit_order[0], *qubits)
-]
+operations = [CirqGateMapper.apply(json_gates[0], trial_dto.qubit_order[0], *qubits)]
 basis_circuit.append(cirq.Circuit(operations))
 basis_circuit.append(measure)
 
-base_results = SimulateCircuitRepository.run_circuit(
-    trial_dto.number_of_qubits, basis_circuit, 1
+base_results = CircuitSimulator.run_and_measure(
+    trial_dto.number_of_qubits, basis_circuit
 )
 print(f"First CNOT Results: {base_results}")
 
 # Second CNOT
-basis_circuit = ConstructCircuitRepository.prepare_basis_state(state00, qubits)
+basis_circuit = CircuitBuilder.prepare_basis_state(state00, qubits)
 print(f"For qubit order: {trial_dto.qubit_order[1]}")
 operations = [
-    QuantumGateRepository.apply(json_gates[0], trial_dto.qubit_order[0], *qubits),
-    QuantumGateRepository.apply(json_gates[1], trial_dto.qubit_order[1], *qubits),
+    CirqGateMapper.apply(json_gates[0], trial_dto.qubit_order[0], *qubits),
+    CirqGateMapper.apply(json_gates[1], trial_dto.qubit_order[1], *qubits),
 ]
 basis_circuit.append(cirq.Circuit(operations))
 basis_circuit.append(measure)
 
-base_results = SimulateCircuitRepository.run_circuit(
-    trial_dto.number_of_qubits, basis_circuit, 1
+base_results = CircuitSimulator.run_and_measure(
+    trial_dto.number_of_qubits, basis_circuit
 )
 print(f"Second CNOT Results: {base_results}")
 
 # Third CNOT
-basis_circuit = ConstructCircuitRepository.prepare_basis_state(state00, qubits)
+basis_circuit = CircuitBuilder.prepare_basis_state(state00, qubits)
 print(f"For qubit order: {trial_dto.qubit_order[2]}")
 operations = [
-    QuantumGateRepository.apply(json_gates[0], trial_dto.qubit_order[0], *qubits),
-    QuantumGateRepository.apply(json_gates[1], trial_dto.qubit_order[1], *qubits),
-    QuantumGateRepository.apply(json_gates[2], trial_dto.qubit_order[2], *qubits),
+    CirqGateMapper.apply(json_gates[0], trial_dto.qubit_order[0], *qubits),
+    CirqGateMapper.apply(json_gates[1], trial_dto.qubit_order[1], *qubits),
+    CirqGateMapper.apply(json_gates[2], trial_dto.qubit_order[2], *qubits),
 ]
 basis_circuit.append(cirq.Circuit(operations))
 basis_circuit.append(measure)
 
-base_results = SimulateCircuitRepository.run_circuit(
-    trial_dto.number_of_qubits, basis_circuit, 1
+base_results = CircuitSimulator.run_and_measure(
+    trial_dto.number_of_qubits, basis_circuit
 )
 print(f"Third CNOT Results: {base_results}")
@@ -20,4 +20,7 @@ print(f"Trial Qubit Order: {trial_dto.qubit_order}")
 print(f"Target Qubit Order: {target_dto.qubit_order}")
 
 # Run simulation
-trial_truth_table, target_truth_table = simulate_unitaries(trial_dto, target_dto)
+response, status = simulate_unitaries(trial_dto, json_gate)
+print(f"Status: {status}")
+print(f"Trial Truth Table: {response['trial_truth_table']}")
+print(f"Target Truth Table: {response['target_truth_table']}")